@@ -8,19 +8,52 @@ rsync the cache directory to targets.
 from __future__ import annotations
 
 import logging
+import os
+import tempfile
+from functools import partial
+from string import Template
 
 from sparkrun.config import resolve_cache_dir
-from sparkrun.models.download import download_model, model_cache_path
+from sparkrun.models.download import (
+    download_model,
+    download_models,
+    is_model_cached,
+    model_cache_path,
+    snapshot_fingerprint,
+)
 from sparkrun.orchestration.primitives import map_transfer_failures
 from sparkrun.orchestration.ssh import (
+    DEFAULT_MAX_CONCURRENCY,
     build_ssh_opts_string,
+    fast_rsync_options,
     run_remote_scripts_parallel,
     run_rsync_parallel,
+    run_tar_pipe_parallel,
+    ssh_pool,
 )
-from sparkrun.scripts import read_script
+from sparkrun.scripts import read_script_template
 
 logger = logging.getLogger(__name__)
 
+# Pre-compiled remote script bodies — parsed once at import instead of on
+# every render.  Rendered with safe_substitute so bash $VARIABLES (and
+# $(...) constructs) pass through untouched.
+_PERM_FIX_SCRIPT = Template(
+    'set -euo pipefail\n'
+    'CACHE_DIR="${cache_dir}"\n'
+    '[ -d "$CACHE_DIR" ] || exit 0\n'
+    'OWNER=$(stat -c "%U" "$CACHE_DIR" 2>/dev/null || echo "")\n'
+    'ME=$(id -un)\n'
+    '[ "$OWNER" = "$ME" ] && exit 0\n'
+    'sudo -n /usr/bin/chown -R "$ME" "$CACHE_DIR" 2>/dev/null\n'
+)
+
+_DIGEST_PROBE_SCRIPT = Template(
+    'MODEL_PATH="${model_path}"\n'
+    '[ -d "$MODEL_PATH" ] || { echo "absent"; exit 0; }\n'
+    "find \"$MODEL_PATH\" -type f -printf '%s %P\\n' | LC_ALL=C sort | sha256sum\n"
+)
+
 
 def _model_cache_path(model_id: str, cache_dir: str) -> str:
     """Compute the HF cache path for a model.
@@ -43,23 +76,17 @@ def _try_fix_remote_permissions(
 
     Docker containers create root-owned files in the cache directory.
     This tries non-interactive ``sudo -n chown`` on each host so the
-    SSH user can rsync into the directory.  Failures are non-fatal —
-    a warning is logged with a hint about ``--save-sudo``.
+    SSH user can rsync into the directory.  The fan-out is bounded to
+    stay under sshd's ``MaxStartups`` on large clusters.  Failures are
+    non-fatal — a warning is logged with a hint about ``--save-sudo``.
     """
-    script = (
-        'set -euo pipefail\n'
-        'CACHE_DIR="{cache_dir}"\n'
-        '[ -d "$CACHE_DIR" ] || exit 0\n'
-        'OWNER=$(stat -c "%U" "$CACHE_DIR" 2>/dev/null || echo "")\n'
-        'ME=$(id -un)\n'
-        '[ "$OWNER" = "$ME" ] && exit 0\n'
-        'sudo -n /usr/bin/chown -R "$ME" "$CACHE_DIR" 2>/dev/null\n'
-    ).format(cache_dir=cache_dir)
+    script = _PERM_FIX_SCRIPT.safe_substitute(cache_dir=cache_dir)
 
     results = run_remote_scripts_parallel(
         hosts, script,
         ssh_user=ssh_user, ssh_key=ssh_key, ssh_options=ssh_options,
         timeout=30, dry_run=dry_run,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
     )
 
     failed = [r.host for r in results if not r.success]
@@ -73,6 +100,142 @@ def _try_fix_remote_permissions(
         )
 
 
+def _probe_synced_hosts(
+    model_path: str,
+    hosts: list[str],
+    ssh_user: str | None = None,
+    ssh_key: str | None = None,
+    ssh_options: list[str] | None = None,
+    dry_run: bool = False,
+) -> set[str]:
+    """Return the subset of *hosts* whose model cache already matches local.
+
+    Issues one cheap SSH probe per host (in parallel) that digests the
+    remote cache directory's file sizes and names, and compares against
+    :func:`snapshot_fingerprint` of the local copy.  Matching hosts can
+    skip the transfer entirely — even incremental rsync would still stat
+    every file over SSH.  Probe failures are treated as "not synced".
+    """
+    if not hosts or dry_run:
+        return set()
+
+    local_digest = snapshot_fingerprint(model_path)
+
+    script = _DIGEST_PROBE_SCRIPT.safe_substitute(model_path=model_path)
+
+    results = run_remote_scripts_parallel(
+        hosts, script,
+        ssh_user=ssh_user, ssh_key=ssh_key, ssh_options=ssh_options,
+        timeout=60, dry_run=dry_run,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+    )
+
+    synced = {
+        r.host for r in results
+        if r.success and r.last_line.split()[:1] == [local_digest]
+    }
+    return synced
+
+
+# Writer-side markers of in-flight downloads — interim streaming pushes
+# must never ship partially written blobs.
+_STREAM_EXCLUDES = ["--exclude=*.incomplete", "--exclude=*.tmp", "--exclude=*.lock"]
+
+
+def _completed_snapshot_files(model_path: str) -> set[tuple[str, int]]:
+    """Snapshot the fully written files under a model cache directory.
+
+    Returns ``(relpath, size)`` pairs for every file without an
+    in-flight marker suffix — the HF hub writes blobs as
+    ``<hash>.incomplete`` and renames them only once complete, so a
+    grown result set means new shards are ready to stream.
+    """
+    done: set[tuple[str, int]] = set()
+    for root, _dirs, files in os.walk(model_path):
+        for name in files:
+            if name.endswith((".incomplete", ".tmp", ".lock")):
+                continue
+            path = os.path.join(root, name)
+            try:
+                st = os.lstat(path)
+            except OSError:
+                continue
+            done.add((os.path.relpath(path, model_path), st.st_size))
+    return done
+
+
+def _download_and_stream(
+    model_id: str,
+    cache: str,
+    hosts: list[str],
+    xfer: list[str],
+    token: str | None = None,
+    revision: str | None = None,
+    ssh_user: str | None = None,
+    ssh_key: str | None = None,
+    ssh_options: list[str] | None = None,
+    dry_run: bool = False,
+    poll_interval: float = 2.0,
+) -> int:
+    """Download a model locally while streaming finished shards to hosts.
+
+    For large multi-shard models the first shard lands on disk within
+    seconds while later shards take minutes — waiting for the full
+    download before distributing leaves the cluster LAN idle.  This
+    runs :func:`download_model` in a background thread and, every
+    *poll_interval* seconds, pushes newly completed files (in-flight
+    ``.incomplete`` blobs excluded) to every transfer host with an
+    incremental rsync, overlapping WAN download bandwidth with LAN
+    distribution bandwidth.
+
+    The streaming pushes are best-effort prefill: failures are ignored,
+    and the caller's normal probe/transfer pass afterwards remains
+    authoritative (hosts that finished during streaming are skipped by
+    the digest probe).  When the model is already cached — or there is
+    nothing to stream to — this degrades to a plain download call.
+
+    Returns:
+        Exit code from :func:`download_model` (0 = success).
+    """
+    if dry_run or not xfer or is_model_cached(model_id, cache, revision=revision):
+        return download_model(model_id, cache_dir=cache, token=token,
+                              revision=revision, dry_run=dry_run)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    model_path = _model_cache_path(model_id, cache)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(
+            download_model, model_id,
+            cache_dir=cache, token=token, revision=revision, dry_run=dry_run,
+        )
+        seen: set[tuple[str, int]] = set()
+        perms_fixed = False
+        while True:
+            try:
+                return future.result(timeout=poll_interval)
+            except TimeoutError:
+                pass
+            completed = _completed_snapshot_files(model_path)
+            if completed - seen:
+                seen = completed
+                if not perms_fixed:
+                    # First bytes are about to land on the workers — make
+                    # sure the remote cache is writable before pushing
+                    _try_fix_remote_permissions(
+                        cache, hosts,
+                        ssh_user=ssh_user, ssh_key=ssh_key, ssh_options=ssh_options,
+                    )
+                    perms_fixed = True
+                logger.info("Streaming %d completed file(s) of '%s' to %d host(s) "
+                            "while download continues", len(completed), model_id, len(xfer))
+                run_rsync_parallel(
+                    model_path, xfer, model_path,
+                    ssh_user=ssh_user, ssh_key=ssh_key, ssh_options=ssh_options,
+                    rsync_options=fast_rsync_options() + _STREAM_EXCLUDES,
+                )
+
+
 def distribute_model_from_local(
     model_id: str,
     hosts: list[str],
@@ -86,12 +249,16 @@ def distribute_model_from_local(
     dry_run: bool = False,
     transfer_hosts: list[str] | None = None,
 ) -> list[str]:
-    """Download a model locally then rsync it to all hosts.
+    """Download a model locally then stream it to all hosts.
 
-    1. Download the model to the local HF cache via :func:`download_model`.
-    2. For each host in parallel, rsync the model cache directory.
-       Because rsync is incremental, hosts that already have the model
-       will complete almost instantly.
+    1. Download the model to the local HF cache via :func:`download_model`,
+       streaming already-finished shards to the hosts while later shards
+       are still downloading (see :func:`_download_and_stream`).
+    2. Probe each host's cache digest in parallel and drop hosts that
+       are already in sync with the local snapshot.
+    3. For each remaining host in parallel, stream the model cache
+       directory over a tar pipe (single stream, no per-file overhead).
+       Hosts where the tar pipe fails fall back to incremental rsync.
 
     Args:
         model_id: HuggingFace model identifier.
@@ -112,39 +279,87 @@ def distribute_model_from_local(
 
     Returns:
         List of hostnames (from *hosts*) where distribution failed
-        (empty = full success).
+        (empty = full success).  May alias *hosts* itself on the
+        download-failure path — callers must treat it as read-only.
     """
     cache = resolve_cache_dir(cache_dir)
     logger.info("Distributing model '%s' from local to %d host(s)", model_id, len(hosts))
 
-    # Step 1: download model locally
-    rc = download_model(model_id, cache_dir=cache, token=token, revision=revision, dry_run=dry_run)
+    xfer = transfer_hosts or hosts
+
+    # Step 1: download model locally, prefilling the hosts with completed
+    # shards while the download is still running
+    rc = _download_and_stream(
+        model_id, cache, hosts, xfer,
+        token=token, revision=revision,
+        ssh_user=ssh_user, ssh_key=ssh_key, ssh_options=ssh_options,
+        dry_run=dry_run,
+    )
     if rc != 0:
         logger.error("Failed to download model '%s' locally — aborting distribution", model_id)
-        return list(hosts)
+        return hosts
 
     if not hosts:
         return []
 
-    xfer = transfer_hosts or hosts
+    # Pool SSH connections across the permission-fix and transfer phases
+    # so each host pays the handshake once.  Pool over both the management
+    # hosts (permission fix) and the transfer IPs (tar/rsync) — they may
+    # differ when IB routing is in use.
+    pool_hosts = list(dict.fromkeys(hosts + xfer))
+    model_path = _model_cache_path(model_id, cache)
+    with ssh_pool(pool_hosts, ssh_user=ssh_user, ssh_key=ssh_key,
+                  ssh_options=ssh_options, dry_run=dry_run):
+        # Step 2: skip hosts whose cache already matches the local snapshot
+        # (one digest round trip per host, also warms the pooled masters)
+        synced = _probe_synced_hosts(
+            model_path, xfer,
+            ssh_user=ssh_user, ssh_key=ssh_key, ssh_options=ssh_options,
+            dry_run=dry_run,
+        )
+        if synced:
+            logger.info("Model '%s' already in sync on %d/%d host(s)",
+                        model_id, len(synced), len(xfer))
+        pending = [(h, x) for h, x in zip(hosts, xfer) if x not in synced]
+        if not pending:
+            logger.info("Model '%s' already distributed to all %d host(s)",
+                        model_id, len(hosts))
+            return []
+        pending_hosts = [h for h, _ in pending]
+        pending_xfer = [x for _, x in pending]
+
+        # Step 3: best-effort fix of remote cache ownership before transfer
+        _try_fix_remote_permissions(
+            cache, pending_hosts,
+            ssh_user=ssh_user, ssh_key=ssh_key, ssh_options=ssh_options,
+            dry_run=dry_run,
+        )
 
-    # Step 2: best-effort fix of remote cache ownership before rsync
-    _try_fix_remote_permissions(
-        cache, hosts,
-        ssh_user=ssh_user, ssh_key=ssh_key, ssh_options=ssh_options,
-        dry_run=dry_run,
-    )
+        # Step 4: stream the model cache to all hosts in parallel via tar pipes.
+        # One continuous stream per host avoids rsync's per-file stat/delta
+        # exchange (HF snapshots are thousands of hash-named blobs), and the
+        # multiplexed SSH connection warmed by the earlier phases is
+        # reused.  Hosts where the tar pipe fails (e.g. extraction over
+        # root-owned files) fall back to incremental rsync.
+        results = run_tar_pipe_parallel(
+            model_path, pending_xfer, model_path,
+            ssh_user=ssh_user, ssh_key=ssh_key, ssh_options=ssh_options,
+            timeout=timeout, dry_run=dry_run,
+        )
 
-    # Step 3: rsync model cache to all hosts in parallel
-    model_path = _model_cache_path(model_id, cache)
-    results = run_rsync_parallel(
-        model_path, xfer, model_path,
-        ssh_user=ssh_user, ssh_key=ssh_key, ssh_options=ssh_options,
-        timeout=timeout, dry_run=dry_run,
-    )
+        retry_hosts = [r.host for r in results if not r.success]
+        if retry_hosts:
+            logger.info("Tar pipe failed on %d host(s) — retrying with rsync", len(retry_hosts))
+            retry_results = run_rsync_parallel(
+                model_path, retry_hosts, model_path,
+                ssh_user=ssh_user, ssh_key=ssh_key, ssh_options=ssh_options,
+                timeout=timeout, dry_run=dry_run,
+                rsync_options=fast_rsync_options(),
+            )
+            results = [r for r in results if r.success] + retry_results
 
     # Map transfer IPs back to management hosts for failure reporting
-    failed = map_transfer_failures(results, xfer, hosts)
+    failed = map_transfer_failures(results, pending_xfer, pending_hosts)
     if failed:
         logger.warning("Model distribution failed on hosts: %s", failed)
     else:
@@ -153,6 +368,111 @@ def distribute_model_from_local(
     return failed
 
 
+def distribute_models_from_local(
+    model_ids: list[str],
+    hosts: list[str],
+    cache_dir: str | None = None,
+    token: str | None = None,
+    revision: str | None = None,
+    ssh_user: str | None = None,
+    ssh_key: str | None = None,
+    ssh_options: list[str] | None = None,
+    timeout: int | None = None,
+    dry_run: bool = False,
+    transfer_hosts: list[str] | None = None,
+) -> list[str]:
+    """Download several models locally then rsync them to all hosts at once.
+
+    Batch variant of :func:`distribute_model_from_local` for multi-model
+    launches.  Instead of one transfer pass per model (each re-paying the
+    permission fix, SSH handshake, and rsync process spawn), all model
+    cache directories are bundled into a single ``--files-from`` rsync
+    per host rooted at ``{cache}/hub``.
+
+    Args:
+        model_ids: HuggingFace model identifiers (GGUF specs allowed).
+        hosts: Target hostnames or IPs (used for identification/reporting).
+        cache_dir: Override for the HuggingFace cache directory.
+        token: Optional HuggingFace API token for gated models.
+        revision: Optional revision applied to every model.
+        ssh_user: Optional SSH username.
+        ssh_key: Optional path to SSH private key.
+        ssh_options: Additional SSH options.
+        timeout: Per-host transfer timeout in seconds.
+        dry_run: If True, show what would be done without executing.
+        transfer_hosts: Optional IB/fast-network IPs for the data transfer
+            (same semantics as :func:`distribute_model_from_local`).
+
+    Returns:
+        List of hostnames (from *hosts*) where distribution failed
+        (empty = full success).  May alias *hosts* itself on the
+        download-failure path — callers must treat it as read-only.
+    """
+    if not model_ids:
+        return []
+
+    cache = resolve_cache_dir(cache_dir)
+    logger.info("Distributing %d model(s) from local to %d host(s)",
+                len(model_ids), len(hosts))
+
+    # Step 1: download every model locally, overlapping the per-model
+    # metadata round trips in a small thread pool
+    failed_models = download_models(model_ids, cache_dir=cache, token=token,
+                                    revision=revision, dry_run=dry_run)
+    if failed_models:
+        logger.error("Failed to download %d model(s) locally — aborting distribution",
+                     len(failed_models))
+        return hosts
+
+    if not hosts:
+        return []
+
+    xfer = transfer_hosts or hosts
+    hub_root = f"{cache}/hub"
+    # Paths relative to hub_root, NUL-separated for --from0
+    rel_dirs = sorted({
+        os.path.basename(model_cache_path(m, cache)) for m in model_ids
+    })
+
+    list_fd, list_path = tempfile.mkstemp(prefix="sparkrun-models-")
+    try:
+        with os.fdopen(list_fd, "w") as f:
+            f.write("\0".join(rel_dirs) + "\0")
+
+        pool_hosts = list(dict.fromkeys(hosts + xfer))
+        with ssh_pool(pool_hosts, ssh_user=ssh_user, ssh_key=ssh_key,
+                      ssh_options=ssh_options, dry_run=dry_run):
+            # Step 2: one best-effort permission fix covering all models
+            _try_fix_remote_permissions(
+                cache, hosts,
+                ssh_user=ssh_user, ssh_key=ssh_key, ssh_options=ssh_options,
+                dry_run=dry_run,
+            )
+
+            # Step 3: single rsync per host carrying every model subtree
+            results = run_rsync_parallel(
+                hub_root, xfer, hub_root,
+                ssh_user=ssh_user, ssh_key=ssh_key, ssh_options=ssh_options,
+                timeout=timeout, dry_run=dry_run,
+                files_from=list_path,
+                rsync_options=fast_rsync_options(),
+            )
+    finally:
+        try:
+            os.unlink(list_path)
+        except OSError:
+            pass
+
+    failed = map_transfer_failures(results, xfer, hosts)
+    if failed:
+        logger.warning("Model distribution failed on hosts: %s", failed)
+    else:
+        logger.info("All %d model(s) distributed to all %d host(s)",
+                    len(model_ids), len(hosts))
+
+    return failed
+
+
 def distribute_model_from_head(
     model_id: str,
     hosts: list[str],
@@ -167,7 +487,9 @@ def distribute_model_from_head(
 ) -> list[str]:
     """Download a model on the head node then distribute to remaining hosts.
 
-    1. Download on ``hosts[0]`` using the existing ``model_sync.sh``.
+    1. Download on ``hosts[0]`` using the existing ``model_sync.sh``,
+       while concurrently fixing cache ownership on the workers (the
+       download is WAN-bound on the head; worker SSH is a disjoint path).
     2. If there is only one host, done.
     3. Run ``model_distribute.sh`` on ``hosts[0]`` to rsync to ``hosts[1:]``.
 
@@ -199,17 +521,23 @@ def distribute_model_from_head(
                 model_id, head, len(hosts))
 
     # Build ensure script (download model on head)
-    from sparkrun.models.download import is_gguf_model, parse_gguf_model_spec
+    from sparkrun.models.download import (
+        DEFAULT_REMOTE_DOWNLOAD_WORKERS,
+        is_gguf_model,
+        parse_gguf_model_spec,
+    )
     revision_flag = "--revision %s " % revision if revision else ""
     if is_gguf_model(model_id):
         repo_id, quant = parse_gguf_model_spec(model_id)
-        ensure_script = read_script("model_sync_gguf.sh").format(
+        ensure_script = read_script_template("model_sync_gguf.sh").safe_substitute(
             repo_id=repo_id, quant=quant or "", cache=cache,
             revision_flag=revision_flag,
+            max_workers=DEFAULT_REMOTE_DOWNLOAD_WORKERS,
         )
     else:
-        ensure_script = read_script("model_sync.sh").format(
+        ensure_script = read_script_template("model_sync.sh").safe_substitute(
             model_id=model_id, cache=cache, revision_flag=revision_flag,
+            max_workers=DEFAULT_REMOTE_DOWNLOAD_WORKERS,
         )
 
     # Build distribute script (rsync from head to workers)
@@ -218,13 +546,27 @@ def distribute_model_from_head(
     ssh_opts = build_ssh_opts_string(
         ssh_user=ssh_user, ssh_key=ssh_key, ssh_options=ssh_options,
     )
-    dist_script = read_script("model_distribute.sh").format(
+    # Newline-delimited so the script never word-splits hostnames.  The
+    # rsync flags omit zstd compression — the script enables it itself
+    # after checking the head's rsync supports it.
+    dist_script = read_script_template("model_distribute.sh").safe_substitute(
         model_path=model_path,
-        targets=" ".join(targets),
+        targets="\n".join(targets),
         ssh_opts=ssh_opts,
         ssh_user=ssh_user or "",
+        rsync_flags=" ".join(fast_rsync_options(zstd=False)),
     )
 
+    # Fix worker cache ownership while the head download runs — the two
+    # phases touch disjoint machines, so they overlap cleanly.
+    pre_distribute = None
+    if len(hosts) > 1:
+        pre_distribute = partial(
+            _try_fix_remote_permissions, cache, hosts[1:],
+            ssh_user=ssh_user, ssh_key=ssh_key, ssh_options=ssh_options,
+            dry_run=dry_run,
+        )
+
     return _distribute_from_head(
         head=head, hosts=hosts,
         ensure_script=ensure_script,
@@ -232,4 +574,5 @@ def distribute_model_from_head(
         resource_label="Model '%s'" % model_id,
         ssh_user=ssh_user, ssh_key=ssh_key, ssh_options=ssh_options,
         timeout=timeout, dry_run=dry_run,
+        pre_distribute=pre_distribute,
     )
@@ -10,16 +10,32 @@ where the part after ``:`` selects which quantization files to download.
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import logging
+import os
+import re
+import shutil
+import stat
+import sys
 from pathlib import Path
 
-from sparkrun.config import resolve_cache_dir
+from sparkrun.config import DEFAULT_HF_CACHE_DIR, resolve_cache_dir
 
 logger = logging.getLogger(__name__)
 
 # Container-side mount point for the HuggingFace cache (set by build_volumes)
 CONTAINER_HF_CACHE = "/root/.cache/huggingface"
 
+# Shard-fetch concurrency for downloads running on remote hosts, whose
+# CPU count we don't know (local downloads use _download_workers instead)
+DEFAULT_REMOTE_DOWNLOAD_WORKERS = 8
+
+# Files worth fetching alongside a GGUF quant variant: multimodal
+# projector weights and tokenizer/config metadata.  Matched lowercase.
+_GGUF_COMPANION_PATTERNS = ("*mmproj*", "tokenizer*", "*.json")
+
 
 def _hub_cache(cache_dir: str | None = None) -> str:
     """Return the HuggingFace Hub cache directory.
@@ -42,11 +58,14 @@ def _hub_cache(cache_dir: str | None = None) -> str:
 # GGUF model spec helpers
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1024)
 def parse_gguf_model_spec(model_id: str) -> tuple[str, str | None]:
     """Parse a GGUF model specification into (repo_id, quant_variant).
 
     The colon syntax ``repo:quant`` selects a specific quantization
-    variant from a GGUF repository on HuggingFace.
+    variant from a GGUF repository on HuggingFace.  Memoized — the
+    same spec is parsed several times across the resolve/download/
+    distribute call graph within one CLI invocation.
 
     Examples::
 
@@ -57,10 +76,13 @@ def parse_gguf_model_spec(model_id: str) -> tuple[str, str | None]:
         >>> parse_gguf_model_spec("meta-llama/Llama-3-8B")
         ('meta-llama/Llama-3-8B', None)
     """
-    if ":" in model_id:
-        repo_id, quant = model_id.rsplit(":", 1)
-        return repo_id, quant
-    return model_id, None
+    repo_id, sep, quant = model_id.rpartition(":")
+    return (repo_id, quant) if sep else (model_id, None)
+
+
+# Matches a GGUF repo name or the colon of a quant spec in one scan,
+# without allocating a lowercased copy of the id
+_GGUF_RE = re.compile(r"gguf|:", re.IGNORECASE)
 
 
 def is_gguf_model(model_id: str) -> bool:
@@ -69,10 +91,68 @@ def is_gguf_model(model_id: str) -> bool:
     Returns True when the repo name contains ``GGUF`` (case-insensitive)
     or when a quant variant is specified via colon syntax (``repo:quant``).
     """
-    repo_id, quant = parse_gguf_model_spec(model_id)
-    if quant is not None:
-        return True
-    return "gguf" in repo_id.lower()
+    return _GGUF_RE.search(model_id) is not None
+
+
+def _scan_gguf_files(root: str) -> list[tuple[str, str]]:
+    """Collect ``(name, path)`` pairs of every ``.gguf`` under *root*.
+
+    Single ``os.scandir`` walk — handles both flat layouts (files in
+    the snapshot root) and subdirectory layouts (files inside
+    quant-named folders like ``Q6_K/``).  Symlinked directories are
+    not followed, matching ``Path.glob("**")`` semantics.
+    """
+    found: list[tuple[str, str]] = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".gguf"):
+                        found.append((entry.name, entry.path))
+        except OSError:
+            continue
+    return found
+
+
+# Scan results keyed by query, each paired with the change token of the
+# model cache directory at scan time (see _cache_change_token).  Entries
+# whose token no longer matches are rescanned, so a finished download —
+# even one made by another process — is picked up without explicit
+# invalidation.
+_SCAN_CACHE: dict[tuple, tuple[int, object]] = {}
+
+
+def _cache_change_token(model_cache: str) -> int:
+    """Cheap change token for a model cache directory.
+
+    Max ``st_mtime_ns`` across the directory itself, its ``refs``/
+    ``blobs``/``snapshots`` subdirectories, and the immediate snapshot
+    entries — every completed download creates or touches at least one
+    of these (blob files, snapshot symlinks, ref updates), so a stable
+    token means a cached scan result is still valid.  A handful of
+    stats instead of a full tree walk.
+    """
+    token = -1
+    for sub in ("", "refs", "blobs", "snapshots"):
+        path = os.path.join(model_cache, sub) if sub else model_cache
+        try:
+            token = max(token, os.stat(path).st_mtime_ns)
+        except OSError:
+            continue
+    try:
+        with os.scandir(os.path.join(model_cache, "snapshots")) as it:
+            for entry in it:
+                try:
+                    token = max(token, entry.stat(follow_symlinks=False).st_mtime_ns)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return token
 
 
 def resolve_gguf_path(
@@ -82,14 +162,21 @@ def resolve_gguf_path(
     """Resolve the local cache path to a GGUF file.
 
     Searches the HuggingFace cache structure for ``.gguf`` files
-    matching the model specification.  Searches recursively so it
-    handles both flat layouts (files in the snapshot root) and
-    subdirectory layouts (files inside quant-named folders like
-    ``Q6_K/``).
+    matching the model specification.  Snapshot directories are
+    scanned newest-first (by mtime), and the search within each
+    snapshot is recursive so both flat and quant-subdirectory layouts
+    (``Q6_K/``) are handled.
 
     For sharded models (multiple matching ``.gguf`` files), returns
     the first shard (sorted lexicographically).
 
+    Results are memoized per ``(model_id, cache_dir)`` and keyed on
+    the cache directory's change token — callers in the distribute
+    path resolve the same spec several times per CLI invocation, and
+    each uncached resolution walks the snapshot tree.  A download that
+    modifies the cache changes the token, so stale answers are
+    impossible without explicit invalidation.
+
     Args:
         model_id: GGUF model spec (e.g. ``"Qwen/Qwen3-1.7B-GGUF:Q4_K_M"``).
         cache_dir: Override for the HuggingFace cache directory.
@@ -97,40 +184,83 @@ def resolve_gguf_path(
     Returns:
         Path to the ``.gguf`` file, or ``None`` if not found.
     """
-    repo_id, quant = parse_gguf_model_spec(model_id)
-    cache = Path(resolve_cache_dir(cache_dir))
-    safe_name = repo_id.replace("/", "--")
-    model_cache = cache / "hub" / ("models--" + safe_name)
+    key = ("gguf", model_id, cache_dir)
+    token = _cache_change_token(model_cache_path(model_id, cache_dir))
+    hit = _SCAN_CACHE.get(key)
+    if hit is not None and hit[0] == token:
+        return hit[1]  # type: ignore[return-value]
+    value = _resolve_gguf_path_scan(model_id, cache_dir)
+    _SCAN_CACHE[key] = (token, value)
+    return value
 
-    if not model_cache.exists():
-        return None
 
-    # Search recursively for .gguf files matching the quant variant
-    if quant:
-        pattern = "**/*%s*.gguf" % quant
-    else:
-        pattern = "**/*.gguf"
+resolve_gguf_path.cache_clear = _SCAN_CACHE.clear  # type: ignore[attr-defined]
 
-    matched = sorted(model_cache.glob(pattern))
-    if not matched:
-        # Retry case-insensitive: glob is case-sensitive on Linux,
-        # so fall back to a manual filter when the quant case differs.
-        if quant:
-            all_gguf = sorted(model_cache.glob("**/*.gguf"))
-            q_lower = quant.lower()
-            matched = [f for f in all_gguf if q_lower in f.name.lower()]
 
-    if not matched:
+def _resolve_gguf_path_scan(
+    model_id: str,
+    cache_dir: str | None = None,
+) -> str | None:
+    """Uncached filesystem scan behind :func:`resolve_gguf_path`."""
+    quant = parse_gguf_model_spec(model_id)[1]
+    snapshots = f"{model_cache_path(model_id, cache_dir)}/snapshots"
+
+    try:
+        with os.scandir(snapshots) as it:
+            snapshot_dirs = [e for e in it if e.is_dir(follow_symlinks=False)]
+    except OSError:
         return None
 
-    # Return the first match (for sharded models this is the first shard).
-    return str(matched[0])
+    # Newest snapshot first so a fresh download wins over stale revisions
+    snapshot_dirs.sort(key=lambda e: e.stat(follow_symlinks=False).st_mtime,
+                       reverse=True)
+
+    # Case-insensitive fallback as a precompiled regex — search() in C
+    # instead of allocating a lowercased copy of every filename
+    q_pattern = re.compile(re.escape(quant), re.IGNORECASE) if quant else None
+    for snap in snapshot_dirs:
+        gguf_files = _scan_gguf_files(snap.path)
+        # min() instead of sorting: only the lexicographically first match
+        # matters (the first shard for sharded models).  Case-insensitive
+        # quant matching is the fallback — repos are inconsistent about
+        # quant-name casing.
+        if quant:
+            match = (
+                min((t for t in gguf_files if quant in t[0]), default=None)
+                or min((t for t in gguf_files if q_pattern.search(t[0])), default=None)
+            )
+        else:
+            match = min(gguf_files, default=None)
+        if match:
+            return match[1]
+
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _map_to_container_path(
+    host_path: str,
+    cache: str,
+    container_cache: str,
+) -> str | None:
+    """Translate a host cache path to its container mount equivalent.
+
+    Pure path mapping (no filesystem access) — ``relpath``/``join``
+    instead of prefix slicing so trailing-slash variants of *cache*
+    map identically.  Returns ``None`` when *host_path* lies outside
+    the cache directory.
+    """
+    rel = os.path.relpath(host_path, cache)
+    if rel.startswith(".."):
+        return None
+    return os.path.join(container_cache, rel)
 
 
 def resolve_gguf_container_path(
     model_id: str,
     cache_dir: str | None = None,
     container_cache: str = CONTAINER_HF_CACHE,
+    host_path: str | None = None,
 ) -> str | None:
     """Resolve the container-internal path to a cached GGUF file.
 
@@ -141,30 +271,34 @@ def resolve_gguf_container_path(
         model_id: GGUF model spec.
         cache_dir: Host-side HuggingFace cache directory.
         container_cache: Container-side cache mount point.
+        host_path: Optional pre-resolved host path to the ``.gguf``
+            file — callers that already ran :func:`resolve_gguf_path`
+            pass it here to skip the filesystem scan.
 
     Returns:
         Container-internal path to the ``.gguf`` file, or ``None``.
     """
-    host_path = resolve_gguf_path(model_id, cache_dir)
+    if host_path is None:
+        host_path = resolve_gguf_path(model_id, cache_dir)
     if not host_path:
         return None
 
     cache = resolve_cache_dir(cache_dir)
-    # Replace host cache prefix with container mount path
-    if host_path.startswith(cache):
-        return container_cache + host_path[len(cache):]
-    return None
+    return _map_to_container_path(host_path, cache, container_cache)
 
 
 # ---------------------------------------------------------------------------
 # Cache path computation
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=4096)
 def model_cache_path(model_id: str, cache_dir: str | None = None) -> str:
     """Compute the HF cache path for a model.
 
     For GGUF model specs (``repo:quant``), strips the quant variant
     since the cache directory is keyed by repository name only.
+    Memoized — pure string computation called from every cache check,
+    resolve, and distribute step.
 
     Args:
         model_id: HuggingFace model identifier or GGUF spec.
@@ -179,10 +313,56 @@ def model_cache_path(model_id: str, cache_dir: str | None = None) -> str:
     return f"{cache}/hub/models--{safe_name}"
 
 
+def snapshot_fingerprint(model_path: str) -> str:
+    """Compute a content fingerprint of a local model cache directory.
+
+    Hashes the sorted ``"<size> <relpath>"`` lines of every regular file
+    under *model_path* (symlinks excluded — the HF cache links snapshot
+    entries to blobs, and only the blobs carry data).  The remote probe
+    in model distribution computes the same digest with
+    ``find -type f -printf '%s %P\\n' | sort | sha256sum``, so equal
+    digests mean the remote cache already matches byte-count-for-byte-count.
+
+    Args:
+        model_path: Path to a model cache directory
+            (``.../hub/models--org--name``).
+
+    Returns:
+        Hex SHA-256 digest (empty directory and missing directory both
+        hash to the digest of zero lines).
+    """
+    base = model_path.rstrip("/")
+    lines: list[str] = []
+    for root, _dirs, files in os.walk(base):
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                st = os.lstat(path)
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            rel = os.path.relpath(path, base)
+            lines.append(f"{st.st_size} {rel}")
+
+    # Match `LC_ALL=C sort` byte ordering (code-point sort == UTF-8 bytes)
+    lines.sort()
+    digest = hashlib.sha256()
+    for line in lines:
+        digest.update(line.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
 # ---------------------------------------------------------------------------
 # Cache checking
 # ---------------------------------------------------------------------------
 
+# File suffixes that count as model weights when deciding whether a
+# snapshot is "really" cached (vs. a config-only VRAM-probe fetch)
+_WEIGHT_SUFFIXES = (".safetensors", ".bin", ".pt", ".pth", ".gguf")
+
+
 def _snapshot_dirs_for_revision(
     model_cache: Path,
     snapshots: Path,
@@ -195,10 +375,13 @@ def _snapshot_dirs_for_revision(
     """
     dirs: list[Path] = []
 
-    # Check refs/{revision} → commit hash → snapshots/{hash}/
-    refs_file = model_cache / "refs" / revision
-    if refs_file.exists():
-        commit_hash = refs_file.read_text().strip()
+    # Check refs/{revision} → commit hash → snapshots/{hash}/.  One read
+    # attempt instead of an exists() stat followed by the open.
+    try:
+        commit_hash = (model_cache / "refs" / revision).read_text().strip()
+    except OSError:
+        commit_hash = None
+    if commit_hash:
         candidate = snapshots / commit_hash
         if candidate.is_dir():
             dirs.append(candidate)
@@ -239,17 +422,40 @@ def is_model_cached(
         cache_dir: Override for the HuggingFace cache directory.
         revision: Optional revision (branch, tag, or commit hash) to check.
 
+    Results are memoized against the model cache directory's change
+    token (see :func:`_cache_change_token`) — orchestration code
+    re-asks the same question before every download/distribute step,
+    and any download that modifies the cache invalidates the entry
+    automatically.
+
     Returns:
         True if model weight files are present in the cache.
     """
+    key = ("cached", model_id, cache_dir, revision)
+    token = _cache_change_token(model_cache_path(model_id, cache_dir))
+    hit = _SCAN_CACHE.get(key)
+    if hit is not None and hit[0] == token:
+        return hit[1]  # type: ignore[return-value]
+    value = _is_model_cached_scan(model_id, cache_dir, revision)
+    _SCAN_CACHE[key] = (token, value)
+    return value
+
+
+is_model_cached.cache_clear = _SCAN_CACHE.clear  # type: ignore[attr-defined]
+
+
+def _is_model_cached_scan(
+    model_id: str,
+    cache_dir: str | None = None,
+    revision: str | None = None,
+) -> bool:
+    """Uncached filesystem scan behind :func:`is_model_cached`."""
     # For GGUF models, check for the specific quant file
     if is_gguf_model(model_id):
         return resolve_gguf_path(model_id, cache_dir) is not None
 
-    cache = Path(resolve_cache_dir(cache_dir))
     # HF cache structure: hub/models--org--name/snapshots/<hash>/
-    safe_name = model_id.replace("/", "--")
-    model_cache = cache / "hub" / f"models--{safe_name}"
+    model_cache = Path(model_cache_path(model_id, cache_dir))
     if not model_cache.exists():
         return False
 
@@ -257,8 +463,6 @@ def is_model_cached(
     if not snapshots.exists():
         return False
 
-    weight_patterns = ("*.safetensors", "*.bin", "*.pt", "*.gguf")
-
     # Determine which snapshot directories to check.
     if revision:
         # Explicit revision: only check that specific ref/hash, no fallback.
@@ -270,10 +474,146 @@ def is_model_cached(
         if not snapshot_dirs:
             snapshot_dirs = [d for d in snapshots.iterdir() if d.is_dir()]
 
+    # One scandir pass per snapshot instead of a glob per pattern —
+    # four directory reads collapse into one
     for snapshot_dir in snapshot_dirs:
-        for pattern in weight_patterns:
-            if any(snapshot_dir.glob(pattern)):
-                return True
+        try:
+            with os.scandir(snapshot_dir) as it:
+                if any(e.name.endswith(_WEIGHT_SUFFIXES) for e in it):
+                    return True
+        except OSError:
+            continue
+    return False
+
+
+# A revision pinned to a full commit hash — snapshot content for a hash
+# is immutable, so a complete local snapshot makes the hub round trip
+# redundant.  Branch/tag revisions may move and always get re-checked.
+_COMMIT_HASH_RE = re.compile(r"[0-9a-f]{40}")
+
+
+def _is_snapshot_complete(model_id: str, cache_dir: str | None, revision: str) -> bool:
+    """Check whether the cached snapshot for *revision* is complete.
+
+    Complete means: the snapshot directory exists, contains at least one
+    weight file, no entry is a dangling symlink (an interrupted download
+    leaves links pointing at missing blobs), and — when a
+    ``*.safetensors.index.json`` is present — every shard it lists is
+    present in the snapshot.
+
+    Only meaningful for commit-hash revisions; callers gate on
+    :data:`_COMMIT_HASH_RE` before using the result to skip a download.
+    """
+    model_cache = Path(model_cache_path(model_id, cache_dir))
+    snapshot_dirs = _snapshot_dirs_for_revision(model_cache, model_cache / "snapshots", revision)
+    if not snapshot_dirs:
+        return False
+    snapshot_dir = snapshot_dirs[0]
+
+    entries: set[str] = set()
+    index_files: list[Path] = []
+    has_weights = False
+    try:
+        for entry in os.scandir(snapshot_dir):
+            if not os.path.exists(entry.path):
+                # Dangling symlink — blob was never fully downloaded
+                return False
+            entries.add(entry.name)
+            if entry.name.endswith(_WEIGHT_SUFFIXES):
+                has_weights = True
+            elif entry.name.endswith(".safetensors.index.json"):
+                index_files.append(Path(entry.path))
+    except OSError:
+        return False
+
+    if not has_weights:
+        return False
+
+    for index_path in index_files:
+        try:
+            weight_map = json.loads(index_path.read_text()).get("weight_map", {})
+        except (OSError, ValueError):
+            return False
+        if not set(weight_map.values()) <= entries:
+            return False
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Cross-cache adoption
+# ---------------------------------------------------------------------------
+
+# Other local HF caches worth checking before going to the network.
+# The default user cache covers ``--cache-dir`` overrides (and vice versa);
+# ``/var/cache/hf-shared`` is a shared system cache some deployments
+# provision.  Missing directories are skipped cheaply.
+_ALTERNATE_CACHE_DIRS: tuple[str, ...] = (
+    str(DEFAULT_HF_CACHE_DIR),
+    "/var/cache/hf-shared",
+)
+
+
+def _clone_model_cache(src_root: str, dst_root: str) -> None:
+    """Replicate a model cache directory under *dst_root* via hardlinks.
+
+    Regular files (blobs, refs) are hardlinked — zero bytes copied;
+    symlinks (snapshot entries pointing at blobs) are recreated with
+    their original relative targets, which stay valid because the
+    directory structure is mirrored.  Cross-device links fall back to a
+    real copy.  Existing destination entries (e.g. a ``config.json``
+    left by a VRAM auto-detect fetch) are left untouched.
+    """
+    for root, _dirs, files in os.walk(src_root):
+        rel = os.path.relpath(root, src_root)
+        dst_dir = dst_root if rel == "." else os.path.join(dst_root, rel)
+        os.makedirs(dst_dir, exist_ok=True)
+        for name in files:
+            src = os.path.join(root, name)
+            dst = os.path.join(dst_dir, name)
+            if os.path.lexists(dst):
+                continue
+            if os.path.islink(src):
+                os.symlink(os.readlink(src), dst)
+            else:
+                try:
+                    os.link(src, dst)
+                except OSError:
+                    shutil.copyfile(src, dst)
+
+
+def _adopt_from_alternate_cache(
+    model_id: str,
+    cache: str,
+    revision: str | None = None,
+) -> bool:
+    """Try to hardlink a model into *cache* from another local HF cache.
+
+    When the user switches ``cache_dir`` (or alternates between host and
+    container cache paths), the model may already sit in a different
+    known cache — adopting it is O(files) of filesystem metadata instead
+    of a full re-download.  Failures are non-fatal: the caller falls
+    through to the normal network download.
+
+    Returns:
+        True when the model was fully cloned into *cache*.
+    """
+    cache_norm = os.path.normpath(cache)
+    for alt in _ALTERNATE_CACHE_DIRS:
+        if os.path.normpath(alt) == cache_norm:
+            continue
+        if not is_model_cached(model_id, alt, revision=revision):
+            continue
+        try:
+            _clone_model_cache(
+                model_cache_path(model_id, alt),
+                model_cache_path(model_id, cache),
+            )
+        except OSError as e:
+            logger.debug("Could not adopt %s from cache %s: %s", model_id, alt, e)
+            continue
+        logger.info("Model %s adopted from local cache %s (no download needed)",
+                    model_id, alt)
+        return True
     return False
 
 
@@ -281,6 +621,62 @@ def is_model_cached(
 # Download
 # ---------------------------------------------------------------------------
 
+def _download_workers() -> int:
+    """Pick a download thread count for ``snapshot_download``.
+
+    The library default is conservative; many-small-file repos are
+    round-trip-bound, so modest concurrency (8–16) saturates the WAN
+    link well before server-side contention matters.  Scaled to CPU
+    count and clamped to the 4–16 range.  The
+    ``SPARKRUN_HF_PARALLEL_WORKERS`` environment variable overrides
+    the heuristic outright (useful on links where the sweet spot is
+    known).
+    """
+    env = os.environ.get("SPARKRUN_HF_PARALLEL_WORKERS")
+    if env:
+        try:
+            return max(1, int(env))
+        except ValueError:
+            logger.warning("Ignoring invalid SPARKRUN_HF_PARALLEL_WORKERS=%r", env)
+    return min(16, max(4, (os.cpu_count() or 4) * 2))
+
+
+def _enable_hf_transfer() -> None:
+    """Opt into the Rust ``hf_transfer`` backend when it is installed.
+
+    ``hf_transfer`` pipelines range requests and cuts per-file TLS/TCP
+    overhead (``pip install hf_transfer`` — optional dependency).  Only
+    sets the env var when the package is importable, since
+    ``huggingface_hub`` errors out if the flag is set without it, and
+    never overrides an explicit user setting.
+    """
+    import importlib.util
+
+    if importlib.util.find_spec("hf_transfer") is not None:
+        os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+
+# Lazily imported huggingface_hub.snapshot_download (see _get_snapshot_download)
+_snapshot_download_fn = None
+
+
+def _get_snapshot_download():
+    """Import ``huggingface_hub.snapshot_download`` once per process.
+
+    ``huggingface_hub`` is a heavy import (filelock, requests, urllib3,
+    tqdm) that must not be paid at CLI startup, but multi-model runs
+    call the download helpers repeatedly — the singleton makes the
+    one-time cost explicit instead of re-running the import machinery
+    in every call.
+    """
+    global _snapshot_download_fn
+    if _snapshot_download_fn is None:
+        from huggingface_hub import snapshot_download
+
+        _snapshot_download_fn = snapshot_download
+    return _snapshot_download_fn
+
+
 def _snapshot_download(
     repo_id: str,
     cache: str,
@@ -293,7 +689,9 @@ def _snapshot_download(
 
     Centralises the common import, progress-bar enablement, kwarg
     assembly, and error handling used by both :func:`download_model`
-    and :func:`_download_gguf`.
+    and :func:`_download_gguf`.  Downloads run with a tuned
+    ``max_workers`` (see :func:`_download_workers`) and use the
+    ``hf_transfer`` fast path when that optional package is installed.
 
     Args:
         repo_id: HuggingFace repository identifier.
@@ -309,15 +707,30 @@ def _snapshot_download(
         Exit code (0 = success, 1 = failure).
     """
     try:
-        from huggingface_hub import snapshot_download
-        from huggingface_hub.utils import enable_progress_bars
-
-        enable_progress_bars()
+        _enable_hf_transfer()
+        snapshot_download = _get_snapshot_download()
+
+        if sys.stderr.isatty():
+            from huggingface_hub.utils import enable_progress_bars
+
+            enable_progress_bars()
+        else:
+            # Non-interactive (CI, piped output): skip tqdm entirely
+            os.environ.setdefault("HF_HUB_DISABLE_PROGRESS_BARS", "1")
+
+        workers = _download_workers()
+        # Surface the active download mode — the first question when
+        # debugging a slow pull is whether the fast path is engaged
+        logger.debug(
+            "Download mode for %s: hf_transfer=%s, max_workers=%d", label,
+            os.environ.get("HF_HUB_ENABLE_HF_TRANSFER") == "1", workers,
+        )
 
         kwargs: dict = {
             "repo_id": repo_id,
             "cache_dir": _hub_cache(cache),
             "token": token,
+            "max_workers": workers,
         }
         if revision:
             kwargs["revision"] = revision
@@ -338,12 +751,15 @@ def download_model(
     token: str | None = None,
     revision: str | None = None,
     dry_run: bool = False,
+    verify_cache: bool = False,
 ) -> int:
     """Download a model from HuggingFace Hub.
 
     Automatically detects GGUF model specs (``repo:quant``) and
     downloads only the matching quantization files instead of the
-    entire repository.
+    entire repository.  A model missing from *cache_dir* but present
+    in another known local cache is adopted via hardlinks instead of
+    re-downloaded (see :func:`_adopt_from_alternate_cache`).
 
     Args:
         model_id: HuggingFace model identifier or GGUF spec.
@@ -351,6 +767,11 @@ def download_model(
         token: Optional HuggingFace API token for gated models.
         revision: Optional revision (branch, tag, or commit hash).
         dry_run: If True, show what would be done without executing.
+        verify_cache: Run the full cache-completeness scan before
+            downloading.  Off by default — ``snapshot_download``
+            re-verifies the cache itself, so the pre-scan only buys a
+            nicer log message, and a single ``stat`` on the model dir
+            is enough for that.
 
     Returns:
         Exit code (0 = success).
@@ -358,7 +779,7 @@ def download_model(
     if is_gguf_model(model_id):
         return _download_gguf(
             model_id, cache_dir=cache_dir, token=token,
-            revision=revision, dry_run=dry_run,
+            revision=revision, dry_run=dry_run, verify_cache=verify_cache,
         )
 
     cache = resolve_cache_dir(cache_dir)
@@ -368,16 +789,88 @@ def download_model(
                      model_id, revision or "latest", cache)
         return 0
 
-    cached = is_model_cached(model_id, cache, revision=revision)
+    # A commit-hash revision is immutable: when the local snapshot is
+    # verifiably complete there is nothing the hub could tell us, so skip
+    # snapshot_download (and its HEAD request) entirely.  Branch/tag
+    # revisions fall through — they may have moved upstream.
+    if revision and _COMMIT_HASH_RE.fullmatch(revision) and _is_snapshot_complete(model_id, cache, revision):
+        logger.info("Model %s already complete at %s — skipping download", model_id, revision[:12])
+        return 0
+
+    if verify_cache:
+        cached = is_model_cached(model_id, cache, revision=revision)
+    else:
+        cached = os.path.isdir(model_cache_path(model_id, cache))
     if cached:
         logger.info("Model %s appears cached — verifying completeness...", model_id)
     else:
+        # Another local cache may already hold the model — hardlinking it
+        # over costs filesystem metadata only, no network
+        if _adopt_from_alternate_cache(model_id, cache, revision=revision):
+            is_model_cached.cache_clear()
+            return 0
         logger.info("Downloading model: %s (revision=%s)...", model_id, revision or "latest")
 
-    return _snapshot_download(
+    rc = _snapshot_download(
         repo_id=model_id, cache=cache, label=model_id,
         token=token, revision=revision,
     )
+    if rc == 0:
+        # The mtime token invalidates entries on its own; the explicit
+        # clear guards against coarse filesystem timestamp granularity
+        is_model_cached.cache_clear()
+    return rc
+
+
+def download_models(
+    model_ids: list[str],
+    cache_dir: str | None = None,
+    token: str | None = None,
+    revision: str | None = None,
+    dry_run: bool = False,
+) -> list[str]:
+    """Download several models concurrently.
+
+    Each ``snapshot_download`` starts with a metadata round trip before
+    any blobs move, so running the per-model calls in a small thread
+    pool overlaps that latency across models instead of serializing it.
+    The hub library's own file locks keep concurrent cache writes safe,
+    and blob fetches inside each call still parallelize via
+    :func:`_download_workers`.
+
+    Args:
+        model_ids: HuggingFace model identifiers (GGUF specs allowed).
+        cache_dir: Override for the HuggingFace cache directory.
+        token: Optional HuggingFace API token for gated models.
+        revision: Optional revision applied to every model.
+        dry_run: If True, show what would be done without executing.
+
+    Returns:
+        List of model ids whose download failed (empty = full success).
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    if not model_ids:
+        return []
+
+    workers = min(4, len(model_ids))
+    failed: list[str] = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                download_model, model_id,
+                cache_dir=cache_dir, token=token,
+                revision=revision, dry_run=dry_run,
+            ): model_id
+            for model_id in model_ids
+        }
+        for future in as_completed(futures):
+            model_id = futures[future]
+            if future.result() != 0:
+                logger.error("Failed to download model: %s", model_id)
+                failed.append(model_id)
+
+    return failed
 
 
 def _download_gguf(
@@ -386,11 +879,17 @@ def _download_gguf(
     token: str | None = None,
     revision: str | None = None,
     dry_run: bool = False,
+    verify_cache: bool = False,
 ) -> int:
     """Download a GGUF model, fetching only the matching quant files.
 
-    Uses ``snapshot_download`` with ``allow_patterns`` to avoid
-    downloading every quantization variant in the repository.
+    When a quant variant is specified, lists the repository files once
+    and fetches just the matching names via ``hf_hub_download`` in a
+    small thread pool — ``snapshot_download`` would still fetch full
+    repo metadata and resolve symlinks for every file even with an
+    ``allow_patterns`` filter.  Falls back to ``snapshot_download``
+    (with ``allow_patterns``) when no quant is given or the listing
+    fails.
 
     Args:
         model_id: GGUF model spec (e.g. ``"Qwen/Qwen3-1.7B-GGUF:Q4_K_M"``).
@@ -398,6 +897,8 @@ def _download_gguf(
         token: Optional HuggingFace API token.
         revision: Optional revision (branch, tag, or commit hash).
         dry_run: If True, show what would be done without executing.
+        verify_cache: Run the full ``.gguf`` resolution scan before
+            downloading (see :func:`download_model`).
 
     Returns:
         Exit code (0 = success).
@@ -410,15 +911,96 @@ def _download_gguf(
                      repo_id, quant, revision or "latest", cache)
         return 0
 
-    cached = resolve_gguf_path(model_id, cache) is not None
+    if verify_cache:
+        cached = resolve_gguf_path(model_id, cache) is not None
+    else:
+        cached = os.path.isdir(model_cache_path(model_id, cache))
     if cached:
         logger.info("GGUF model %s appears cached — verifying completeness...", model_id)
     else:
         logger.info("Downloading GGUF model: %s (quant=%s, revision=%s)...",
                      repo_id, quant or "any", revision or "latest")
 
-    patterns = ["*%s*" % quant] if quant else None
-    return _snapshot_download(
-        repo_id=repo_id, cache=cache, label=model_id,
-        token=token, revision=revision, allow_patterns=patterns,
-    )
+    rc = None
+    if quant:
+        rc = _fetch_gguf_files(
+            repo_id=repo_id, quant=quant, cache=cache, label=model_id,
+            token=token, revision=revision,
+        )
+    if rc is None:
+        # No quant selected, or the targeted path couldn't run — fetch
+        # through snapshot_download with a pattern filter instead.
+        patterns = ["*%s*" % quant, *_GGUF_COMPANION_PATTERNS] if quant else None
+        rc = _snapshot_download(
+            repo_id=repo_id, cache=cache, label=model_id,
+            token=token, revision=revision, allow_patterns=patterns,
+        )
+    if rc == 0:
+        # Memoized resolutions from before the download are stale now
+        resolve_gguf_path.cache_clear()
+        is_model_cached.cache_clear()
+    return rc
+
+
+def _fetch_gguf_files(
+    repo_id: str,
+    quant: str,
+    cache: str,
+    label: str,
+    token: str | None = None,
+    revision: str | None = None,
+) -> int | None:
+    """Fetch only the repo files matching *quant* via ``hf_hub_download``.
+
+    Lists the repository once, filters filenames case-insensitively,
+    then downloads the matching files in parallel — along with any
+    companion files (tokenizer/config metadata, multimodal projector
+    weights) the runtime may need beside the quant shards.  Returns the
+    exit code (0/1), or ``None`` when the listing failed and the caller
+    should fall back to ``snapshot_download``.
+    """
+    import fnmatch
+    from concurrent.futures import ThreadPoolExecutor
+
+    try:
+        _enable_hf_transfer()
+        from huggingface_hub import HfApi, hf_hub_download
+
+        api = HfApi(token=token)
+        quant_lower = quant.lower()
+        all_files = list(api.list_repo_files(repo_id, revision=revision))
+        files = [f for f in all_files if quant_lower in f.lower()]
+    except Exception as e:
+        logger.debug("Repo file listing failed for %s (%s) — "
+                     "falling back to snapshot_download", repo_id, e)
+        return None
+
+    if not files:
+        logger.error("No files matching quant '%s' in repository %s", quant, repo_id)
+        return 1
+
+    # Pull companion metadata alongside the quant shards (tiny files,
+    # cheap to include; only the quant match decides success/failure)
+    files += [
+        f for f in all_files
+        if f not in files
+        and any(fnmatch.fnmatch(f.lower(), p) for p in _GGUF_COMPANION_PATTERNS)
+    ]
+
+    try:
+        kwargs: dict = {
+            "repo_id": repo_id,
+            "cache_dir": _hub_cache(cache),
+            "token": token,
+        }
+        if revision:
+            kwargs["revision"] = revision
+        with ThreadPoolExecutor(max_workers=min(4, len(files))) as executor:
+            list(executor.map(
+                lambda f: hf_hub_download(filename=f, **kwargs), files,
+            ))
+        logger.info("Model downloaded successfully: %s", label)
+        return 0
+    except Exception as e:
+        logger.error("Failed to download model %s: %s", label, e)
+        return 1
@@ -5,8 +5,9 @@ from __future__ import annotations
 import logging
 
 from sparkrun.config import resolve_cache_dir
+from sparkrun.models.download import DEFAULT_REMOTE_DOWNLOAD_WORKERS
 from sparkrun.orchestration.primitives import sync_resource_to_hosts
-from sparkrun.scripts import read_script
+from sparkrun.scripts import read_script_template
 
 logger = logging.getLogger(__name__)
 
@@ -19,11 +20,15 @@ def sync_model_to_hosts(
     ssh_user: str | None = None,
     ssh_key: str | None = None,
     dry_run: bool = False,
+    max_workers: int = DEFAULT_REMOTE_DOWNLOAD_WORKERS,
 ) -> list[str]:
     """Download a model on all hosts in parallel.
 
     Uses ``huggingface-cli`` on each remote host to download the model
-    if it is not already cached.
+    if it is not already cached.  The hosts run concurrently (the script
+    dispatch is thread-pooled), and each host fetches shards in parallel
+    — with the ``hf_transfer`` fast path when that package is installed
+    on the host.
 
     Args:
         model_id: HuggingFace model identifier.
@@ -33,6 +38,8 @@ def sync_model_to_hosts(
         ssh_user: Optional SSH username.
         ssh_key: Optional path to SSH private key.
         dry_run: If True, show what would be done without executing.
+        max_workers: Per-host shard-fetch concurrency passed to
+            ``huggingface-cli download --max-workers``.
 
     Returns:
         List of hostnames where the sync failed.
@@ -40,8 +47,9 @@ def sync_model_to_hosts(
     cache = resolve_cache_dir(cache_dir)
     revision_flag = "--revision %s " % revision if revision else ""
 
-    script = read_script("model_sync.sh").format(
+    script = read_script_template("model_sync.sh").safe_substitute(
         model_id=model_id, cache=cache, revision_flag=revision_flag,
+        max_workers=max_workers,
     )
 
     return sync_resource_to_hosts(
@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING
 from sparkrun.hosts import is_local_host
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from sparkrun.config import SparkrunConfig
 
 logger = logging.getLogger(__name__)
@@ -25,6 +27,7 @@ def _distribute_from_head(
     ssh_options: list[str] | None = None,
     timeout: int | None = None,
     dry_run: bool = False,
+    pre_distribute: Callable[[], None] | None = None,
 ) -> list[str]:
     """Shared head-to-workers distribution pattern.
 
@@ -43,18 +46,37 @@ def _distribute_from_head(
         ssh_options: Additional SSH options.
         timeout: Per-operation timeout in seconds.
         dry_run: If True, show what would be done without executing.
+        pre_distribute: Optional worker-side preparation callable run
+            concurrently with the ensure step — the ensure script only
+            touches the head (typically WAN-bound download) while worker
+            prep travels a disjoint network path, so overlapping them
+            costs max() instead of sum().  Must complete before the
+            distribute step starts.
 
     Returns:
         List of hostnames where distribution failed (empty = full success).
     """
     from sparkrun.orchestration.ssh import run_remote_script
 
-    # Step 1: ensure resource on head
-    ensure_result = run_remote_script(
-        head, ensure_script,
-        ssh_user=ssh_user, ssh_key=ssh_key, ssh_options=ssh_options,
-        timeout=timeout, dry_run=dry_run,
-    )
+    # Step 1: ensure resource on head (overlapped with worker prep when given)
+    if pre_distribute is not None and len(hosts) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            ensure_future = pool.submit(
+                run_remote_script, head, ensure_script,
+                ssh_user=ssh_user, ssh_key=ssh_key, ssh_options=ssh_options,
+                timeout=timeout, dry_run=dry_run,
+            )
+            prep_future = pool.submit(pre_distribute)
+            ensure_result = ensure_future.result()
+            prep_future.result()
+    else:
+        ensure_result = run_remote_script(
+            head, ensure_script,
+            ssh_user=ssh_user, ssh_key=ssh_key, ssh_options=ssh_options,
+            timeout=timeout, dry_run=dry_run,
+        )
     if not ensure_result.success:
         logger.error("Failed to ensure %s on head %s", resource_label, head)
         return list(hosts)
@@ -7,13 +7,33 @@ No files are ever copied to remote hosts.
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
+import re
 import subprocess
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# SSH connection multiplexing options.  The first connection to a host
+# becomes a master whose socket subsequent connections reuse, so
+# multi-phase operations (permission fix, then transfer) pay the SSH
+# handshake once per host instead of once per phase.  ``ControlMaster=auto``
+# degrades gracefully to plain connections when the socket can't be created.
+CONTROL_MASTER_OPTS = [
+    "-o", "ControlMaster=auto",
+    "-o", "ControlPath=~/.ssh/sparkrun-cm-%C",
+    "-o", "ControlPersist=600",
+]
+
+# Default fan-out bound for parallel SSH dispatch.  sshd drops unauthenticated
+# connection attempts beyond ``MaxStartups`` (10 by default), so large
+# clusters must not open a fresh connection to every host at once.
+DEFAULT_MAX_CONCURRENCY = 8
+
 
 @dataclass
 class RemoteResult:
@@ -55,6 +75,7 @@ def build_ssh_cmd(
         List of command parts suitable for subprocess.
     """
     cmd = ["ssh", "-o", "BatchMode=yes", "-o", f"ConnectTimeout={connect_timeout}"]
+    cmd.extend(CONTROL_MASTER_OPTS)
     if ssh_key:
         cmd.extend(["-i", ssh_key])
     if ssh_options:
@@ -64,6 +85,115 @@ def build_ssh_cmd(
     return cmd
 
 
+def open_control_master(
+        host: str,
+        ssh_user: str | None = None,
+        ssh_key: str | None = None,
+        ssh_options: list[str] | None = None,
+        connect_timeout: int = 10,
+        dry_run: bool = False,
+) -> bool:
+    """Open a persistent SSH control master connection to a host.
+
+    Runs ``ssh -M -N -f`` so the master authenticates once, backgrounds
+    itself, and stays alive (per :data:`CONTROL_MASTER_OPTS`) for
+    subsequent connections to multiplex over.
+
+    Args:
+        host: Remote hostname or IP.
+        ssh_user: Optional SSH username.
+        ssh_key: Optional path to SSH private key.
+        ssh_options: Additional SSH options.
+        connect_timeout: SSH connection timeout in seconds.
+        dry_run: If True, log but don't connect.
+
+    Returns:
+        True if the master was opened (or already existed).
+    """
+    if dry_run:
+        logger.info("[dry-run] Would open SSH control master to %s", host)
+        return True
+
+    cmd = build_ssh_cmd(host, ssh_user, ssh_key, ssh_options, connect_timeout)
+    # Master mode, no remote command, background after authentication
+    cmd[1:1] = ["-M", "-N", "-f"]
+
+    logger.debug("  SSH master -> %s", host)
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True,
+                              timeout=connect_timeout + 5)
+        if proc.returncode != 0:
+            logger.debug("  SSH master <- %s FAILED rc=%d: %s",
+                         host, proc.returncode, proc.stderr.strip()[:200])
+        return proc.returncode == 0
+    except Exception as e:
+        logger.debug("  SSH master <- %s ERROR: %s", host, e)
+        return False
+
+
+def close_control_master(
+        host: str,
+        ssh_user: str | None = None,
+        ssh_key: str | None = None,
+        ssh_options: list[str] | None = None,
+        dry_run: bool = False,
+) -> None:
+    """Close a persistent SSH control master connection (``ssh -O exit``).
+
+    Best-effort: failures (e.g. no master running) are logged at debug
+    level and ignored.
+    """
+    if dry_run:
+        return
+
+    cmd = build_ssh_cmd(host, ssh_user, ssh_key, ssh_options)
+    cmd[1:1] = ["-O", "exit"]
+    try:
+        subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+    except Exception as e:
+        logger.debug("  SSH master exit %s: %s", host, e)
+
+
+@contextmanager
+def ssh_pool(
+        hosts: list[str],
+        ssh_user: str | None = None,
+        ssh_key: str | None = None,
+        ssh_options: list[str] | None = None,
+        dry_run: bool = False,
+):
+    """Context manager that pre-opens multiplexed SSH masters for *hosts*.
+
+    Multi-phase operations (e.g. permission fix followed by a transfer)
+    open a fresh SSH connection per host per phase; on larger clusters
+    this piles up handshakes and can trip sshd's ``MaxStartups``
+    throttling.  Opening the masters once up front lets every phase
+    inside the ``with`` block ride the same TCP sessions.  Masters are
+    closed on exit; failures in either direction are non-fatal since
+    :data:`CONTROL_MASTER_OPTS` degrades to plain connections.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if hosts and not dry_run:
+        logger.debug("Opening SSH control masters for %d host(s)", len(hosts))
+        with ThreadPoolExecutor(max_workers=len(hosts)) as executor:
+            list(executor.map(
+                lambda h: open_control_master(
+                    h, ssh_user=ssh_user, ssh_key=ssh_key,
+                    ssh_options=ssh_options,
+                ),
+                hosts,
+            ))
+    try:
+        yield
+    finally:
+        for host in hosts:
+            close_control_master(
+                host, ssh_user=ssh_user, ssh_key=ssh_key,
+                ssh_options=ssh_options, dry_run=dry_run,
+            )
+
+
 def run_remote_script(
         host: str,
         script: str,
@@ -324,6 +454,7 @@ def run_remote_scripts_parallel(
         ssh_options: list[str] | None = None,
         timeout: int | None = None,
         dry_run: bool = False,
+        max_concurrency: int | None = None,
 ) -> list[RemoteResult]:
     """Execute the same script on multiple hosts in parallel using threads.
 
@@ -335,6 +466,9 @@ def run_remote_scripts_parallel(
         ssh_options: Additional SSH options.
         timeout: Per-host execution timeout in seconds.
         dry_run: If True, log the script but don't execute.
+        max_concurrency: Optional bound on simultaneous SSH connections
+            (pass :data:`DEFAULT_MAX_CONCURRENCY` to stay under sshd's
+            ``MaxStartups`` drop threshold on large clusters).
 
     Returns:
         List of RemoteResult, one per host (order not guaranteed).
@@ -344,9 +478,10 @@ def run_remote_scripts_parallel(
     logger.info("  Running script in parallel on %d hosts: %s",
                 len(hosts), ", ".join(hosts))
 
+    workers = len(hosts) if max_concurrency is None else min(len(hosts), max_concurrency)
     t0 = time.monotonic()
     results: list[RemoteResult] = []
-    with ThreadPoolExecutor(max_workers=len(hosts)) as executor:
+    with ThreadPoolExecutor(max_workers=workers) as executor:
         futures = {
             executor.submit(
                 run_remote_script,
@@ -507,6 +642,7 @@ def build_ssh_opts_string(
         ``"-o BatchMode=yes -o ConnectTimeout=10 -i /path/key"``.
     """
     parts = ["-o", "BatchMode=yes", "-o", f"ConnectTimeout={connect_timeout}"]
+    parts.extend(CONTROL_MASTER_OPTS)
     if ssh_key:
         parts.extend(["-i", ssh_key])
     if ssh_options:
@@ -591,6 +727,50 @@ def run_pipeline_to_remote(
         return RemoteResult(host=host, returncode=-1, stdout="", stderr=str(e))
 
 
+@functools.lru_cache(maxsize=1)
+def _local_rsync_version() -> tuple[int, int]:
+    """Return the local rsync version as ``(major, minor)``, or ``(0, 0)``.
+
+    Cached for the process lifetime — distribution paths may build rsync
+    flags once per host and the version cannot change mid-run.
+    """
+    try:
+        proc = subprocess.run(
+            ["rsync", "--version"], capture_output=True, text=True, timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return (0, 0)
+    match = re.search(r"version\s+(\d+)\.(\d+)", proc.stdout)
+    return (int(match.group(1)), int(match.group(2))) if match else (0, 0)
+
+
+def fast_rsync_options(zstd: bool | None = None) -> list[str]:
+    """Rsync flags tuned for bulk model transfer over a fast LAN.
+
+    ``--whole-file`` skips the delta algorithm, which is CPU-bound and
+    pointless when the destination is either absent or identical, and
+    ``--inplace`` avoids the temp-file copy-and-rename on multi-GB weight
+    files.  With rsync 3.2+ compression switches to zstd at level 1,
+    which is far cheaper per byte than the default zlib; older rsyncs
+    skip compression entirely rather than pay zlib's CPU cost on
+    already-dense safetensors data.
+
+    Args:
+        zstd: Force zstd compression on or off; ``None`` auto-detects
+            from the local rsync version.  Pass ``False`` when the flags
+            are destined for a remote host whose rsync version is unknown.
+
+    Returns:
+        List of rsync command-line flags.
+    """
+    options = ["-a", "--partial", "--links", "--whole-file", "--inplace"]
+    if zstd is None:
+        zstd = _local_rsync_version() >= (3, 2)
+    if zstd:
+        options += ["--compress-choice=zstd", "--compress-level=1"]
+    return options
+
+
 def run_rsync(
         source_path: str,
         host: str,
@@ -602,6 +782,7 @@ def run_rsync(
         rsync_options: list[str] | None = None,
         timeout: int | None = None,
         dry_run: bool = False,
+        files_from: str | None = None,
 ) -> RemoteResult:
     """Rsync a local path to a remote host.
 
@@ -620,12 +801,21 @@ def run_rsync(
         rsync_options: Override rsync flags (default ``["-az", "--partial", "--links"]``).
         timeout: Overall execution timeout in seconds.
         dry_run: If True, log the command but don't execute.
+        files_from: Optional path to a NUL-separated list of paths relative
+            to *source_path* — passed as ``--files-from=<file> --from0`` so
+            one rsync process transfers several subtrees in a single run.
+            ``--recursive`` is added explicitly since ``--files-from``
+            disables the recursion implied by ``-a``.
 
     Returns:
         RemoteResult with returncode, stdout, stderr.
     """
     if rsync_options is None:
         rsync_options = ["-az", "--partial", "--links"]
+    if files_from:
+        rsync_options = rsync_options + [
+            "--files-from=%s" % files_from, "--from0", "--recursive",
+        ]
 
     ssh_opts = build_ssh_opts_string(
         ssh_user=ssh_user, ssh_key=ssh_key,
@@ -671,6 +861,114 @@ def run_rsync(
         return RemoteResult(host=host, returncode=-1, stdout="", stderr=str(e))
 
 
+def run_tar_pipe(
+        source_path: str,
+        host: str,
+        dest_path: str,
+        ssh_user: str | None = None,
+        ssh_key: str | None = None,
+        ssh_options: list[str] | None = None,
+        connect_timeout: int = 10,
+        timeout: int | None = None,
+        dry_run: bool = False,
+) -> RemoteResult:
+    """Stream a local directory to a remote host via a tar pipe.
+
+    Runs ``tar --sparse -cf - source | ssh host 'tar -xpf -'`` as a single
+    pipeline.  Unlike rsync, this sends one continuous stream with no
+    per-file stat/delta exchange, which is much faster for clean targets
+    (e.g. an HF snapshot with thousands of hash-named blob files that the
+    remote does not have yet).  Symlinks and sparse files are preserved.
+
+    Args:
+        source_path: Local source directory.
+        host: Remote hostname or IP.
+        dest_path: Remote destination directory (the directory itself is
+            recreated under its parent, mirroring the local layout).
+        ssh_user: Optional SSH username.
+        ssh_key: Optional path to SSH private key.
+        ssh_options: Additional SSH options.
+        connect_timeout: SSH connection timeout in seconds.
+        timeout: Overall execution timeout in seconds.
+        dry_run: If True, log the pipeline but don't execute.
+
+    Returns:
+        RemoteResult with returncode, stdout, stderr.
+    """
+    src = source_path.rstrip("/")
+    src_parent, src_base = os.path.split(src)
+    dest_parent = os.path.dirname(dest_path.rstrip("/"))
+
+    local_cmd = f'tar --sparse -cf - -C "{src_parent}" "{src_base}"'
+    remote_cmd = f'mkdir -p "{dest_parent}" && tar -xpf - -C "{dest_parent}"'
+
+    return run_pipeline_to_remote(
+        host, local_cmd, remote_cmd,
+        ssh_user=ssh_user, ssh_key=ssh_key, ssh_options=ssh_options,
+        connect_timeout=connect_timeout, timeout=timeout, dry_run=dry_run,
+    )
+
+
+def run_tar_pipe_parallel(
+        source_path: str,
+        hosts: list[str],
+        dest_path: str,
+        ssh_user: str | None = None,
+        ssh_key: str | None = None,
+        ssh_options: list[str] | None = None,
+        connect_timeout: int = 10,
+        timeout: int | None = None,
+        dry_run: bool = False,
+) -> list[RemoteResult]:
+    """Stream a local directory to multiple hosts in parallel via tar pipes.
+
+    Wrapper over :func:`run_tar_pipe` using a thread pool, matching the
+    pattern of :func:`run_rsync_parallel`.  With SSH connection
+    multiplexing (:data:`CONTROL_MASTER_OPTS`) the per-host handshake is
+    already amortized by any preceding phase that touched the same hosts.
+
+    Args:
+        source_path: Local source directory.
+        hosts: List of remote hostnames or IPs.
+        dest_path: Remote destination directory.
+        ssh_user: Optional SSH username.
+        ssh_key: Optional path to SSH private key.
+        ssh_options: Additional SSH options.
+        connect_timeout: SSH connection timeout in seconds.
+        timeout: Per-host execution timeout in seconds.
+        dry_run: If True, log but don't execute.
+
+    Returns:
+        List of RemoteResult, one per host.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    logger.info("  Running tar pipe in parallel to %d hosts: %s",
+                len(hosts), ", ".join(hosts))
+
+    t0 = time.monotonic()
+    results: list[RemoteResult] = []
+    with ThreadPoolExecutor(max_workers=len(hosts)) as executor:
+        futures = {
+            executor.submit(
+                run_tar_pipe,
+                source_path, host, dest_path,
+                ssh_user=ssh_user, ssh_key=ssh_key,
+                ssh_options=ssh_options, connect_timeout=connect_timeout,
+                timeout=timeout, dry_run=dry_run,
+            ): host
+            for host in hosts
+        }
+        for future in as_completed(futures):
+            results.append(future.result())
+
+    elapsed = time.monotonic() - t0
+    ok = sum(1 for r in results if r.success)
+    logger.info("  Parallel tar pipe done: %d/%d OK (%.1fs total)",
+                ok, len(results), elapsed)
+    return results
+
+
 def run_pipeline_to_remotes_parallel(
         hosts: list[str],
         local_cmd: str,
@@ -740,6 +1038,7 @@ def run_rsync_parallel(
         rsync_options: list[str] | None = None,
         timeout: int | None = None,
         dry_run: bool = False,
+        files_from: str | None = None,
 ) -> list[RemoteResult]:
     """Rsync a local path to multiple hosts in parallel.
 
@@ -757,6 +1056,7 @@ def run_rsync_parallel(
         rsync_options: Override rsync flags.
         timeout: Per-host execution timeout in seconds.
         dry_run: If True, log but don't execute.
+        files_from: Optional NUL-separated path-list file (see :func:`run_rsync`).
 
     Returns:
         List of RemoteResult, one per host.
@@ -777,6 +1077,7 @@ def run_rsync_parallel(
                 ssh_options=ssh_options, connect_timeout=connect_timeout,
                 rsync_options=rsync_options,
                 timeout=timeout, dry_run=dry_run,
+                files_from=files_from,
             ): host
             for host in hosts
         }
@@ -53,13 +53,23 @@ def run_with_sudo_fallback(
         else:
             failed_hosts.append(r.host)
 
-    # Step 2: For failed hosts, fall back to password-based sudo
+    # Step 2: For failed hosts, fall back to password-based sudo — in
+    # parallel like step 1, the password is the same for every host
     if failed_hosts and not dry_run and sudo_password is not None:
-        for h in failed_hosts:
-            r = _ssh.run_remote_sudo_script(
-                h, fallback_script, sudo_password, timeout=timeout, dry_run=dry_run, **ssh_kwargs,
-            )
-            result_map[h] = r
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = min(_ssh.DEFAULT_MAX_CONCURRENCY, len(failed_hosts))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    _ssh.run_remote_sudo_script,
+                    h, fallback_script, sudo_password,
+                    timeout=timeout, dry_run=dry_run, **ssh_kwargs,
+                ): h
+                for h in failed_hosts
+            }
+            for future, h in futures.items():
+                result_map[h] = future.result()
 
     # Return results and hosts that still failed after fallback
     still_failed = [h for h in failed_hosts if h not in result_map or not result_map[h].success]
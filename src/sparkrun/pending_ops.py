@@ -16,9 +16,12 @@ automatically pruned when the pending directory is read.
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
+import signal
+import sys
 import time
 from contextlib import contextmanager
 from pathlib import Path
@@ -89,10 +92,16 @@ def create_pending_op(
     }
 
     path = _lock_path(d, cluster_id, operation)
+    # Write-then-rename so readers never observe a truncated lock — a
+    # crash mid-write leaves only a .tmp file that the .json filter in
+    # list_pending_ops ignores
+    tmp = path.with_name(path.name + ".tmp")
     try:
-        path.write_text(json.dumps(info))
+        tmp.write_text(json.dumps(info, separators=(",", ":")))
+        os.replace(tmp, path)
     except OSError:
         logger.debug("Could not write pending-op lock: %s", path)
+        tmp.unlink(missing_ok=True)
     return path
 
 
@@ -109,6 +118,49 @@ def remove_pending_op(
         logger.debug("Could not remove pending-op lock: %s", path)
 
 
+# Locks currently held by this process, as (cluster_id, operation,
+# cache_dir) tuples.  The finally clause in pending_op covers normal
+# exits and KeyboardInterrupt; the atexit/signal handlers below cover
+# sys.exit and SIGTERM/SIGHUP, which would otherwise leave stale locks
+# for list_pending_ops to prune via the slower pid-liveness path.
+_ACTIVE_OPS: set[tuple[str, str, str | None]] = set()
+_cleanup_installed = False
+
+
+def _cleanup_active_ops() -> None:
+    """Remove all lock files held by this process."""
+    for cluster_id, operation, cache_dir in list(_ACTIVE_OPS):
+        remove_pending_op(cluster_id, operation, cache_dir=cache_dir)
+    _ACTIVE_OPS.clear()
+
+
+def _handle_termination(signum, frame) -> None:
+    _cleanup_active_ops()
+    os._exit(128 + signum)
+
+
+def _install_cleanup_handlers() -> None:
+    """Register atexit and signal cleanup once, on first pending_op use.
+
+    Only signals still at their default disposition are claimed, so a
+    host application with its own handlers keeps them.  SIGINT is left
+    alone: Ctrl-C raises KeyboardInterrupt, which unwinds through the
+    context manager's ``finally`` clause normally.
+    """
+    global _cleanup_installed
+    if _cleanup_installed:
+        return
+    _cleanup_installed = True
+    atexit.register(_cleanup_active_ops)
+    for sig in (signal.SIGTERM, signal.SIGHUP):
+        try:
+            if signal.getsignal(sig) == signal.SIG_DFL:
+                signal.signal(sig, _handle_termination)
+        except (ValueError, OSError):
+            # Non-main thread or platform without the signal
+            pass
+
+
 @contextmanager
 def pending_op(
     cluster_id: str,
@@ -117,13 +169,21 @@ def pending_op(
 ):
     """Context manager that creates a lock on entry and removes it on exit.
 
+    The lock is also removed on interpreter exit and on SIGTERM/SIGHUP
+    (see :func:`_install_cleanup_handlers`), so killed runs rarely leave
+    stale locks behind.
+
     Any keyword arguments are forwarded to :func:`create_pending_op`.
     """
+    _install_cleanup_handlers()
+    cache_dir = kwargs.get("cache_dir")
     create_pending_op(cluster_id, operation, **kwargs)
+    _ACTIVE_OPS.add((cluster_id, operation, cache_dir))
     try:
         yield
     finally:
-        remove_pending_op(cluster_id, operation, cache_dir=kwargs.get("cache_dir"))
+        _ACTIVE_OPS.discard((cluster_id, operation, cache_dir))
+        remove_pending_op(cluster_id, operation, cache_dir=cache_dir)
 
 
 def list_pending_ops(cache_dir: str | None = None) -> list[dict]:
@@ -133,20 +193,37 @@ def list_pending_ops(cache_dir: str | None = None) -> list[dict]:
     running.  Stale locks are silently deleted.
     """
     d = _pending_dir(cache_dir)
-    if not d.is_dir():
+
+    try:
+        entries = [e for e in os.scandir(d) if e.name.endswith(".json")]
+    except OSError:
         return []
 
+    # One /proc listing answers every liveness question on Linux —
+    # cheaper than a kill(0) syscall per lock, and immune to EPERM
+    # confusion on pids owned by other users
+    live_pids: set[str] | None = None
+    if entries and sys.platform == "linux":
+        try:
+            live_pids = set(os.listdir("/proc"))
+        except OSError:
+            live_pids = None
+
     ops: list[dict] = []
-    for path in d.glob("*.json"):
+    for entry in entries:
+        path = Path(entry.path)
         try:
             info = json.loads(path.read_text())
         except (OSError, json.JSONDecodeError):
-            # Corrupt lock — remove it
+            # Locks are published atomically, so a corrupt one is a real
+            # anomaly rather than a benign mid-write race
+            logger.warning("Removing corrupt pending-op lock: %s", path.name)
             path.unlink(missing_ok=True)
             continue
 
         pid = info.get("pid", -1)
-        if not _is_pid_alive(pid):
+        alive = str(pid) in live_pids if live_pids is not None else _is_pid_alive(pid)
+        if not alive:
             # Owning process is gone — stale lock
             logger.debug("Pruning stale pending-op lock: %s (pid %d)", path.name, pid)
             path.unlink(missing_ok=True)
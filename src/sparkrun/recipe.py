@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
 import re
 from os import path as osp
 from pathlib import Path
@@ -28,6 +30,28 @@ _KNOWN_KEYS = {
 }
 
 
+@functools.lru_cache(maxsize=256)
+def _read_recipe_yaml_cached(path: str, mtime_ns: int) -> Any:
+    return read_yaml(path)
+
+
+def _read_recipe_yaml(path: str) -> Any:
+    """Parse a recipe YAML file, memoized on ``(path, mtime)``.
+
+    The same recipe file is parsed repeatedly within one CLI invocation
+    (list, show, and validate each re-read it) and across a test
+    session.  Keying the cache on ``st_mtime_ns`` keeps edited files
+    visible without explicit invalidation.  Callers must treat the
+    returned data as read-only — ``Recipe`` copies the sections it
+    modifies.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return read_yaml(path)
+    return _read_recipe_yaml_cached(path, mtime_ns)
+
+
 def _effective_runtime(data: dict[str, Any]) -> str:
     """Determine the effective runtime from raw recipe data.
 
@@ -221,7 +245,7 @@ class Recipe:
         path = Path(path)
         if not path.exists():
             raise RecipeError("Recipe file not found: %s" % path)
-        data = read_yaml(str(path))
+        data = _read_recipe_yaml(str(path))
         if not isinstance(data, dict):
             raise RecipeError("Recipe file must contain a YAML mapping: %s" % path)
         return cls(data, source_path=str(path))
@@ -330,6 +354,14 @@ class Recipe:
         return "Recipe(name=%r, runtime=%r, model=%r)" % (self.name, self.runtime, self.model)
 
 
+# Resolved recipe locations for this process, keyed on the lookup name
+# plus the user search paths.  Hits are re-validated with a stat, so a
+# deleted recipe never resolves stale; only negative lookups and
+# shadowing (a new file earlier in the search order than a cached hit)
+# wait for a fresh process, which a CLI invocation always is.
+_FIND_CACHE: dict[tuple[str, tuple[str, ...]], Path] = {}
+
+
 def find_recipe(name: str, search_paths: list[Path] | None = None,
                 registry_manager: RegistryManager | None = None) -> Path:
     """Find a recipe by name across search paths.
@@ -339,7 +371,22 @@ def find_recipe(name: str, search_paths: list[Path] | None = None,
     2. Given search paths
     3. Registry paths (if registry_manager provided)
     4. Registry file-stem matching (if registry_manager provided)
+
+    Successful lookups are memoized per process, so repeated resolution
+    of the same name (show, validate, vram in one session) skips the
+    recursive directory walks.
     """
+    cache_key = (name, tuple(str(p) for p in (search_paths or [])))
+    cached = _FIND_CACHE.get(cache_key)
+    if cached is not None and cached.exists():
+        return cached
+    found = _find_recipe_uncached(name, search_paths, registry_manager)
+    _FIND_CACHE[cache_key] = found
+    return found
+
+
+def _find_recipe_uncached(name: str, search_paths: list[Path] | None,
+                          registry_manager: RegistryManager | None) -> Path:
     # 1. Check if it's a direct path
     direct = Path(name)
     if direct.exists():
@@ -422,7 +469,7 @@ def list_recipes(search_paths: list[Path] | None = None,
             if stem not in seen_names:
                 seen_names.add(stem)
                 try:
-                    data = read_yaml(str(f))
+                    data = _read_recipe_yaml(str(f))
                     entry = {
                         "name": data.get("name", stem) if isinstance(data, dict) else stem,
                         "file": stem,
@@ -6,12 +6,19 @@ via :func:`read_script` at runtime.
 
 from __future__ import annotations
 
+import functools
+import string
 from importlib import resources
 
 
+@functools.lru_cache(maxsize=32)
 def read_script(name: str) -> str:
     """Read a bash script from the scripts package.
 
+    Script bodies are immutable package data, so results are cached —
+    multi-model/multi-image runs request the same scripts repeatedly
+    and only the first call touches disk.
+
     Args:
         name: Script filename (e.g. ``"ip_detect.sh"``).
 
@@ -21,6 +28,24 @@ def read_script(name: str) -> str:
     return resources.files(__package__).joinpath(name).read_text(encoding="utf-8")
 
 
+@functools.lru_cache(maxsize=32)
+def read_script_template(name: str) -> string.Template:
+    """Read a bash script and pre-compile it as a :class:`string.Template`.
+
+    Scripts using ``${placeholder}`` markers are parsed once per process
+    instead of re-parsed by ``str.format`` on every render; callers
+    substitute with ``safe_substitute`` so ordinary bash ``$VARIABLES``
+    (and ``$(...)`` constructs) pass through untouched.
+
+    Args:
+        name: Script filename (e.g. ``"model_sync.sh"``).
+
+    Returns:
+        Compiled template of the script content.
+    """
+    return string.Template(read_script(name))
+
+
 def get_script_path(name: str):
     """Return a context manager that yields a filesystem :class:`~pathlib.Path` for a script.
 
@@ -2,30 +2,62 @@
 set -uo pipefail
 
 # Distribute an HF model cache directory from this host to target hosts via rsync.
-# Placeholders filled by Python: {model_path}, {targets}, {ssh_opts}, {ssh_user}
+# Placeholders filled by Python: model_path, targets, ssh_opts, ssh_user, rsync_flags.
+# Targets are newline-delimited (never word-split), and rsyncs fan out with
+# bounded parallelism so large clusters overlap transfers without tripping
+# sshd's MaxStartups connection-drop threshold.
 
-MODEL_PATH="{model_path}"
-TARGETS="{targets}"
-SSH_OPTS="{ssh_opts}"
-SSH_USER="{ssh_user}"
+MODEL_PATH="${model_path}"
+TARGETS="${targets}"
+SSH_OPTS="${ssh_opts}"
+SSH_USER="${ssh_user}"
+RSYNC_FLAGS="${rsync_flags}"
+MAX_PARALLEL=8
 
-echo "Distributing model $MODEL_PATH to targets: $TARGETS"
+# Python omits the zstd flags because it cannot know this host's rsync
+# version; append them here when the local rsync advertises zstd support.
+if rsync --version 2>/dev/null | grep -qi zstd; then
+    RSYNC_FLAGS="$RSYNC_FLAGS --compress-choice=zstd --compress-level=1"
+fi
+
+echo "Distributing model $MODEL_PATH to targets:"
+printf '%s\n' "$TARGETS"
+
+FAILED_FILE=$(mktemp)
 
-FAILED=0
-for TARGET in $TARGETS; do
+sync_one() (
+    TARGET="$1"
     if [ -n "$SSH_USER" ]; then
         DEST="$SSH_USER@$TARGET:$MODEL_PATH/"
     else
         DEST="$TARGET:$MODEL_PATH/"
     fi
     echo "  Syncing $MODEL_PATH -> $TARGET ..."
-    if rsync -az --partial --links -e "ssh $SSH_OPTS" "$MODEL_PATH/" "$DEST"; then
+    # RSYNC_FLAGS is intentionally unquoted: it is a space-separated flag list
+    if rsync $RSYNC_FLAGS -e "ssh $SSH_OPTS" "$MODEL_PATH/" "$DEST"; then
         echo "  OK: $TARGET"
     else
         echo "  FAILED: $TARGET" >&2
-        FAILED=$((FAILED + 1))
+        echo "$TARGET" >> "$FAILED_FILE"
     fi
-done
+)
+
+ACTIVE=0
+while IFS= read -r TARGET; do
+    [ -n "$TARGET" ] || continue
+    sync_one "$TARGET" &
+    ACTIVE=$((ACTIVE + 1))
+    if [ "$ACTIVE" -ge "$MAX_PARALLEL" ]; then
+        wait -n
+        ACTIVE=$((ACTIVE - 1))
+    fi
+done <<EOF
+$TARGETS
+EOF
+wait
+
+FAILED=$(wc -l < "$FAILED_FILE")
+rm -f "$FAILED_FILE"
 
 if [ "$FAILED" -gt 0 ]; then
     echo "ERROR: $FAILED target(s) failed" >&2
@@ -1,8 +1,8 @@
 #!/bin/bash
 set -uo pipefail
-echo "Checking model cache for {model_id}..."
-SAFE_NAME=$(echo "{model_id}" | tr '/' '--')
-CACHE_PATH="{cache}/hub/models--$SAFE_NAME"
+echo "Checking model cache for ${model_id}..."
+SAFE_NAME=$(echo "${model_id}" | tr '/' '--')
+CACHE_PATH="${cache}/hub/models--$SAFE_NAME"
 
 # Check for actual weight files (not just config.json from VRAM auto-detect)
 FOUND_WEIGHTS=false
@@ -16,13 +16,19 @@ if [ -d "$CACHE_PATH/snapshots" ]; then
 fi
 
 if [ "$FOUND_WEIGHTS" = true ]; then
-    echo "Model already cached: {model_id}"
+    echo "Model already cached: ${model_id}"
     exit 0
 fi
 
-echo "Downloading model: {model_id}..."
+echo "Downloading model: ${model_id}..."
+# Use the Rust hf_transfer backend when this host has it installed
+# (chunked multi-connection downloads; the CLI errors out if the flag
+# is set without the package)
+if python3 -c 'import hf_transfer' 2>/dev/null; then
+    export HF_HUB_ENABLE_HF_TRANSFER=1
+fi
 if command -v huggingface-cli &>/dev/null; then
-    huggingface-cli download "{model_id}" {revision_flag}--cache-dir "{cache}/hub"
+    huggingface-cli download "${model_id}" ${revision_flag}--max-workers ${max_workers} --cache-dir "${cache}/hub"
 else
     echo "ERROR: huggingface-cli not available on this host" >&2
     exit 1
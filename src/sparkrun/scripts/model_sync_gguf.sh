@@ -1,21 +1,27 @@
 #!/bin/bash
 set -uo pipefail
-echo "Checking GGUF model cache for {repo_id} (quant: {quant})..."
-SAFE_NAME=$(echo "{repo_id}" | tr '/' '--')
-CACHE_PATH="{cache}/hub/models--$SAFE_NAME"
+echo "Checking GGUF model cache for ${repo_id} (quant: ${quant})..."
+SAFE_NAME=$(echo "${repo_id}" | tr '/' '--')
+CACHE_PATH="${cache}/hub/models--$SAFE_NAME"
 
 # Check if GGUF file matching quant already exists
 if [ -d "$CACHE_PATH/snapshots" ]; then
-    MATCH=$(find "$CACHE_PATH/snapshots" -name "*{quant}*.gguf" -print -quit 2>/dev/null)
+    MATCH=$(find "$CACHE_PATH/snapshots" -name "*${quant}*.gguf" -print -quit 2>/dev/null)
     if [ -n "$MATCH" ]; then
         echo "GGUF model already cached: $MATCH"
         exit 0
     fi
 fi
 
-echo "Downloading GGUF model: {repo_id} (quant: {quant})..."
+echo "Downloading GGUF model: ${repo_id} (quant: ${quant})..."
+# Use the Rust hf_transfer backend when this host has it installed
+# (chunked multi-connection downloads; the CLI errors out if the flag
+# is set without the package)
+if python3 -c 'import hf_transfer' 2>/dev/null; then
+    export HF_HUB_ENABLE_HF_TRANSFER=1
+fi
 if command -v huggingface-cli &>/dev/null; then
-    huggingface-cli download "{repo_id}" --include "*{quant}*" {revision_flag}--cache-dir "{cache}/hub"
+    huggingface-cli download "${repo_id}" --include "*${quant}*" ${revision_flag}--max-workers ${max_workers} --cache-dir "${cache}/hub"
 else
     echo "ERROR: huggingface-cli not available on this host" >&2
     exit 1
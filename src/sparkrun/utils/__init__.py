@@ -6,6 +6,8 @@ Keeping them here avoids circular imports and reduces duplication.
 
 from __future__ import annotations
 import logging
+import re
+import socket
 
 # Loggers that produce excessive output at DEBUG/INFO level.
 _NOISY_LOGGERS = (
@@ -22,20 +24,26 @@ def suppress_noisy_loggers() -> None:
         logging.getLogger(name).setLevel(logging.WARNING)
 
 
+_TRUE_STRINGS = frozenset(("true", "yes"))
+_FALSE_STRINGS = frozenset(("false", "no"))
+# Numeric pre-filters: a fullmatch guarantees int()/float() succeed, so
+# the common non-numeric case never pays for a raised-and-caught
+# ValueError (exceptions as control flow are expensive in CPython)
+_INT_RE = re.compile(r"[+-]?\d+")
+_FLOAT_RE = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?")
+
+
 def coerce_value(value: str):
     """Coerce a string value to int, float, or bool where possible."""
-    if value.lower() in ("true", "yes"):
+    v = value.lower()
+    if v in _TRUE_STRINGS:
         return True
-    if value.lower() in ("false", "no"):
+    if v in _FALSE_STRINGS:
         return False
-    try:
+    if _INT_RE.fullmatch(value):
         return int(value)
-    except ValueError:
-        pass
-    try:
+    if _FLOAT_RE.fullmatch(value):
         return float(value)
-    except ValueError:
-        pass
     return value
 
 
@@ -46,18 +54,34 @@ def resolve_ssh_user(cluster_user: str | None, config, fallback: str = "root") -
 
 
 def is_valid_ip(ip: str) -> bool:
-    """Basic check if a string looks like an IPv4 address."""
-    parts = ip.strip().split(".")
-    if len(parts) != 4:
+    """Basic check if a string looks like an IPv4 address.
+
+    Validation runs in a single native ``inet_aton`` call; the dot
+    count rejects the shorthand forms (``"10.1"``) that ``inet_aton``
+    itself accepts.
+    """
+    ip = ip.strip()
+    try:
+        socket.inet_aton(ip)
+    except OSError:
         return False
-    return all(p.isdigit() and 0 <= int(p) <= 255 for p in parts)
+    return ip.count(".") == 3
+
+
+# One pass over the whole buffer in the C regex engine: skip comment
+# lines, split on the first "=", and trim whitespace around key and
+# value — equivalent to the per-line strip/startswith/partition loop
+# but without interpreter dispatch per line.  The leading whitespace
+# match is possessive so it cannot backtrack past the (?!#) lookahead
+# and admit an indented comment line as a key=value pair.
+_KV_RE = re.compile(r"(?m)^[ \t]*+(?!#)([^=\r\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$")
 
 
 def parse_kv_output(output: str) -> dict[str, str]:
     """Parse key=value lines from script output.
 
     Lines starting with ``#`` are ignored. Leading/trailing whitespace
-    on keys and values is stripped.
+    on keys and values is stripped. Later duplicates win.
 
     Args:
         output: Raw stdout containing key=value lines.
@@ -65,19 +89,22 @@ def parse_kv_output(output: str) -> dict[str, str]:
     Returns:
         Dictionary of parsed key=value pairs.
     """
-    result: dict[str, str] = {}
-    for line in output.strip().splitlines():
-        line = line.strip()
-        if "=" in line and not line.startswith("#"):
-            key, _, value = line.partition("=")
-            result[key.strip()] = value.strip()
-    return result
+    return dict(_KV_RE.findall(output))
 
 
 def load_yaml(path) -> dict:
-    """Load a YAML file, returning an empty dict on parse failure."""
+    """Load a YAML file, returning an empty dict on parse failure.
+
+    Uses the libyaml C loader when PyYAML was built with it (plain
+    ``safe_load`` always takes the pure-Python tokenizer).  The file is
+    opened in binary mode so libyaml handles the UTF-8 decoding itself.
+    """
     from pathlib import Path as _Path
     import yaml
-    with _Path(path).open() as f:
-        data = yaml.safe_load(f)
+    try:
+        from yaml import CSafeLoader as _Loader
+    except ImportError:
+        from yaml import SafeLoader as _Loader
+    with _Path(path).open("rb") as f:
+        data = yaml.load(f, Loader=_Loader)
     return data if isinstance(data, dict) else {}
@@ -12,6 +12,28 @@ import yaml
 from sparkrun.bootstrap import init_sparkrun
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow", action="store_true", default=False,
+        help="run tests marked slow (full CLI run-command pipelines)",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: slow end-to-end test, skipped unless --run-slow is given",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test — pass --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 @pytest.fixture(autouse=True)
 def isolate_stateful(tmp_path: Path, monkeypatch):
     """Redirect SAF stateful root to temp dir for test isolation.
@@ -26,6 +48,20 @@ def isolate_stateful(tmp_path: Path, monkeypatch):
     sparkrun.bootstrap._variables = None
 
 
+@pytest.fixture
+def patched_config_dir(tmp_path: Path, monkeypatch) -> Path:
+    """Create an isolated config root and point DEFAULT_CONFIG_DIR at it.
+
+    Replaces the mkdir + import + monkeypatch.setattr boilerplate that
+    CLI tests otherwise repeat inline.
+    """
+    import sparkrun.config
+    config_root = tmp_path / "config"
+    config_root.mkdir()
+    monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
+    return config_root
+
+
 @pytest.fixture
 def cluster_dir(tmp_path: Path) -> Path:
     """Return a temporary directory for cluster definitions."""
@@ -6,94 +6,196 @@ with the main group command.
 
 from __future__ import annotations
 
+import functools
 from unittest import mock
 
+import click
 import pytest
 from click.testing import CliRunner
 
+from sparkrun.bootstrap import init_sparkrun
 from sparkrun.cli import main
-from sparkrun.runtimes.sglang import SglangRuntime
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
-    """Create a CliRunner instance."""
+    """Create a CliRunner instance.
+
+    Session-scoped: CliRunner keeps no state between invocations (each
+    invoke builds its own isolated environment), so one instance serves
+    every test.
+    """
     return CliRunner()
 
 
+@pytest.fixture(scope="session")
+def session_v(tmp_path_factory):
+    """Initialize sparkrun once for the whole test session.
+
+    Bootstrap (plugin discovery, recipe scanning) dominates the cost of
+    the CLI tests, and none of them mutate the Variables instance — so a
+    single initialization, done OUTSIDE the CliRunner context (where
+    faulthandler.enable() works with real file descriptors), serves all
+    of them.
+    """
+    import sparkrun.bootstrap
+    with pytest.MonkeyPatch.context() as m:
+        m.setenv("STATEFUL_ROOT", str(tmp_path_factory.mktemp("stateful")))
+        sparkrun.bootstrap._variables = None
+        v = init_sparkrun(log_level="WARNING")
+    yield v
+    sparkrun.bootstrap._variables = None
+
+
 @pytest.fixture
-def reset_bootstrap(v):
+def reset_bootstrap(session_v):
     """Ensure sparkrun is initialized before CLI tests that call init_sparkrun().
 
-    By depending on the 'v' fixture, sparkrun is initialized OUTSIDE the
-    CliRunner context (where faulthandler.enable() works with real file
-    descriptors). The CLI command's init_sparkrun() call then reuses the
-    existing singleton instead of re-initializing.
+    The autouse isolate_stateful fixture clears the bootstrap singleton
+    before each test; restoring the shared session instance here makes
+    the CLI command's init_sparkrun() call a no-op instead of a full
+    re-initialization per test.
     """
+    import sparkrun.bootstrap
+    sparkrun.bootstrap._variables = session_v
     yield
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _warm_cli(runner):
+    """Warm Click's command tree and the runtime modules once per session.
+
+    The first subcommand invocation otherwise pays the lazy-import cost
+    of the runtime plugins; under pytest-xdist this fixture runs once
+    per worker, so every worker warms itself exactly once.
+    """
+    runner.invoke(main, ["--help"])
+    from sparkrun.runtimes import sglang, vllm  # noqa: F401
+
+
+def _invoke_direct(args, capsys) -> tuple[int, str]:
+    """Invoke the CLI in-process, without CliRunner.
+
+    ``standalone_mode=False`` skips CliRunner's isolated environment,
+    stream redirection, and exception-to-result translation — the
+    command's click.echo output lands on the real streams where capsys
+    captures it. Only suitable for commands that never prompt.
+    """
+    try:
+        main.main(args=list(args), standalone_mode=False)
+        rc = 0
+    except SystemExit as e:
+        rc = e.code if isinstance(e.code, int) else 1
+    except click.ClickException as e:
+        e.show()
+        rc = e.exit_code
+    captured = capsys.readouterr()
+    return rc, captured.out + captured.err
+
+
+@functools.lru_cache(maxsize=None)
+def _command_help(name: str | None = None) -> str:
+    """Render a command's --help text without going through CliRunner.
+
+    Help text is static, so building a bare Context skips argument
+    parsing, output capture, and exception trapping per invocation —
+    and the cache renders each command's help at most once per session.
+    """
+    cmd = main.commands[name] if name else main
+    info_name = "sparkrun %s" % name if name else "sparkrun"
+    return cmd.get_help(click.Context(cmd, info_name=info_name))
+
+
 class TestVersionAndHelp:
     """Test version and help output."""
 
     def test_version(self, runner):
-        """Test that sparkrun --version shows version string."""
+        """Test that sparkrun --version shows version string.
+
+        Kept on the runner as the one end-to-end guard for the static
+        text paths; the help tests below check rendered strings directly.
+        """
         result = runner.invoke(main, ["--version"])
         assert result.exit_code == 0
         assert "sparkrun, version " in result.output
 
-    def test_help(self, runner):
+    def test_help(self):
         """Test that sparkrun --help shows group help text with command names."""
-        result = runner.invoke(main, ["--help"])
-        assert result.exit_code == 0
-        assert "sparkrun" in result.output.lower()
-        # Check for main commands
-        assert "run" in result.output
-        assert "list" in result.output
-        assert "show" in result.output
-        assert "search" in result.output
-        assert "stop" in result.output
-        assert "logs" in result.output
-
-    def test_run_help(self, runner):
+        output = _command_help()
+        assert "sparkrun" in output.lower()
+        # Command names appear as whole tokens in the listing; one split
+        # and a set-membership check replaces a scan per command name
+        needed = {"run", "list", "show", "search", "stop", "logs"}
+        assert needed <= set(output.split())
+
+    def test_run_help(self):
         """Test that sparkrun run --help shows run command help."""
-        result = runner.invoke(main, ["run", "--help"])
-        assert result.exit_code == 0
-        assert "Run an inference recipe" in result.output
-        assert "--solo" in result.output
-        assert "--hosts" in result.output
-        assert "--dry-run" in result.output
-        assert "--cluster-id" not in result.output
+        output = _command_help("run")
+        assert "Run an inference recipe" in output
+        assert "--solo" in output
+        assert "--hosts" in output
+        assert "--dry-run" in output
+        assert "--cluster-id" not in output
+
+
+@pytest.fixture(scope="session")
+def list_output(runner, session_v):
+    """Result of one `sparkrun list` invocation, shared for the session.
+
+    Every list invocation walks the bundled-recipes directory and parses
+    each YAML; the tests below only assert on the captured output, so
+    one invocation serves them all.
+    """
+    import sparkrun.bootstrap
+    sparkrun.bootstrap._variables = session_v
+    return runner.invoke(main, ["list"])
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_recipe_cache(list_output):
+    """Warm the memoized recipe-YAML parser before the first test.
+
+    One list invocation parses every bundled recipe; subsequent CLI
+    invocations across the session hit the (path, mtime) cache in
+    sparkrun.recipe instead of re-parsing.
+    """
+    return list_output
+
+
+@pytest.fixture(scope="session")
+def show_output(runner, session_v):
+    """Result of one `sparkrun show` invocation, shared for the session."""
+    import sparkrun.bootstrap
+    sparkrun.bootstrap._variables = session_v
+    return runner.invoke(main, ["show", "qwen3-coder-next-fp8-sglang-cluster"])
 
 
 class TestListCommand:
     """Test the list command."""
 
-    def test_list_shows_recipes(self, runner):
+    def test_list_shows_recipes(self, list_output):
         """Test that sparkrun list discovers recipes from the recipes/ directory."""
-        result = runner.invoke(main, ["list"])
-        assert result.exit_code == 0
-        output_lower = result.output.lower()
+        assert list_output.exit_code == 0
+        output_lower = list_output.output.lower()
         assert "qwen3-coder-next-fp8-sglang-cluster" in output_lower
 
-    def test_list_table_format(self, runner):
+    def test_list_table_format(self, list_output):
         """Test that list output has header with Name, Runtime, File columns."""
-        result = runner.invoke(main, ["list"])
-        assert result.exit_code == 0
+        assert list_output.exit_code == 0
         # Check for table headers
-        assert "Name" in result.output
-        assert "Runtime" in result.output
-        assert "File" in result.output
+        assert "Name" in list_output.output
+        assert "Runtime" in list_output.output
+        assert "File" in list_output.output
         # Check for separator line
-        assert "-" * 10 in result.output
+        assert "-" * 10 in list_output.output
 
 
 class TestShowCommand:
     """Test the show command."""
 
-    def test_show_recipe(self, runner):
+    def test_show_recipe(self, show_output):
         """Test that sparkrun show displays recipe details with VRAM."""
-        result = runner.invoke(main, ["show", "qwen3-coder-next-fp8-sglang-cluster"])
+        result = show_output
         assert result.exit_code == 0
         # Check for recipe detail fields
         assert "Name:" in result.output
@@ -106,52 +208,49 @@ class TestShowCommand:
         # VRAM estimation shown by default
         assert "VRAM Estimation" in result.output
 
-    def test_show_nonexistent_recipe(self, runner):
+    def test_show_nonexistent_recipe(self, capsys, reset_bootstrap):
         """Test that sparkrun show nonexistent-recipe exits with error code."""
-        result = runner.invoke(main, ["show", "nonexistent-recipe"])
-        assert result.exit_code != 0
-        assert "Error" in result.output
+        rc, output = _invoke_direct(["show", "nonexistent-recipe"], capsys)
+        assert rc != 0
+        assert "Error" in output
 
 
 class TestVramCommand:
     """Test the vram command."""
 
-    def test_vram_recipe(self, runner):
-        """Test sparkrun recipe vram shows estimation."""
-        result = runner.invoke(main, ["recipe", "vram", "qwen3-coder-next-fp8-sglang-cluster", "--no-auto-detect"])
-        assert result.exit_code == 0
-        assert "VRAM Estimation" in result.output
-        assert "Model weights:" in result.output
-        assert "Per-GPU total:" in result.output
-        assert "DGX Spark fit:" in result.output
-
-    def test_vram_with_gpu_mem(self, runner):
-        """Test sparkrun recipe vram with --gpu-mem shows budget analysis."""
+    @pytest.mark.parametrize("extra_args, expected_substrings", [
+        pytest.param(
+            [],
+            ["VRAM Estimation", "Model weights:", "Per-GPU total:", "DGX Spark fit:"],
+            id="default",
+        ),
+        pytest.param(
+            ["--gpu-mem", "0.9"],
+            ["GPU Memory Budget", "gpu_memory_utilization", "Available for KV"],
+            id="gpu-mem",
+        ),
+        pytest.param(
+            ["--tp", "4"],
+            ["Tensor parallel:  4"],
+            id="tp",
+        ),
+    ])
+    def test_vram(self, runner, extra_args, expected_substrings):
+        """Test sparkrun recipe vram happy paths: default, --gpu-mem, --tp."""
         result = runner.invoke(main, [
             "recipe", "vram", "qwen3-coder-next-fp8-sglang-cluster",
             "--no-auto-detect",
-            "--gpu-mem", "0.9",
+            *extra_args,
         ])
         assert result.exit_code == 0
-        assert "GPU Memory Budget" in result.output
-        assert "gpu_memory_utilization" in result.output
-        assert "Available for KV" in result.output
+        for substring in expected_substrings:
+            assert substring in result.output
 
-    def test_vram_with_tp(self, runner):
-        """Test sparkrun recipe vram with --tp override."""
-        result = runner.invoke(main, [
-            "recipe", "vram", "qwen3-coder-next-fp8-sglang-cluster",
-            "--no-auto-detect",
-            "--tp", "4",
-        ])
-        assert result.exit_code == 0
-        assert "Tensor parallel:  4" in result.output
-
-    def test_vram_nonexistent_recipe(self, runner):
+    def test_vram_nonexistent_recipe(self, capsys, reset_bootstrap):
         """Test sparkrun recipe vram on nonexistent recipe exits with error."""
-        result = runner.invoke(main, ["recipe", "vram", "nonexistent-recipe"])
-        assert result.exit_code != 0
-        assert "Error" in result.output
+        rc, output = _invoke_direct(["recipe", "vram", "nonexistent-recipe"], capsys)
+        assert rc != 0
+        assert "Error" in output
 
     def test_show_no_vram_flag(self, runner):
         """Test sparkrun show --no-vram suppresses VRAM estimation."""
@@ -169,230 +268,223 @@ class TestValidateCommand:
         assert result.exit_code == 0
         assert "is valid" in result.output
 
-    def test_validate_nonexistent_recipe(self, runner, reset_bootstrap):
+    def test_validate_nonexistent_recipe(self, capsys, reset_bootstrap):
         """Test that sparkrun recipe validate nonexistent-recipe exits with error."""
-        result = runner.invoke(main, ["recipe", "validate", "nonexistent-recipe"])
-        assert result.exit_code != 0
-        assert "Error" in result.output
+        rc, output = _invoke_direct(["recipe", "validate", "nonexistent-recipe"], capsys)
+        assert rc != 0
+        assert "Error" in output
+
+
+@pytest.fixture(scope="class")
+def stub_runtime_run():
+    """Stub SglangRuntime.run with one shared MagicMock per test class.
+
+    Installing the patch once per class replaces the per-test
+    patch/unpatch cycle (and MagicMock construction) of the old
+    mock.patch.object context managers. Tests reset the mock before
+    invoking so call assertions stay per-test.
+    """
+    stub = mock.MagicMock(return_value=0)
+    with mock.patch("sparkrun.runtimes.sglang.SglangRuntime.run", stub):
+        yield stub
 
 
 class TestRunCommand:
     """Test the run command (dry-run only)."""
 
-    def test_run_dry_run_solo(self, runner, reset_bootstrap):
+    pytestmark = pytest.mark.slow
+
+    def test_run_dry_run_solo(self, runner, reset_bootstrap, stub_runtime_run):
         """Test sparkrun run --solo --dry-run --hosts localhost.
 
         Should show runtime info and exit 0.
         """
-        # Mock runtime.run() to prevent actual SSH execution
-        with mock.patch.object(SglangRuntime, "run", return_value=0) as mock_run:
-            result = runner.invoke(main, [
-                "run",
-                "qwen3-coder-next-fp8-sglang-cluster",
-                "--solo",
-                "--dry-run",
-                "--hosts",
-                "localhost",
-            ])
-
-            assert result.exit_code == 0
-            # Check that runtime info is displayed
-            assert "Runtime:" in result.output
-            assert "Image:" in result.output
-            assert "Model:" in result.output
-            assert "Mode:" in result.output
-            assert "solo" in result.output.lower()
-
-            # Verify runtime.run() was called with dry_run=True
-            mock_run.assert_called_once()
-            call_kwargs = mock_run.call_args.kwargs
-            assert call_kwargs["dry_run"] is True
-            # Cluster ID should be deterministic, not the old default
-            assert call_kwargs["cluster_id"].startswith("sparkrun_")
-            assert call_kwargs["cluster_id"] != "sparkrun0"
-
-    def test_run_nonexistent_recipe(self, runner, reset_bootstrap):
-        """Test that sparkrun run nonexistent-recipe --solo --dry-run exits with error."""
+        stub_runtime_run.reset_mock()
         result = runner.invoke(main, [
             "run",
-            "nonexistent-recipe",
+            "qwen3-coder-next-fp8-sglang-cluster",
             "--solo",
             "--dry-run",
+            "--hosts",
+            "localhost",
         ])
 
-        assert result.exit_code != 0
-        assert "Error" in result.output
-
-
-class TestStopCommand:
-    """Test the stop command."""
-
-    def test_stop_no_hosts_error(self, runner, tmp_path, monkeypatch):
-        """Test that sparkrun stop with no hosts specified exits with error."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
-
-        result = runner.invoke(main, [
-            "stop",
-            "qwen3-coder-next-fp8-sglang-cluster",
-        ])
+        assert result.exit_code == 0
+        # Check that runtime info is displayed
+        assert "Runtime:" in result.output
+        assert "Image:" in result.output
+        assert "Model:" in result.output
+        assert "Mode:" in result.output
+        assert "solo" in result.output.lower()
+
+        # Verify runtime.run() was called with dry_run=True
+        stub_runtime_run.assert_called_once()
+        call_kwargs = stub_runtime_run.call_args.kwargs
+        assert call_kwargs["dry_run"] is True
+        # Cluster ID should be deterministic, not the old default
+        assert call_kwargs["cluster_id"].startswith("sparkrun_")
+        assert call_kwargs["cluster_id"] != "sparkrun0"
+
+    def test_run_nonexistent_recipe(self, capsys, reset_bootstrap):
+        """Test that sparkrun run nonexistent-recipe --solo --dry-run exits with error."""
+        rc, output = _invoke_direct(["run", "nonexistent-recipe", "--solo", "--dry-run"], capsys)
+        assert rc != 0
+        assert "Error" in output
+
+
+@pytest.mark.parametrize("cmd, expected", [
+    pytest.param(
+        ["stop", "qwen3-coder-next-fp8-sglang-cluster"],
+        ("hosts", "error"), id="stop-no-hosts",
+    ),
+    pytest.param(
+        ["logs", "qwen3-coder-next-fp8-sglang-cluster"],
+        ("hosts", "error"), id="logs-no-hosts",
+    ),
+    pytest.param(
+        ["setup", "ssh", "--no-include-self"],
+        ("no hosts",), id="setup-ssh-no-hosts",
+    ),
+    pytest.param(
+        ["setup", "ssh", "--hosts", "10.0.0.1", "--no-include-self"],
+        ("at least 2 hosts",), id="setup-ssh-one-host",
+    ),
+    pytest.param(
+        ["setup", "fix-permissions"],
+        ("hosts", "error"), id="fix-permissions-no-hosts",
+    ),
+    pytest.param(
+        ["setup", "clear-cache"],
+        ("hosts", "error"), id="clear-cache-no-hosts",
+    ),
+])
+def test_no_hosts_errors(runner, reset_bootstrap, tmp_path_factory, cmd, expected):
+    """Commands that need hosts exit with an error when none are resolvable.
+
+    One parametrized test with inline MonkeyPatch.context scaffolding —
+    batching these identical error-path checks resolves far fewer
+    fixtures than a function (and config root) per command.
+    """
+    import sparkrun.config
+    with pytest.MonkeyPatch.context() as m:
+        config_root = tmp_path_factory.mktemp("cfg")
+        m.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
+        result = runner.invoke(main, cmd)
 
-        assert result.exit_code != 0
-        # Check error message mentions hosts
-        assert "hosts" in result.output.lower() or "Error" in result.output
+    assert result.exit_code != 0
+    output_lower = result.output.lower()
+    assert any(s in output_lower for s in expected), \
+        "none of %r in output: %s" % (expected, result.output)
 
 
 class TestClusterCommands:
     """Test cluster subcommands: create, list, show, delete, set-default, unset-default, update."""
 
-    @pytest.fixture
-    def cluster_setup(self, tmp_path, monkeypatch):
-        """Set up a config root with a test cluster for CLI tests."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def cluster_config_root(tmp_path_factory):
+        """Class-scoped config root — one tree and one DEFAULT_CONFIG_DIR
+        patch shared by every test in the class."""
+        config_root = tmp_path_factory.mktemp("config")
         import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
+        with pytest.MonkeyPatch.context() as m:
+            m.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
+            yield config_root
+
+    @pytest.fixture
+    def cluster_setup(self, cluster_config_root):
+        """Ensure the canonical test cluster exists with its original hosts.
+
+        Resetting a couple of YAML files per test is cheap; the expensive
+        parts (tmp dir, monkeypatch, ClusterManager import) live in the
+        class-scoped cluster_config_root, so mutating cases (create,
+        delete, update, set-default) cannot leak into each other.
+        """
         from sparkrun.cluster_manager import ClusterManager
-        mgr = ClusterManager(config_root)
+        mgr = ClusterManager(cluster_config_root)
+        for stale in mgr.clusters_dir.glob("*.yaml"):
+            stale.unlink()
+        mgr.unset_default()
         mgr.create("test-cluster", ["10.0.0.1", "10.0.0.2"])
-        return config_root
+        return cluster_config_root
 
-    def test_cluster_help(self, runner):
+    def test_cluster_help(self):
         """Test that sparkrun cluster --help shows subcommands."""
-        result = runner.invoke(main, ["cluster", "--help"])
-        assert result.exit_code == 0
-        # Check for cluster subcommands
-        assert "create" in result.output
-        assert "list" in result.output
-        assert "show" in result.output
-        assert "delete" in result.output
-        assert "default" in result.output
-        assert "set-default" in result.output
-        assert "unset-default" in result.output
-        assert "update" in result.output
-
-    def test_cluster_create(self, runner, tmp_path, monkeypatch):
-        """Test creating a cluster."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
-
-        result = runner.invoke(main, [
-            "cluster",
-            "create",
-            "my-cluster",
-            "--hosts",
-            "host1,host2,host3",
-        ])
-
-        assert result.exit_code == 0
-        assert "created" in result.output.lower()
-
-    def test_cluster_create_duplicate(self, runner, cluster_setup):
-        """Test that creating a duplicate cluster fails."""
-        result = runner.invoke(main, [
-            "cluster",
-            "create",
-            "test-cluster",
-            "--hosts",
-            "host4,host5",
-        ])
-
-        assert result.exit_code != 0
-        assert "exists" in result.output.lower() or "Error" in result.output
-
-    def test_cluster_list_empty(self, runner, tmp_path, monkeypatch):
-        """Test that cluster list with no clusters shows appropriate message."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
-
-        result = runner.invoke(main, ["cluster", "list"])
-
-        assert result.exit_code == 0
-        assert "No saved clusters" in result.output or "no clusters" in result.output.lower()
-
-    def test_cluster_list_with_clusters(self, runner, cluster_setup):
-        """Test that cluster list shows created clusters."""
-        result = runner.invoke(main, ["cluster", "list"])
-
-        assert result.exit_code == 0
-        assert "test-cluster" in result.output
-
-    def test_cluster_show(self, runner, cluster_setup):
-        """Test showing cluster details."""
-        result = runner.invoke(main, ["cluster", "show", "test-cluster"])
-
-        assert result.exit_code == 0
-        assert "test-cluster" in result.output
-        assert "10.0.0.1" in result.output
-        assert "10.0.0.2" in result.output
-
-    def test_cluster_show_nonexistent(self, runner, cluster_setup):
-        """Test that showing a nonexistent cluster fails."""
-        result = runner.invoke(main, ["cluster", "show", "nonexistent"])
-
-        assert result.exit_code != 0
-        assert "Error" in result.output or "not found" in result.output.lower()
-
-    def test_cluster_delete(self, runner, cluster_setup):
-        """Test deleting a cluster with --force flag."""
-        result = runner.invoke(main, [
-            "cluster",
-            "delete",
-            "test-cluster",
-            "--force",
-        ])
-
-        assert result.exit_code == 0
-        assert "deleted" in result.output.lower()
-
-    def test_cluster_set_default(self, runner, cluster_setup):
-        """Test setting a default cluster."""
-        result = runner.invoke(main, [
-            "cluster",
-            "set-default",
-            "test-cluster",
-        ])
-
-        assert result.exit_code == 0
-        assert "Default cluster set" in result.output or "default" in result.output.lower()
-
-    def test_cluster_unset_default(self, runner, cluster_setup):
-        """Test unsetting the default cluster."""
-        # First set a default
-        runner.invoke(main, ["cluster", "set-default", "test-cluster"])
-
-        # Now unset it
-        result = runner.invoke(main, ["cluster", "unset-default"])
-
-        assert result.exit_code == 0
-        assert "Default cluster unset" in result.output or "unset" in result.output.lower()
+        output = _command_help("cluster")
+        # Subcommand names appear as whole tokens in the listing
+        needed = {"create", "list", "show", "delete", "set-default", "unset-default", "update"}
+        assert needed <= set(output.split())
+
+    # (pre-invocations, args, expect_success, required substrings) — each
+    # entry in the last field is a tuple of case-insensitive alternatives,
+    # all of which must match somewhere in the output.
+    CRUD_CASES = [
+        pytest.param(
+            [], ["cluster", "create", "my-cluster", "--hosts", "host1,host2,host3"],
+            True, [("created",)], id="create",
+        ),
+        pytest.param(
+            [], ["cluster", "create", "test-cluster", "--hosts", "host4,host5"],
+            False, [("exists", "error")], id="create-duplicate",
+        ),
+        pytest.param(
+            [["cluster", "delete", "test-cluster", "--force"]], ["cluster", "list"],
+            True, [("no saved clusters", "no clusters")], id="list-empty",
+        ),
+        pytest.param(
+            [], ["cluster", "list"],
+            True, [("test-cluster",)], id="list-with-clusters",
+        ),
+        pytest.param(
+            [], ["cluster", "show", "test-cluster"],
+            True, [("test-cluster",), ("10.0.0.1",), ("10.0.0.2",)], id="show",
+        ),
+        pytest.param(
+            [], ["cluster", "show", "nonexistent"],
+            False, [("error", "not found")], id="show-nonexistent",
+        ),
+        pytest.param(
+            [], ["cluster", "delete", "test-cluster", "--force"],
+            True, [("deleted",)], id="delete",
+        ),
+        pytest.param(
+            [], ["cluster", "set-default", "test-cluster"],
+            True, [("default",)], id="set-default",
+        ),
+        pytest.param(
+            [["cluster", "set-default", "test-cluster"]], ["cluster", "unset-default"],
+            True, [("unset",)], id="unset-default",
+        ),
+        pytest.param(
+            [], ["cluster", "update", "test-cluster", "--hosts", "10.0.0.3,10.0.0.4"],
+            True, [("updated",)], id="update",
+        ),
+    ]
+
+    @pytest.mark.parametrize("pre, args, expect_success, expected", CRUD_CASES)
+    def test_cluster_crud(self, capsys, cluster_setup, pre, args, expect_success, expected):
+        """Exercise the cluster create/list/show/delete/default/update chain.
+
+        Invoked in-process via _invoke_direct — none of these commands
+        prompt, and skipping CliRunner's per-invocation setup keeps the
+        ten cases cheap.
+        """
+        for p in pre:
+            _invoke_direct(p, capsys)
 
-    def test_cluster_update(self, runner, cluster_setup):
-        """Test updating cluster hosts."""
-        result = runner.invoke(main, [
-            "cluster",
-            "update",
-            "test-cluster",
-            "--hosts",
-            "10.0.0.3,10.0.0.4",
-        ])
+        exit_code, output = _invoke_direct(args, capsys)
 
-        assert result.exit_code == 0
-        assert "updated" in result.output.lower()
+        if expect_success:
+            assert exit_code == 0
+        else:
+            assert exit_code != 0
+        output_lower = output.lower()
+        for alternatives in expected:
+            assert any(s in output_lower for s in alternatives), \
+                "none of %r in output: %s" % (alternatives, output)
 
-    def test_cluster_create_with_user(self, runner, tmp_path, monkeypatch):
+    def test_cluster_create_with_user(self, runner, patched_config_dir):
         """Test creating a cluster with --user."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
-
         result = runner.invoke(main, [
             "cluster", "create", "my-cluster",
             "--hosts", "host1,host2",
@@ -405,13 +497,8 @@ class TestClusterCommands:
         assert result.exit_code == 0
         assert "dgxuser" in result.output
 
-    def test_cluster_create_without_user(self, runner, tmp_path, monkeypatch):
+    def test_cluster_create_without_user(self, runner, patched_config_dir):
         """Test that cluster created without --user does not show User field."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
-
         runner.invoke(main, [
             "cluster", "create", "no-user-cluster",
             "--hosts", "host1,host2",
@@ -437,129 +524,105 @@ class TestClusterCommands:
 class TestRunWithCluster:
     """Test run command with --cluster and --hosts-file options."""
 
-    @pytest.fixture
-    def cluster_setup(self, tmp_path, monkeypatch):
-        """Set up a config root with a test cluster for CLI tests."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
-        from sparkrun.cluster_manager import ClusterManager
-        mgr = ClusterManager(config_root)
-        mgr.create("test-cluster", ["10.0.0.1", "10.0.0.2"])
-        return config_root
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def cluster_setup(tmp_path_factory):
+        """Set up a config root with a test cluster for CLI tests.
 
-    def test_run_help_shows_cluster_option(self, runner):
+        Class-scoped — no test here mutates the cluster, so one tree
+        serves them all.
+        """
+        config_root = tmp_path_factory.mktemp("config")
+        import sparkrun.config
+        with pytest.MonkeyPatch.context() as m:
+            m.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
+            from sparkrun.cluster_manager import ClusterManager
+            mgr = ClusterManager(config_root)
+            mgr.create("test-cluster", ["10.0.0.1", "10.0.0.2"])
+            yield config_root
+
+    def test_run_help_shows_cluster_option(self):
         """Test that sparkrun run --help shows --cluster and --hosts-file options."""
-        result = runner.invoke(main, ["run", "--help"])
-
-        assert result.exit_code == 0
-        assert "--cluster" in result.output
-        assert "--hosts-file" in result.output
+        output = _command_help("run")
+        assert "--cluster" in output
+        assert "--hosts-file" in output
 
 
 class TestTensorParallelValidation:
     """Test tensor_parallel vs host count validation."""
 
-    def test_tp_exceeds_hosts_errors(self, runner, reset_bootstrap):
-        """tensor_parallel > number of hosts should exit with error."""
-        # qwen3-coder-next-fp8-sglang-cluster has defaults.tensor_parallel=2
-        # Provide only 1 host (not --solo) so we hit the validation
+    pytestmark = pytest.mark.slow
+
+    # (extra args, expect_error, substrings that must appear, substrings
+    # that must not, expected hosts passed to the runtime — None skips
+    # the call-args check, [] means the runtime must not be called at
+    # all).  The recipe's defaults set tensor_parallel=2.
+    TP_CASES = [
+        pytest.param(
+            ["--tp", "4", "--hosts", "10.0.0.1,10.0.0.2,10.0.0.3"],
+            True, ["tensor_parallel=4", "only 3 provided"], [], [],
+            id="tp-exceeds-hosts",
+        ),
+        pytest.param(
+            ["--hosts", "10.0.0.1,10.0.0.2,10.0.0.3,10.0.0.4"],
+            False, ["tensor_parallel=2", "using 2 of 4 hosts"], [],
+            ["10.0.0.1", "10.0.0.2"],
+            id="tp-trims-hosts",
+        ),
+        pytest.param(
+            ["--hosts", "10.0.0.1,10.0.0.2"],
+            False, [], ["using 2 of"], ["10.0.0.1", "10.0.0.2"],
+            id="tp-equals-hosts",
+        ),
+        pytest.param(
+            ["--tp", "1", "--hosts", "10.0.0.1,10.0.0.2"],
+            False, ["tensor_parallel=1", "using 1 of 2 hosts", "solo"], [], None,
+            id="tp-one-becomes-solo",
+        ),
+        pytest.param(
+            ["--solo", "--hosts", "10.0.0.1"],
+            False, [], ["tensor_parallel="], None,
+            id="solo-skips-validation",
+        ),
+    ]
+
+    @pytest.mark.parametrize("extra_args,expect_error,present,absent,expected_hosts", TP_CASES)
+    def test_tp_validation(
+        self, runner, reset_bootstrap, stub_runtime_run,
+        extra_args, expect_error, present, absent, expected_hosts,
+    ):
+        """Table-driven tensor_parallel validation scenarios."""
+        stub_runtime_run.reset_mock()
         result = runner.invoke(main, [
-            "run",
-            "qwen3-coder-next-fp8-sglang-cluster",
-            "--dry-run",
-            "--tp", "4",
-            "--hosts", "10.0.0.1,10.0.0.2,10.0.0.3",
+            "run", "qwen3-coder-next-fp8-sglang-cluster", "--dry-run", *extra_args,
         ])
 
-        assert result.exit_code != 0
-        assert "tensor_parallel=4" in result.output
-        assert "only 3 provided" in result.output
-
-    def test_tp_less_than_hosts_trims(self, runner, reset_bootstrap):
-        """tensor_parallel < number of hosts should trim host list."""
-        with mock.patch.object(SglangRuntime, "run", return_value=0) as mock_run:
-            result = runner.invoke(main, [
-                "run",
-                "qwen3-coder-next-fp8-sglang-cluster",
-                "--dry-run",
-                "--hosts", "10.0.0.1,10.0.0.2,10.0.0.3,10.0.0.4",
-            ])
-
-            assert result.exit_code == 0
-            assert "tensor_parallel=2" in result.output
-            assert "using 2 of 4 hosts" in result.output
-            # Should have called with only 2 hosts
-            mock_run.assert_called_once()
-            call_kwargs = mock_run.call_args.kwargs
-            assert len(call_kwargs["hosts"]) == 2
-            assert call_kwargs["hosts"] == ["10.0.0.1", "10.0.0.2"]
-
-    def test_tp_equals_hosts_uses_all(self, runner, reset_bootstrap):
-        """tensor_parallel == number of hosts should use all hosts."""
-        with mock.patch.object(SglangRuntime, "run", return_value=0) as mock_run:
-            result = runner.invoke(main, [
-                "run",
-                "qwen3-coder-next-fp8-sglang-cluster",
-                "--dry-run",
-                "--hosts", "10.0.0.1,10.0.0.2",
-            ])
-
-            assert result.exit_code == 0
-            # No trimming message
-            assert "using 2 of" not in result.output
-            mock_run.assert_called_once()
-            call_kwargs = mock_run.call_args.kwargs
-            assert len(call_kwargs["hosts"]) == 2
-
-    def test_tp_trims_to_one_becomes_solo(self, runner, reset_bootstrap):
-        """tensor_parallel=1 with multiple hosts should trim to 1 host and run solo."""
-        with mock.patch.object(SglangRuntime, "run", return_value=0) as mock_run:
-            result = runner.invoke(main, [
-                "run",
-                "qwen3-coder-next-fp8-sglang-cluster",
-                "--tp", "1",
-                "--dry-run",
-                "--hosts", "10.0.0.1,10.0.0.2",
-            ])
-
-            assert result.exit_code == 0
-            assert "tensor_parallel=1" in result.output
-            assert "using 1 of 2 hosts" in result.output
-            assert "solo" in result.output.lower()
-            mock_run.assert_called_once()
-
-    def test_solo_flag_skips_tp_validation(self, runner, reset_bootstrap):
-        """--solo flag should skip tensor_parallel validation entirely."""
-        with mock.patch.object(SglangRuntime, "run", return_value=0) as mock_run:
-            result = runner.invoke(main, [
-                "run",
-                "qwen3-coder-next-fp8-sglang-cluster",
-                "--solo",
-                "--dry-run",
-                "--hosts", "10.0.0.1",
-            ])
-
-            assert result.exit_code == 0
-            # No trimming or error messages
-            assert "tensor_parallel=" not in result.output
-            mock_run.assert_called_once()
+        assert (result.exit_code != 0) == expect_error
+        output_lower = result.output.lower()
+        for needle in present:
+            assert needle in output_lower
+        for needle in absent:
+            assert needle not in output_lower
+        if expected_hosts == []:
+            stub_runtime_run.assert_not_called()
+        else:
+            stub_runtime_run.assert_called_once()
+            if expected_hosts is not None:
+                assert stub_runtime_run.call_args.kwargs["hosts"] == expected_hosts
 
 
 class TestOptionOverrides:
     """Test --option / -o arbitrary parameter overrides."""
 
-    def test_help_shows_option(self, runner):
+    def test_help_shows_option(self):
         """sparkrun run --help shows --option / -o."""
-        result = runner.invoke(main, ["run", "--help"])
-        assert result.exit_code == 0
-        assert "--option" in result.output
-        assert "-o" in result.output
+        output = _command_help("run")
+        assert "--option" in output
+        assert "-o" in output
 
     def test_option_overrides_recipe_default(self, runner, reset_bootstrap):
         """--option overrides a recipe default value."""
-        with mock.patch.object(SglangRuntime, "run", return_value=0) as mock_run:
+        with mock.patch("sparkrun.runtimes.sglang.SglangRuntime.run", return_value=0) as mock_run:
             result = runner.invoke(main, [
                 "run",
                 "qwen3-coder-next-fp8-sglang-cluster",
@@ -577,7 +640,7 @@ class TestOptionOverrides:
 
     def test_option_multiple(self, runner, reset_bootstrap):
         """Multiple -o flags accumulate."""
-        with mock.patch.object(SglangRuntime, "run", return_value=0) as mock_run:
+        with mock.patch("sparkrun.runtimes.sglang.SglangRuntime.run", return_value=0) as mock_run:
             result = runner.invoke(main, [
                 "run",
                 "qwen3-coder-next-fp8-sglang-cluster",
@@ -596,7 +659,7 @@ class TestOptionOverrides:
 
     def test_dedicated_cli_param_overrides_option(self, runner, reset_bootstrap):
         """--port takes priority over -o port=XXXX."""
-        with mock.patch.object(SglangRuntime, "run", return_value=0) as mock_run:
+        with mock.patch("sparkrun.runtimes.sglang.SglangRuntime.run", return_value=0) as mock_run:
             result = runner.invoke(main, [
                 "run",
                 "qwen3-coder-next-fp8-sglang-cluster",
@@ -615,7 +678,7 @@ class TestOptionOverrides:
 
     def test_option_coerces_types(self, runner, reset_bootstrap):
         """Values are auto-coerced: int, float, bool."""
-        with mock.patch.object(SglangRuntime, "run", return_value=0) as mock_run:
+        with mock.patch("sparkrun.runtimes.sglang.SglangRuntime.run", return_value=0) as mock_run:
             result = runner.invoke(main, [
                 "run",
                 "qwen3-coder-next-fp8-sglang-cluster",
@@ -657,17 +720,15 @@ class TestOptionOverrides:
 class TestFollowLogs:
     """Test --no-follow flag and follow_logs integration."""
 
-    def test_run_help_shows_no_follow(self, runner):
+    def test_run_help_shows_no_follow(self):
         """sparkrun run --help shows --no-follow option."""
-        result = runner.invoke(main, ["run", "--help"])
-        assert result.exit_code == 0
-        assert "--no-follow" in result.output
+        assert "--no-follow" in _command_help("run")
 
     def test_follow_logs_called_after_successful_run(self, runner, reset_bootstrap):
         """follow_logs is called after a successful detached run."""
         with mock.patch("sparkrun.orchestration.distribution.distribute_resources", return_value=(None, {}, {})), \
-             mock.patch.object(SglangRuntime, "run", return_value=0), \
-             mock.patch.object(SglangRuntime, "follow_logs") as mock_follow:
+             mock.patch("sparkrun.runtimes.sglang.SglangRuntime.run", return_value=0), \
+             mock.patch("sparkrun.runtimes.sglang.SglangRuntime.follow_logs") as mock_follow:
             result = runner.invoke(main, [
                 "run",
                 "qwen3-coder-next-fp8-sglang-cluster",
@@ -684,8 +745,8 @@ class TestFollowLogs:
     def test_no_follow_flag_skips_follow_logs(self, runner, reset_bootstrap):
         """--no-follow prevents follow_logs from being called."""
         with mock.patch("sparkrun.orchestration.distribution.distribute_resources", return_value=(None, {}, {})), \
-             mock.patch.object(SglangRuntime, "run", return_value=0), \
-             mock.patch.object(SglangRuntime, "follow_logs") as mock_follow:
+             mock.patch("sparkrun.runtimes.sglang.SglangRuntime.run", return_value=0), \
+             mock.patch("sparkrun.runtimes.sglang.SglangRuntime.follow_logs") as mock_follow:
             result = runner.invoke(main, [
                 "run",
                 "qwen3-coder-next-fp8-sglang-cluster",
@@ -699,8 +760,8 @@ class TestFollowLogs:
 
     def test_dry_run_skips_follow_logs(self, runner, reset_bootstrap):
         """--dry-run prevents follow_logs from being called."""
-        with mock.patch.object(SglangRuntime, "run", return_value=0), \
-             mock.patch.object(SglangRuntime, "follow_logs") as mock_follow:
+        with mock.patch("sparkrun.runtimes.sglang.SglangRuntime.run", return_value=0), \
+             mock.patch("sparkrun.runtimes.sglang.SglangRuntime.follow_logs") as mock_follow:
             result = runner.invoke(main, [
                 "run",
                 "qwen3-coder-next-fp8-sglang-cluster",
@@ -715,8 +776,8 @@ class TestFollowLogs:
     def test_foreground_skips_follow_logs(self, runner, reset_bootstrap):
         """--foreground prevents follow_logs from being called."""
         with mock.patch("sparkrun.orchestration.distribution.distribute_resources", return_value=(None, {}, {})), \
-             mock.patch.object(SglangRuntime, "run", return_value=0), \
-             mock.patch.object(SglangRuntime, "follow_logs") as mock_follow:
+             mock.patch("sparkrun.runtimes.sglang.SglangRuntime.run", return_value=0), \
+             mock.patch("sparkrun.runtimes.sglang.SglangRuntime.follow_logs") as mock_follow:
             result = runner.invoke(main, [
                 "run",
                 "qwen3-coder-next-fp8-sglang-cluster",
@@ -731,8 +792,8 @@ class TestFollowLogs:
     def test_nonzero_exit_skips_follow_logs(self, runner, reset_bootstrap):
         """Non-zero exit code from runtime.run() prevents follow_logs."""
         with mock.patch("sparkrun.orchestration.distribution.distribute_resources", return_value=(None, {}, {})), \
-             mock.patch.object(SglangRuntime, "run", return_value=1), \
-             mock.patch.object(SglangRuntime, "follow_logs") as mock_follow:
+             mock.patch("sparkrun.runtimes.sglang.SglangRuntime.run", return_value=1), \
+             mock.patch("sparkrun.runtimes.sglang.SglangRuntime.follow_logs") as mock_follow:
             result = runner.invoke(main, [
                 "run",
                 "qwen3-coder-next-fp8-sglang-cluster",
@@ -748,16 +809,12 @@ class TestSetupSshCommand:
     """Test the setup ssh command."""
 
     @pytest.fixture
-    def cluster_setup(self, tmp_path, monkeypatch):
+    def cluster_setup(self, patched_config_dir):
         """Set up a config root with a test cluster for SSH tests."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
         from sparkrun.cluster_manager import ClusterManager
-        mgr = ClusterManager(config_root)
+        mgr = ClusterManager(patched_config_dir)
         mgr.create("ssh-cluster", ["10.0.0.1", "10.0.0.2", "10.0.0.3"])
-        return config_root
+        return patched_config_dir
 
     def test_setup_ssh_help(self, runner):
         """Test that sparkrun setup ssh --help shows relevant options."""
@@ -769,37 +826,8 @@ class TestSetupSshCommand:
         assert "--dry-run" in result.output
         assert "SSH mesh" in result.output
 
-    def test_setup_ssh_requires_hosts(self, runner, tmp_path, monkeypatch):
-        """Test that setup ssh with no hosts exits with error."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
-
-        result = runner.invoke(main, ["setup", "ssh", "--no-include-self"])
-        assert result.exit_code != 0
-        assert "No hosts" in result.output
-
-    def test_setup_ssh_requires_two_hosts(self, runner, tmp_path, monkeypatch):
-        """Test that setup ssh with a single host exits with error."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
-
-        result = runner.invoke(main, [
-            "setup", "ssh", "--hosts", "10.0.0.1", "--no-include-self",
-        ])
-        assert result.exit_code != 0
-        assert "at least 2 hosts" in result.output
-
-    def test_setup_ssh_dry_run(self, runner, tmp_path, monkeypatch):
+    def test_setup_ssh_dry_run(self, runner, patched_config_dir):
         """Test that --dry-run shows the command without executing."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
-
         result = runner.invoke(main, [
             "setup", "ssh",
             "--hosts", "10.0.0.1,10.0.0.2",
@@ -814,12 +842,8 @@ class TestSetupSshCommand:
         assert "10.0.0.1" in result.output
         assert "10.0.0.2" in result.output
 
-    def test_setup_ssh_dry_run_default_user(self, runner, tmp_path, monkeypatch):
+    def test_setup_ssh_dry_run_default_user(self, runner, patched_config_dir, monkeypatch):
         """Test that --dry-run uses OS user when --user is not specified."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
         monkeypatch.setenv("USER", "myosuser")
 
         result = runner.invoke(main, [
@@ -847,13 +871,8 @@ class TestSetupSshCommand:
         assert "10.0.0.2" in result.output
         assert "10.0.0.3" in result.output
 
-    def test_setup_ssh_runs_script(self, runner, tmp_path, monkeypatch):
+    def test_setup_ssh_runs_script(self, runner, patched_config_dir):
         """Test that setup ssh invokes subprocess.run with correct args."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
-
         with mock.patch("subprocess.run", return_value=mock.Mock(returncode=0)) as mock_run:
             result = runner.invoke(main, [
                 "setup", "ssh",
@@ -870,15 +889,10 @@ class TestSetupSshCommand:
             assert cmd[2] == "testuser"
             assert cmd[3:] == ["10.0.0.1", "10.0.0.2"]
 
-    def test_setup_ssh_uses_cluster_user(self, runner, tmp_path, monkeypatch):
+    def test_setup_ssh_uses_cluster_user(self, runner, patched_config_dir):
         """Test that setup ssh picks up the cluster's configured user."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
-
         from sparkrun.cluster_manager import ClusterManager
-        mgr = ClusterManager(config_root)
+        mgr = ClusterManager(patched_config_dir)
         mgr.create("usercluster", ["10.0.0.1", "10.0.0.2"], user="dgxuser")
 
         result = runner.invoke(main, [
@@ -890,15 +904,10 @@ class TestSetupSshCommand:
         assert result.exit_code == 0
         assert "dgxuser" in result.output
 
-    def test_setup_ssh_cli_user_overrides_cluster_user(self, runner, tmp_path, monkeypatch):
+    def test_setup_ssh_cli_user_overrides_cluster_user(self, runner, patched_config_dir):
         """Test that --user flag overrides the cluster's configured user."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
-
         from sparkrun.cluster_manager import ClusterManager
-        mgr = ClusterManager(config_root)
+        mgr = ClusterManager(patched_config_dir)
         mgr.create("usercluster2", ["10.0.0.1", "10.0.0.2"], user="dgxuser")
 
         result = runner.invoke(main, [
@@ -913,13 +922,8 @@ class TestSetupSshCommand:
         # The cluster user should NOT appear in the command
         assert "dgxuser" not in result.output
 
-    def test_setup_ssh_include_self(self, runner, tmp_path, monkeypatch):
+    def test_setup_ssh_include_self(self, runner, patched_config_dir):
         """Test that --include-self adds the local IP to the mesh."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
-
         from sparkrun.orchestration.primitives import local_ip_for
         local_ip = local_ip_for("10.0.0.1")
 
@@ -935,13 +939,8 @@ class TestSetupSshCommand:
         assert "10.0.0.1" in result.output
         assert "10.0.0.2" in result.output
 
-    def test_setup_ssh_include_self_no_duplicate(self, runner, tmp_path, monkeypatch):
+    def test_setup_ssh_include_self_no_duplicate(self, runner, patched_config_dir):
         """Test that --include-self doesn't duplicate if local IP already in hosts."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
-
         from sparkrun.orchestration.primitives import local_ip_for
         local_ip = local_ip_for("10.0.0.1")
 
@@ -957,13 +956,8 @@ class TestSetupSshCommand:
         cmd_line = result.output.split("Would run:\n")[-1].strip()
         assert cmd_line.count(local_ip) == 1
 
-    def test_setup_ssh_extra_hosts(self, runner, tmp_path, monkeypatch):
+    def test_setup_ssh_extra_hosts(self, runner, patched_config_dir):
         """Test that --extra-hosts adds additional hosts to the mesh."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
-
         result = runner.invoke(main, [
             "setup", "ssh",
             "--hosts", "10.0.0.1",
@@ -976,13 +970,8 @@ class TestSetupSshCommand:
         assert "10.0.0.1" in result.output
         assert "10.0.0.99" in result.output
 
-    def test_setup_ssh_extra_hosts_dedup(self, runner, tmp_path, monkeypatch):
+    def test_setup_ssh_extra_hosts_dedup(self, runner, patched_config_dir):
         """Test that --extra-hosts deduplicates against --hosts."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
-
         result = runner.invoke(main, [
             "setup", "ssh",
             "--hosts", "10.0.0.1,10.0.0.2",
@@ -1002,16 +991,12 @@ class TestSetupFixPermissions:
     """Test the setup fix-permissions command."""
 
     @pytest.fixture
-    def cluster_setup(self, tmp_path, monkeypatch):
+    def cluster_setup(self, patched_config_dir):
         """Set up a config root with a test cluster."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
         from sparkrun.cluster_manager import ClusterManager
-        mgr = ClusterManager(config_root)
+        mgr = ClusterManager(patched_config_dir)
         mgr.create("fix-cluster", ["10.0.0.1", "10.0.0.2"], user="dgxuser")
-        return config_root
+        return patched_config_dir
 
     def test_fix_permissions_help(self, runner):
         """Test that sparkrun setup fix-permissions --help shows expected options."""
@@ -1025,17 +1010,6 @@ class TestSetupFixPermissions:
         assert "--save-sudo" in result.output
         assert "file ownership" in result.output.lower() or "Fix file ownership" in result.output
 
-    def test_fix_permissions_no_hosts_error(self, runner, tmp_path, monkeypatch):
-        """Test that fix-permissions with no hosts exits with error."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
-
-        result = runner.invoke(main, ["setup", "fix-permissions"])
-        assert result.exit_code != 0
-        assert "hosts" in result.output.lower() or "Error" in result.output
-
     def test_fix_permissions_dry_run(self, runner, cluster_setup):
         """Test that --dry-run reports without executing."""
         mock_result_1 = mock.Mock(
@@ -1288,16 +1262,12 @@ class TestSetupClearCache:
     """Test the setup clear-cache command."""
 
     @pytest.fixture
-    def cluster_setup(self, tmp_path, monkeypatch):
+    def cluster_setup(self, patched_config_dir):
         """Set up a config root with a test cluster."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
         from sparkrun.cluster_manager import ClusterManager
-        mgr = ClusterManager(config_root)
+        mgr = ClusterManager(patched_config_dir)
         mgr.create("cache-cluster", ["10.0.0.1", "10.0.0.2"], user="dgxuser")
-        return config_root
+        return patched_config_dir
 
     def test_clear_cache_help(self, runner):
         """Test that sparkrun setup clear-cache --help shows expected options."""
@@ -1310,17 +1280,6 @@ class TestSetupClearCache:
         assert "--save-sudo" in result.output
         assert "page cache" in result.output.lower() or "drop_caches" in result.output
 
-    def test_clear_cache_no_hosts_error(self, runner, tmp_path, monkeypatch):
-        """Test that clear-cache with no hosts exits with error."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
-
-        result = runner.invoke(main, ["setup", "clear-cache"])
-        assert result.exit_code != 0
-        assert "hosts" in result.output.lower() or "Error" in result.output
-
     def test_clear_cache_dry_run(self, runner, cluster_setup):
         """Test that --dry-run reports without executing."""
         mock_result_1 = mock.Mock(
@@ -1486,7 +1445,7 @@ class TestLogCommand:
 
     def test_log_calls_follow_logs(self, runner, reset_bootstrap):
         """sparkrun logs calls runtime.follow_logs with correct args."""
-        with mock.patch.object(SglangRuntime, "follow_logs") as mock_follow:
+        with mock.patch("sparkrun.runtimes.sglang.SglangRuntime.follow_logs") as mock_follow:
             result = runner.invoke(main, [
                 "logs",
                 "qwen3-coder-next-fp8-sglang-cluster",
@@ -1500,21 +1459,6 @@ class TestLogCommand:
             assert call_kwargs["cluster_id"].startswith("sparkrun_")
             assert call_kwargs["tail"] == 50
 
-    def test_log_no_hosts_error(self, runner, reset_bootstrap, tmp_path, monkeypatch):
-        """sparkrun logs with no hosts exits with error."""
-        config_root = tmp_path / "config"
-        config_root.mkdir()
-        import sparkrun.config
-        monkeypatch.setattr(sparkrun.config, "DEFAULT_CONFIG_DIR", config_root)
-
-        result = runner.invoke(main, [
-            "logs",
-            "qwen3-coder-next-fp8-sglang-cluster",
-        ])
-
-        assert result.exit_code != 0
-        assert "hosts" in result.output.lower() or "Error" in result.output
-
     def test_log_nonexistent_recipe(self, runner, reset_bootstrap):
         """sparkrun logs with bad recipe exits with error."""
         result = runner.invoke(main, [
@@ -18,11 +18,15 @@ import pytest
 
 from sparkrun.orchestration.ssh import (
     RemoteResult,
+    _local_rsync_version,
     build_ssh_opts_string,
+    fast_rsync_options,
     run_pipeline_to_remote,
     run_pipeline_to_remotes_parallel,
     run_rsync,
     run_rsync_parallel,
+    run_tar_pipe,
+    run_tar_pipe_parallel,
 )
 
 
@@ -212,6 +216,119 @@ class TestRunRsync:
         assert not result.success
         assert "timed out" in result.stderr.lower()
 
+    @mock.patch("sparkrun.orchestration.ssh.subprocess.run")
+    def test_files_from(self, mock_run):
+        """files_from adds --files-from/--from0 and explicit recursion."""
+        mock_run.return_value = mock.Mock(returncode=0, stdout="", stderr="")
+        run_rsync("/cache/hub", "host1", "/cache/hub", files_from="/tmp/list")
+        cmd = mock_run.call_args[0][0]
+        assert "--files-from=/tmp/list" in cmd
+        assert "--from0" in cmd
+        # --files-from disables -a's implied recursion
+        assert "--recursive" in cmd
+        assert "-az" in cmd
+
+
+# ---------------------------------------------------------------------------
+# fast_rsync_options
+# ---------------------------------------------------------------------------
+
+class TestFastRsyncOptions:
+    """Test the tuned bulk-transfer rsync flags and version gating."""
+
+    def test_base_flags(self):
+        opts = fast_rsync_options(zstd=False)
+        assert "--whole-file" in opts
+        assert "--inplace" in opts
+        assert "--links" in opts
+        assert not any(o.startswith("--compress") for o in opts)
+
+    def test_zstd_forced_on(self):
+        opts = fast_rsync_options(zstd=True)
+        assert "--compress-choice=zstd" in opts
+        assert "--compress-level=1" in opts
+
+    @mock.patch("sparkrun.orchestration.ssh.subprocess.run")
+    def test_zstd_auto_on_modern_rsync(self, mock_run):
+        mock_run.return_value = mock.Mock(
+            stdout="rsync  version 3.2.7  protocol version 31\n",
+        )
+        _local_rsync_version.cache_clear()
+        try:
+            opts = fast_rsync_options()
+            assert "--compress-choice=zstd" in opts
+        finally:
+            _local_rsync_version.cache_clear()
+
+    @mock.patch("sparkrun.orchestration.ssh.subprocess.run")
+    def test_zstd_auto_off_on_old_rsync(self, mock_run):
+        mock_run.return_value = mock.Mock(
+            stdout="rsync  version 3.1.3  protocol version 31\n",
+        )
+        _local_rsync_version.cache_clear()
+        try:
+            opts = fast_rsync_options()
+            assert not any(o.startswith("--compress") for o in opts)
+        finally:
+            _local_rsync_version.cache_clear()
+
+    @mock.patch("sparkrun.orchestration.ssh.subprocess.run")
+    def test_missing_rsync_binary(self, mock_run):
+        mock_run.side_effect = FileNotFoundError("rsync")
+        _local_rsync_version.cache_clear()
+        try:
+            assert _local_rsync_version() == (0, 0)
+            assert not any(
+                o.startswith("--compress") for o in fast_rsync_options()
+            )
+        finally:
+            _local_rsync_version.cache_clear()
+
+
+# ---------------------------------------------------------------------------
+# run_tar_pipe
+# ---------------------------------------------------------------------------
+
+class TestRunTarPipe:
+    """Test tar-pipe streaming transfer."""
+
+    def test_dry_run(self):
+        result = run_tar_pipe("/src/path", "host1", "/dst/path", dry_run=True)
+        assert result.success
+        assert result.host == "host1"
+        assert "[dry-run]" in result.stdout
+
+    @mock.patch("sparkrun.orchestration.ssh.subprocess.run")
+    def test_constructs_pipeline(self, mock_run):
+        mock_run.return_value = mock.Mock(returncode=0, stdout="", stderr="")
+        run_tar_pipe(
+            "/cache/hub/models--org--model", "host1",
+            "/cache/hub/models--org--model",
+            ssh_user="user", ssh_key="/key",
+        )
+        pipeline_str = mock_run.call_args[0][0]
+        # Producer packs the directory by basename from its parent
+        assert 'tar --sparse -cf - -C "/cache/hub" "models--org--model"' in pipeline_str
+        # Consumer extracts under the destination parent
+        assert 'mkdir -p "/cache/hub"' in pipeline_str
+        assert 'tar -xpf - -C "/cache/hub"' in pipeline_str
+        assert "user@host1" in pipeline_str
+
+    @mock.patch("sparkrun.orchestration.ssh.subprocess.run")
+    def test_trailing_slash_stripped(self, mock_run):
+        mock_run.return_value = mock.Mock(returncode=0, stdout="", stderr="")
+        run_tar_pipe("/src/path/", "host1", "/dst/path/")
+        pipeline_str = mock_run.call_args[0][0]
+        assert '-C "/src" "path"' in pipeline_str
+        assert '-C "/dst"' in pipeline_str
+
+    @mock.patch("sparkrun.orchestration.ssh.subprocess.run")
+    def test_failure(self, mock_run):
+        mock_run.return_value = mock.Mock(returncode=2, stdout="", stderr="tar error")
+        result = run_tar_pipe("/src", "host1", "/dst")
+        assert not result.success
+        assert result.returncode == 2
+
 
 # ---------------------------------------------------------------------------
 # Parallel variants
@@ -257,6 +374,25 @@ class TestParallelRsync:
         assert all(r.success for r in results)
 
 
+class TestParallelTarPipe:
+    """Test run_tar_pipe_parallel."""
+
+    @mock.patch("sparkrun.orchestration.ssh.run_tar_pipe")
+    def test_calls_per_host(self, mock_tar):
+        mock_tar.return_value = RemoteResult(host="h", returncode=0, stdout="", stderr="")
+        hosts = ["h1", "h2"]
+        results = run_tar_pipe_parallel("/src", hosts, "/dst")
+        assert mock_tar.call_count == 2
+        called_hosts = {call.args[1] for call in mock_tar.call_args_list}
+        assert called_hosts == {"h1", "h2"}
+        assert len(results) == 2
+
+    def test_dry_run(self):
+        results = run_tar_pipe_parallel("/src", ["h1", "h2"], "/dst", dry_run=True)
+        assert len(results) == 2
+        assert all(r.success for r in results)
+
+
 # ---------------------------------------------------------------------------
 # Image hash checking
 # ---------------------------------------------------------------------------
@@ -591,59 +727,110 @@ class TestDistributeImageFromHead:
 class TestDistributeModelFromLocal:
     """Test distribute_model_from_local."""
 
-    @mock.patch("sparkrun.models.distribute.run_rsync_parallel")
+    @mock.patch("sparkrun.models.distribute.run_tar_pipe_parallel")
     @mock.patch("sparkrun.models.distribute.download_model")
-    def test_dry_run(self, mock_dl, mock_rsync):
+    def test_dry_run(self, mock_dl, mock_tar):
         mock_dl.return_value = 0
-        mock_rsync.return_value = [
+        mock_tar.return_value = [
             RemoteResult(host="h1", returncode=0, stdout="[dry-run]", stderr=""),
         ]
         from sparkrun.models.distribute import distribute_model_from_local
         failed = distribute_model_from_local("org/model", ["h1"], dry_run=True)
         assert failed == []
 
-    @mock.patch("sparkrun.models.distribute.run_rsync_parallel")
+    @mock.patch("sparkrun.models.distribute.run_tar_pipe_parallel")
     @mock.patch("sparkrun.models.distribute.download_model")
-    def test_success(self, mock_dl, mock_rsync):
+    def test_success(self, mock_dl, mock_tar):
         mock_dl.return_value = 0
-        mock_rsync.return_value = [
+        mock_tar.return_value = [
             RemoteResult(host="h1", returncode=0, stdout="ok", stderr=""),
             RemoteResult(host="h2", returncode=0, stdout="ok", stderr=""),
         ]
         from sparkrun.models.distribute import distribute_model_from_local
         failed = distribute_model_from_local("org/model", ["h1", "h2"])
         assert failed == []
-        # Verify rsync source path matches HF cache convention
-        call_args = mock_rsync.call_args[0]
+        # Verify transfer source path matches HF cache convention
+        call_args = mock_tar.call_args[0]
         assert "models--org--model" in call_args[0]
 
-    @mock.patch("sparkrun.models.distribute.run_rsync_parallel")
+    @mock.patch("sparkrun.models.distribute.run_tar_pipe_parallel")
     @mock.patch("sparkrun.models.distribute.download_model")
-    def test_download_fails(self, mock_dl, mock_rsync):
+    def test_download_fails(self, mock_dl, mock_tar):
         """If download fails, all hosts are returned as failed."""
         mock_dl.return_value = 1
         from sparkrun.models.distribute import distribute_model_from_local
         failed = distribute_model_from_local("org/model", ["h1", "h2"])
         assert failed == ["h1", "h2"]
-        mock_rsync.assert_not_called()
+        mock_tar.assert_not_called()
 
     @mock.patch("sparkrun.models.distribute.run_rsync_parallel")
+    @mock.patch("sparkrun.models.distribute.run_tar_pipe_parallel")
     @mock.patch("sparkrun.models.distribute.download_model")
-    def test_partial_failure(self, mock_dl, mock_rsync):
+    def test_partial_failure(self, mock_dl, mock_tar, mock_rsync):
+        """Hosts failing both the tar pipe and the rsync retry are reported."""
         mock_dl.return_value = 0
-        mock_rsync.return_value = [
+        mock_tar.return_value = [
             RemoteResult(host="h1", returncode=0, stdout="ok", stderr=""),
             RemoteResult(host="h2", returncode=1, stdout="", stderr="err"),
         ]
+        mock_rsync.return_value = [
+            RemoteResult(host="h2", returncode=1, stdout="", stderr="err"),
+        ]
         from sparkrun.models.distribute import distribute_model_from_local
         failed = distribute_model_from_local("org/model", ["h1", "h2"])
         assert failed == ["h2"]
+        # Rsync retry only targets the host where the tar pipe failed
+        assert mock_rsync.call_args[0][1] == ["h2"]
 
     @mock.patch("sparkrun.models.distribute.run_rsync_parallel")
+    @mock.patch("sparkrun.models.distribute.run_tar_pipe_parallel")
     @mock.patch("sparkrun.models.distribute.download_model")
-    def test_custom_cache_dir(self, mock_dl, mock_rsync):
+    def test_rsync_fallback_recovers(self, mock_dl, mock_tar, mock_rsync):
+        """A host where the tar pipe fails but rsync succeeds is not failed."""
         mock_dl.return_value = 0
+        mock_tar.return_value = [
+            RemoteResult(host="h1", returncode=0, stdout="ok", stderr=""),
+            RemoteResult(host="h2", returncode=1, stdout="", stderr="err"),
+        ]
         mock_rsync.return_value = [
+            RemoteResult(host="h2", returncode=0, stdout="ok", stderr=""),
+        ]
+        from sparkrun.models.distribute import distribute_model_from_local
+        failed = distribute_model_from_local("org/model", ["h1", "h2"])
+        assert failed == []
+
+    @mock.patch("sparkrun.models.distribute._probe_synced_hosts")
+    @mock.patch("sparkrun.models.distribute.run_tar_pipe_parallel")
+    @mock.patch("sparkrun.models.distribute.download_model")
+    def test_synced_hosts_skip_transfer(self, mock_dl, mock_tar, mock_probe):
+        """Hosts whose cache digest already matches are not transferred to."""
+        mock_dl.return_value = 0
+        mock_probe.return_value = {"h1"}
+        mock_tar.return_value = [
+            RemoteResult(host="h2", returncode=0, stdout="ok", stderr=""),
+        ]
+        from sparkrun.models.distribute import distribute_model_from_local
+        failed = distribute_model_from_local("org/model", ["h1", "h2"])
+        assert failed == []
+        assert mock_tar.call_args[0][1] == ["h2"]
+
+    @mock.patch("sparkrun.models.distribute._probe_synced_hosts")
+    @mock.patch("sparkrun.models.distribute.run_tar_pipe_parallel")
+    @mock.patch("sparkrun.models.distribute.download_model")
+    def test_all_synced_skips_transfer(self, mock_dl, mock_tar, mock_probe):
+        """When every host is already in sync, no transfer runs at all."""
+        mock_dl.return_value = 0
+        mock_probe.return_value = {"h1", "h2"}
+        from sparkrun.models.distribute import distribute_model_from_local
+        failed = distribute_model_from_local("org/model", ["h1", "h2"])
+        assert failed == []
+        mock_tar.assert_not_called()
+
+    @mock.patch("sparkrun.models.distribute.run_tar_pipe_parallel")
+    @mock.patch("sparkrun.models.distribute.download_model")
+    def test_custom_cache_dir(self, mock_dl, mock_tar):
+        mock_dl.return_value = 0
+        mock_tar.return_value = [
             RemoteResult(host="h1", returncode=0, stdout="ok", stderr=""),
         ]
         from sparkrun.models.distribute import distribute_model_from_local
@@ -651,24 +838,24 @@ class TestDistributeModelFromLocal:
         mock_dl.assert_called_once_with(
             "org/model", cache_dir="/custom/cache", token=None, revision=None, dry_run=False,
         )
-        # Rsync path should use custom cache
-        assert "/custom/cache/hub/models--org--model" in mock_rsync.call_args[0][0]
+        # Transfer path should use custom cache
+        assert "/custom/cache/hub/models--org--model" in mock_tar.call_args[0][0]
 
-    @mock.patch("sparkrun.models.distribute.run_rsync_parallel")
+    @mock.patch("sparkrun.models.distribute.run_tar_pipe_parallel")
     @mock.patch("sparkrun.models.distribute.download_model")
-    def test_empty_hosts(self, mock_dl, mock_rsync):
+    def test_empty_hosts(self, mock_dl, mock_tar):
         mock_dl.return_value = 0
         from sparkrun.models.distribute import distribute_model_from_local
         failed = distribute_model_from_local("org/model", [])
         assert failed == []
-        mock_rsync.assert_not_called()
+        mock_tar.assert_not_called()
 
-    @mock.patch("sparkrun.models.distribute.run_rsync_parallel")
+    @mock.patch("sparkrun.models.distribute.run_tar_pipe_parallel")
     @mock.patch("sparkrun.models.distribute.download_model")
-    def test_transfer_hosts_used(self, mock_dl, mock_rsync):
-        """When transfer_hosts provided, rsync targets use IB IPs."""
+    def test_transfer_hosts_used(self, mock_dl, mock_tar):
+        """When transfer_hosts provided, transfer targets use IB IPs."""
         mock_dl.return_value = 0
-        mock_rsync.return_value = [
+        mock_tar.return_value = [
             RemoteResult(host="10.0.0.1", returncode=0, stdout="ok", stderr=""),
             RemoteResult(host="10.0.0.2", returncode=0, stdout="ok", stderr=""),
         ]
@@ -678,19 +865,23 @@ class TestDistributeModelFromLocal:
             transfer_hosts=["10.0.0.1", "10.0.0.2"],
         )
         assert failed == []
-        # Rsync should receive IB IPs
-        rsynced_hosts = mock_rsync.call_args[0][1]
-        assert rsynced_hosts == ["10.0.0.1", "10.0.0.2"]
+        # Tar pipe should receive IB IPs
+        transfer_hosts = mock_tar.call_args[0][1]
+        assert transfer_hosts == ["10.0.0.1", "10.0.0.2"]
 
     @mock.patch("sparkrun.models.distribute.run_rsync_parallel")
+    @mock.patch("sparkrun.models.distribute.run_tar_pipe_parallel")
     @mock.patch("sparkrun.models.distribute.download_model")
-    def test_transfer_hosts_failure_maps_back(self, mock_dl, mock_rsync):
+    def test_transfer_hosts_failure_maps_back(self, mock_dl, mock_tar, mock_rsync):
         """Failures on transfer IPs are reported as management hostnames."""
         mock_dl.return_value = 0
-        mock_rsync.return_value = [
+        mock_tar.return_value = [
             RemoteResult(host="10.0.0.1", returncode=0, stdout="ok", stderr=""),
             RemoteResult(host="10.0.0.2", returncode=1, stdout="", stderr="err"),
         ]
+        mock_rsync.return_value = [
+            RemoteResult(host="10.0.0.2", returncode=1, stdout="", stderr="err"),
+        ]
         from sparkrun.models.distribute import distribute_model_from_local
         failed = distribute_model_from_local(
             "org/model", ["mgmt1", "mgmt2"],
@@ -699,6 +890,227 @@ class TestDistributeModelFromLocal:
         assert failed == ["mgmt2"]
 
 
+class TestDownloadAndStream:
+    """Test the download/distribute overlap in _download_and_stream."""
+
+    def test_completed_snapshot_files_skips_in_flight(self, tmp_path):
+        """Files with in-flight marker suffixes are not considered done."""
+        import os
+
+        from sparkrun.models.distribute import _completed_snapshot_files
+        (tmp_path / "blobs").mkdir()
+        (tmp_path / "blobs" / "aaa").write_text("done")
+        (tmp_path / "blobs" / "bbb.incomplete").write_text("partial")
+        (tmp_path / "blobs" / "ccc.tmp").write_text("partial")
+        done = _completed_snapshot_files(str(tmp_path))
+        assert done == {(os.path.join("blobs", "aaa"), 4)}
+
+    @mock.patch("sparkrun.models.distribute.run_rsync_parallel")
+    @mock.patch("sparkrun.models.distribute.download_model")
+    @mock.patch("sparkrun.models.distribute.is_model_cached")
+    def test_cached_model_skips_streaming(self, mock_cached, mock_dl, mock_rsync):
+        """An already-cached model is just (re-)verified, never streamed."""
+        mock_cached.return_value = True
+        mock_dl.return_value = 0
+        from sparkrun.models.distribute import _download_and_stream
+        rc = _download_and_stream("org/model", "/cache", ["h1"], ["h1"])
+        assert rc == 0
+        mock_dl.assert_called_once()
+        mock_rsync.assert_not_called()
+
+    @mock.patch("sparkrun.models.distribute._try_fix_remote_permissions")
+    @mock.patch("sparkrun.models.distribute.run_rsync_parallel")
+    @mock.patch("sparkrun.models.distribute.download_model")
+    @mock.patch("sparkrun.models.distribute.is_model_cached")
+    def test_streams_shards_while_downloading(
+        self, mock_cached, mock_dl, mock_rsync, mock_fix, tmp_path,
+    ):
+        """Completed files are pushed to hosts before the download finishes."""
+        import time
+
+        mock_cached.return_value = False
+        model_path = tmp_path / "hub" / "models--org--model" / "snapshots" / "abc"
+
+        def slow_download(*args, **kwargs):
+            model_path.mkdir(parents=True)
+            (model_path / "model-00001.safetensors").write_text("shard1")
+            time.sleep(0.2)
+            return 0
+
+        mock_dl.side_effect = slow_download
+        from sparkrun.models.distribute import _download_and_stream
+        rc = _download_and_stream(
+            "org/model", str(tmp_path), ["h1"], ["h1"],
+            poll_interval=0.02,
+        )
+        assert rc == 0
+        # At least one interim push happened while the download slept
+        assert mock_rsync.called
+        # In-flight blobs are excluded from every interim push
+        opts = mock_rsync.call_args[1]["rsync_options"]
+        assert "--exclude=*.incomplete" in opts
+        # Permission fix ran once before the first push
+        mock_fix.assert_called_once()
+
+    @mock.patch("sparkrun.models.distribute.run_rsync_parallel")
+    @mock.patch("sparkrun.models.distribute.download_model")
+    @mock.patch("sparkrun.models.distribute.is_model_cached")
+    def test_no_push_until_files_complete(self, mock_cached, mock_dl, mock_rsync, tmp_path):
+        """Nothing is pushed while only in-flight files exist."""
+        import time
+
+        mock_cached.return_value = False
+        blobs = tmp_path / "hub" / "models--org--model" / "blobs"
+
+        def slow_download(*args, **kwargs):
+            blobs.mkdir(parents=True)
+            (blobs / "aaa.incomplete").write_text("partial")
+            time.sleep(0.1)
+            return 0
+
+        mock_dl.side_effect = slow_download
+        from sparkrun.models.distribute import _download_and_stream
+        rc = _download_and_stream(
+            "org/model", str(tmp_path), ["h1"], ["h1"],
+            poll_interval=0.02,
+        )
+        assert rc == 0
+        mock_rsync.assert_not_called()
+
+
+class TestDistributeModelsFromLocal:
+    """Test distribute_models_from_local (batched multi-model transfer)."""
+
+    @mock.patch("sparkrun.models.distribute._try_fix_remote_permissions")
+    @mock.patch("sparkrun.models.distribute.run_rsync_parallel")
+    @mock.patch("sparkrun.models.distribute.download_models")
+    def test_single_rsync_covers_all_models(self, mock_dl, mock_rsync, mock_fix):
+        mock_dl.return_value = []
+        mock_rsync.return_value = [
+            RemoteResult(host="h1", returncode=0, stdout="ok", stderr=""),
+        ]
+
+        captured = {}
+
+        def _capture(*args, **kwargs):
+            with open(kwargs["files_from"]) as f:
+                captured["list"] = f.read()
+            return mock_rsync.return_value
+
+        mock_rsync.side_effect = _capture
+        from sparkrun.models.distribute import distribute_models_from_local
+        failed = distribute_models_from_local(
+            ["org/model-a", "org/model-b"], ["h1"],
+        )
+        assert failed == []
+        assert mock_dl.call_args[0][0] == ["org/model-a", "org/model-b"]
+        mock_rsync.assert_called_once()
+        # Single transfer rooted at hub/ with both model dirs in the list
+        args = mock_rsync.call_args[0]
+        assert args[0].endswith("/hub")
+        assert args[2].endswith("/hub")
+        assert "models--org--model-a\0" in captured["list"]
+        assert "models--org--model-b\0" in captured["list"]
+
+    @mock.patch("sparkrun.models.distribute.run_rsync_parallel")
+    @mock.patch("sparkrun.models.distribute.download_models")
+    def test_download_failure_aborts(self, mock_dl, mock_rsync):
+        mock_dl.return_value = ["org/model-b"]
+        from sparkrun.models.distribute import distribute_models_from_local
+        failed = distribute_models_from_local(
+            ["org/model-a", "org/model-b"], ["h1", "h2"],
+        )
+        assert failed == ["h1", "h2"]
+        mock_rsync.assert_not_called()
+
+    @mock.patch("sparkrun.models.distribute._try_fix_remote_permissions")
+    @mock.patch("sparkrun.models.distribute.run_rsync_parallel")
+    @mock.patch("sparkrun.models.distribute.download_models")
+    def test_transfer_failure_maps_back(self, mock_dl, mock_rsync, mock_fix):
+        """IB transfer-host failures are reported as management hostnames."""
+        mock_dl.return_value = []
+        mock_rsync.return_value = [
+            RemoteResult(host="10.0.0.1", returncode=0, stdout="ok", stderr=""),
+            RemoteResult(host="10.0.0.2", returncode=1, stdout="", stderr="err"),
+        ]
+        from sparkrun.models.distribute import distribute_models_from_local
+        failed = distribute_models_from_local(
+            ["org/model-a"], ["h1", "h2"],
+            transfer_hosts=["10.0.0.1", "10.0.0.2"],
+        )
+        assert failed == ["h2"]
+
+    def test_empty_model_list(self):
+        from sparkrun.models.distribute import distribute_models_from_local
+        assert distribute_models_from_local([], ["h1"]) == []
+
+
+class TestSnapshotFingerprint:
+    """Test snapshot_fingerprint."""
+
+    def test_deterministic(self, tmp_path):
+        from sparkrun.models.download import snapshot_fingerprint
+        (tmp_path / "a.bin").write_bytes(b"12345")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.bin").write_bytes(b"678")
+        assert snapshot_fingerprint(str(tmp_path)) == snapshot_fingerprint(str(tmp_path))
+
+    def test_changes_with_content_size(self, tmp_path):
+        from sparkrun.models.download import snapshot_fingerprint
+        (tmp_path / "a.bin").write_bytes(b"12345")
+        before = snapshot_fingerprint(str(tmp_path))
+        (tmp_path / "a.bin").write_bytes(b"123456")
+        assert snapshot_fingerprint(str(tmp_path)) != before
+
+    def test_ignores_symlinks(self, tmp_path):
+        from sparkrun.models.download import snapshot_fingerprint
+        (tmp_path / "a.bin").write_bytes(b"12345")
+        before = snapshot_fingerprint(str(tmp_path))
+        (tmp_path / "link.bin").symlink_to(tmp_path / "a.bin")
+        assert snapshot_fingerprint(str(tmp_path)) == before
+
+    def test_missing_directory(self, tmp_path):
+        from sparkrun.models.download import snapshot_fingerprint
+        # Missing dir hashes like an empty one (zero lines)
+        empty = tmp_path / "empty"
+        empty.mkdir()
+        assert snapshot_fingerprint(str(tmp_path / "nope")) == snapshot_fingerprint(str(empty))
+
+
+class TestProbeSyncedHosts:
+    """Test _probe_synced_hosts."""
+
+    @mock.patch("sparkrun.models.distribute.run_remote_scripts_parallel")
+    def test_matching_digest_is_synced(self, mock_parallel, tmp_path):
+        from sparkrun.models.download import snapshot_fingerprint
+        from sparkrun.models.distribute import _probe_synced_hosts
+        (tmp_path / "a.bin").write_bytes(b"12345")
+        digest = snapshot_fingerprint(str(tmp_path))
+        mock_parallel.return_value = [
+            RemoteResult(host="h1", returncode=0, stdout=f"{digest}  -\n", stderr=""),
+            RemoteResult(host="h2", returncode=0, stdout="absent\n", stderr=""),
+        ]
+        synced = _probe_synced_hosts(str(tmp_path), ["h1", "h2"])
+        assert synced == {"h1"}
+
+    @mock.patch("sparkrun.models.distribute.run_remote_scripts_parallel")
+    def test_failed_probe_not_synced(self, mock_parallel, tmp_path):
+        from sparkrun.models.distribute import _probe_synced_hosts
+        mock_parallel.return_value = [
+            RemoteResult(host="h1", returncode=1, stdout="", stderr="ssh error"),
+        ]
+        synced = _probe_synced_hosts(str(tmp_path), ["h1"])
+        assert synced == set()
+
+    def test_dry_run_probes_nothing(self, tmp_path):
+        from sparkrun.models.distribute import _probe_synced_hosts
+        assert _probe_synced_hosts(str(tmp_path), ["h1"], dry_run=True) == set()
+
+    def test_empty_hosts(self, tmp_path):
+        from sparkrun.models.distribute import _probe_synced_hosts
+        assert _probe_synced_hosts(str(tmp_path), []) == set()
+
+
 class TestDistributeModelFromHead:
     """Test distribute_model_from_head."""
 
@@ -713,8 +1125,9 @@ class TestDistributeModelFromHead:
         assert failed == []
         assert mock_run.call_count == 1
 
+    @mock.patch("sparkrun.models.distribute._try_fix_remote_permissions")
     @mock.patch("sparkrun.orchestration.ssh.run_remote_script")
-    def test_multi_host(self, mock_run):
+    def test_multi_host(self, mock_run, mock_fix):
         """Multi host: download on head, then distribute script."""
         mock_run.return_value = RemoteResult(
             host="head", returncode=0, stdout="ok", stderr="",
@@ -728,6 +1141,9 @@ class TestDistributeModelFromHead:
         assert "w1" in dist_script
         assert "w2" in dist_script
         assert "models--org--model" in dist_script
+        # Fast-path rsync flags are rendered into the script
+        assert "--whole-file" in dist_script
+        assert "--inplace" in dist_script
 
     @mock.patch("sparkrun.orchestration.ssh.run_remote_script")
     def test_download_fails(self, mock_run):
@@ -739,8 +1155,9 @@ class TestDistributeModelFromHead:
         failed = distribute_model_from_head("org/model", ["head", "w1"])
         assert failed == ["head", "w1"]
 
+    @mock.patch("sparkrun.models.distribute._try_fix_remote_permissions")
     @mock.patch("sparkrun.orchestration.ssh.run_remote_script")
-    def test_distribute_fails(self, mock_run):
+    def test_distribute_fails(self, mock_run, mock_fix):
         """If distribution script fails, target hosts are returned as failed."""
         mock_run.side_effect = [
             RemoteResult(host="head", returncode=0, stdout="ok", stderr=""),
@@ -755,8 +1172,9 @@ class TestDistributeModelFromHead:
         failed = distribute_model_from_head("org/model", [])
         assert failed == []
 
+    @mock.patch("sparkrun.models.distribute._try_fix_remote_permissions")
     @mock.patch("sparkrun.orchestration.ssh.run_remote_script")
-    def test_worker_transfer_hosts(self, mock_run):
+    def test_worker_transfer_hosts(self, mock_run, mock_fix):
         """worker_transfer_hosts are used for distribution targets."""
         mock_run.return_value = RemoteResult(
             host="head", returncode=0, stdout="ok", stderr="",
@@ -772,6 +1190,31 @@ class TestDistributeModelFromHead:
         assert "10.0.0.1" in dist_script
         assert "10.0.0.2" in dist_script
 
+    @mock.patch("sparkrun.models.distribute._try_fix_remote_permissions")
+    @mock.patch("sparkrun.orchestration.ssh.run_remote_script")
+    def test_worker_perm_fix_overlaps_download(self, mock_run, mock_fix):
+        """Multi-host runs fix worker cache ownership alongside the head download."""
+        mock_run.return_value = RemoteResult(
+            host="head", returncode=0, stdout="ok", stderr="",
+        )
+        from sparkrun.models.distribute import distribute_model_from_head
+        failed = distribute_model_from_head("org/model", ["head", "w1", "w2"])
+        assert failed == []
+        mock_fix.assert_called_once()
+        assert mock_fix.call_args[0][1] == ["w1", "w2"]
+
+    @mock.patch("sparkrun.models.distribute._try_fix_remote_permissions")
+    @mock.patch("sparkrun.orchestration.ssh.run_remote_script")
+    def test_single_host_skips_perm_fix(self, mock_run, mock_fix):
+        """Single-host runs have no workers to prepare."""
+        mock_run.return_value = RemoteResult(
+            host="head", returncode=0, stdout="downloaded", stderr="",
+        )
+        from sparkrun.models.distribute import distribute_model_from_head
+        failed = distribute_model_from_head("org/model", ["head"])
+        assert failed == []
+        mock_fix.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # InfiniBand detection helpers
@@ -20,32 +20,79 @@ from sparkrun.models.download import (
 from sparkrun.models.distribute import _model_cache_path
 
 
+_FAKE_GGUF = b"fake gguf"
+_FAKE_WEIGHTS = b"fake"
+
+
+def _make_snapshot(root: Path, repo: str, commit: str = "abc123",
+                   files: tuple[str, ...] = (), ref: str | None = None) -> Path:
+    """Build a fake HF cache snapshot, optionally with a ref file.
+
+    Single helper behind every cache-layout fixture in this module —
+    returns the snapshot directory so callers can place extra files.
+    """
+    model_cache = root / "hub" / f"models--{repo.replace('/', '--')}"
+    snapshot = model_cache / "snapshots" / commit
+    # os.makedirs recurses C-side; refs first so the shared model_cache
+    # ancestors exist before the snapshot walk
+    if ref:
+        refs_dir = model_cache / "refs"
+        os.makedirs(refs_dir, exist_ok=True)
+        (refs_dir / ref).write_bytes(commit.encode())
+    os.makedirs(snapshot, exist_ok=True)
+    for f in files:
+        (snapshot / f).write_bytes(_FAKE_WEIGHTS)
+    return snapshot
+
+
+def _create_cached_gguf(cache_dir: Path, repo: str, filename: str) -> Path:
+    """Create a fake GGUF file in the HF cache structure."""
+    gguf_file = _make_snapshot(cache_dir, repo) / filename
+    gguf_file.write_bytes(_FAKE_GGUF)
+    return gguf_file
+
+
+@pytest.fixture(scope="session")
+def gguf_cache_factory(tmp_path_factory):
+    """Session factory for read-only fake GGUF caches.
+
+    Returns ``make(repo, filename) -> (cache_dir, gguf_path)``, building
+    one cache skeleton per distinct pair and reusing it, so tests that
+    only read the cache share a directory instead of recreating the
+    four-level layout each time.  Tests that mutate the cache keep
+    using ``tmp_path`` with :func:`_create_cached_gguf` directly.
+    """
+    built: dict[tuple[str, str], tuple[Path, Path]] = {}
+
+    def make(repo: str, filename: str) -> tuple[Path, Path]:
+        key = (repo, filename)
+        if key not in built:
+            cache_dir = tmp_path_factory.mktemp("gguf-cache")
+            built[key] = (cache_dir, _create_cached_gguf(cache_dir, repo, filename))
+        return built[key]
+
+    return make
+
+
 # ---------------------------------------------------------------------------
 # parse_gguf_model_spec
 # ---------------------------------------------------------------------------
 
 class TestParseGgufModelSpec:
 
-    def test_repo_with_quant(self):
-        repo, quant = parse_gguf_model_spec("Qwen/Qwen3-1.7B-GGUF:Q4_K_M")
-        assert repo == "Qwen/Qwen3-1.7B-GGUF"
-        assert quant == "Q4_K_M"
-
-    def test_repo_without_quant(self):
-        repo, quant = parse_gguf_model_spec("Qwen/Qwen3-1.7B-GGUF")
-        assert repo == "Qwen/Qwen3-1.7B-GGUF"
-        assert quant is None
-
-    def test_non_gguf_repo(self):
-        repo, quant = parse_gguf_model_spec("meta-llama/Llama-3-8B")
-        assert repo == "meta-llama/Llama-3-8B"
-        assert quant is None
-
-    def test_multiple_colons_uses_last(self):
-        """rsplit on ':' takes the last segment as quant."""
-        repo, quant = parse_gguf_model_spec("org/repo:tag:Q8_0")
-        assert repo == "org/repo:tag"
-        assert quant == "Q8_0"
+    @pytest.mark.parametrize("spec,repo,quant", [
+        pytest.param("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", "Qwen/Qwen3-1.7B-GGUF", "Q4_K_M",
+                     id="repo-with-quant"),
+        pytest.param("Qwen/Qwen3-1.7B-GGUF", "Qwen/Qwen3-1.7B-GGUF", None,
+                     id="repo-without-quant"),
+        pytest.param("meta-llama/Llama-3-8B", "meta-llama/Llama-3-8B", None,
+                     id="non-gguf-repo"),
+        # rsplit on ':' takes the last segment as quant
+        pytest.param("org/repo:tag:Q8_0", "org/repo:tag", "Q8_0",
+                     id="multiple-colons-uses-last"),
+    ])
+    def test_parse(self, spec, repo, quant):
+        assert parse_gguf_model_spec(spec) == (repo, quant)
 
 
 # ---------------------------------------------------------------------------
@@ -54,21 +101,16 @@ class TestParseGgufModelSpec:
 
 class TestIsGgufModel:
 
-    def test_repo_with_quant(self):
-        assert is_gguf_model("Qwen/Qwen3-1.7B-GGUF:Q4_K_M") is True
-
-    def test_repo_with_gguf_in_name(self):
-        assert is_gguf_model("Qwen/Qwen3-1.7B-GGUF") is True
-
-    def test_case_insensitive(self):
-        assert is_gguf_model("org/model-gguf") is True
-
-    def test_non_gguf(self):
-        assert is_gguf_model("meta-llama/Llama-3-8B") is False
-
-    def test_quant_on_non_gguf_name(self):
-        """Colon syntax always means GGUF even if name doesn't say GGUF."""
-        assert is_gguf_model("org/some-model:Q4_K_M") is True
+    @pytest.mark.parametrize("model_id,expected", [
+        pytest.param("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", True, id="repo-with-quant"),
+        pytest.param("Qwen/Qwen3-1.7B-GGUF", True, id="gguf-in-name"),
+        pytest.param("org/model-gguf", True, id="case-insensitive"),
+        pytest.param("meta-llama/Llama-3-8B", False, id="non-gguf"),
+        # Colon syntax always means GGUF even if name doesn't say GGUF
+        pytest.param("org/some-model:Q4_K_M", True, id="quant-on-non-gguf-name"),
+    ])
+    def test_is_gguf(self, model_id, expected):
+        assert is_gguf_model(model_id) is expected
 
 
 # ---------------------------------------------------------------------------
@@ -77,47 +119,64 @@ class TestIsGgufModel:
 
 class TestResolveGgufPath:
 
-    def _create_cached_gguf(self, cache_dir: Path, repo: str, filename: str):
-        """Create a fake GGUF file in the HF cache structure."""
-        safe_name = repo.replace("/", "--")
-        snapshot = cache_dir / "hub" / f"models--{safe_name}" / "snapshots" / "abc123"
-        snapshot.mkdir(parents=True, exist_ok=True)
-        gguf_file = snapshot / filename
-        gguf_file.write_text("fake gguf")
-        return gguf_file
-
-    def test_finds_matching_quant(self, tmp_path):
-        gguf = self._create_cached_gguf(
-            tmp_path, "Qwen/Qwen3-1.7B-GGUF", "qwen3-1.7b-q4_k_m.gguf",
+    def test_finds_matching_quant(self, gguf_cache_factory):
+        cache_dir, gguf = gguf_cache_factory(
+            "Qwen/Qwen3-1.7B-GGUF", "qwen3-1.7b-q4_k_m.gguf",
         )
-        result = resolve_gguf_path("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", str(tmp_path))
+        result = resolve_gguf_path("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", str(cache_dir))
         assert result == str(gguf)
 
-    def test_no_match_returns_none(self, tmp_path):
-        self._create_cached_gguf(
-            tmp_path, "Qwen/Qwen3-1.7B-GGUF", "qwen3-1.7b-q8_0.gguf",
+    def test_no_match_returns_none(self, gguf_cache_factory):
+        cache_dir, _ = gguf_cache_factory(
+            "Qwen/Qwen3-1.7B-GGUF", "qwen3-1.7b-q8_0.gguf",
         )
-        result = resolve_gguf_path("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", str(tmp_path))
+        result = resolve_gguf_path("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", str(cache_dir))
         assert result is None
 
     def test_no_cache_dir_returns_none(self, tmp_path):
         result = resolve_gguf_path("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", str(tmp_path))
         assert result is None
 
-    def test_no_quant_returns_first_gguf(self, tmp_path):
-        gguf = self._create_cached_gguf(
-            tmp_path, "Qwen/Qwen3-1.7B-GGUF", "some-model.gguf",
+    def test_no_quant_returns_first_gguf(self, gguf_cache_factory):
+        cache_dir, gguf = gguf_cache_factory(
+            "Qwen/Qwen3-1.7B-GGUF", "some-model.gguf",
         )
-        result = resolve_gguf_path("Qwen/Qwen3-1.7B-GGUF", str(tmp_path))
+        result = resolve_gguf_path("Qwen/Qwen3-1.7B-GGUF", str(cache_dir))
         assert result == str(gguf)
 
-    def test_case_insensitive_quant_match(self, tmp_path):
-        gguf = self._create_cached_gguf(
-            tmp_path, "Qwen/Qwen3-1.7B-GGUF", "Qwen3-1.7B-Q4_K_M.gguf",
+    def test_case_insensitive_quant_match(self, gguf_cache_factory):
+        cache_dir, gguf = gguf_cache_factory(
+            "Qwen/Qwen3-1.7B-GGUF", "Qwen3-1.7B-Q4_K_M.gguf",
         )
-        result = resolve_gguf_path("Qwen/Qwen3-1.7B-GGUF:q4_k_m", str(tmp_path))
+        result = resolve_gguf_path("Qwen/Qwen3-1.7B-GGUF:q4_k_m", str(cache_dir))
+        assert result == str(gguf)
+
+    def test_gguf_in_quant_subdirectory(self, tmp_path):
+        """Files inside quant-named snapshot subfolders (Q6_K/) are found."""
+        safe_name = "Qwen--Qwen3-1.7B-GGUF"
+        subdir = tmp_path / "hub" / f"models--{safe_name}" / "snapshots" / "abc123" / "Q6_K"
+        subdir.mkdir(parents=True)
+        gguf = subdir / "qwen3-1.7b-Q6_K.gguf"
+        gguf.write_bytes(_FAKE_GGUF)
+        result = resolve_gguf_path("Qwen/Qwen3-1.7B-GGUF:Q6_K", str(tmp_path))
         assert result == str(gguf)
 
+    def test_result_is_memoized(self, tmp_path):
+        """Repeated scans are cached while the cache dir is unchanged."""
+        gguf = _create_cached_gguf(
+            tmp_path, "Qwen/Qwen3-1.7B-GGUF", "qwen3-1.7b-q4_k_m.gguf",
+        )
+        spec = "Qwen/Qwen3-1.7B-GGUF:Q4_K_M"
+        assert resolve_gguf_path(spec, str(tmp_path)) == str(gguf)
+        with mock.patch("sparkrun.models.download._resolve_gguf_path_scan") as mock_scan:
+            assert resolve_gguf_path(spec, str(tmp_path)) == str(gguf)
+            mock_scan.assert_not_called()
+        # Changing the cache directory invalidates the entry automatically
+        gguf.unlink()
+        st = os.stat(gguf.parent)
+        os.utime(gguf.parent, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+        assert resolve_gguf_path(spec, str(tmp_path)) is None
+
 
 # ---------------------------------------------------------------------------
 # resolve_gguf_container_path
@@ -125,20 +184,12 @@ class TestResolveGgufPath:
 
 class TestResolveGgufContainerPath:
 
-    def _create_cached_gguf(self, cache_dir: Path, repo: str, filename: str):
-        safe_name = repo.replace("/", "--")
-        snapshot = cache_dir / "hub" / f"models--{safe_name}" / "snapshots" / "abc123"
-        snapshot.mkdir(parents=True, exist_ok=True)
-        gguf_file = snapshot / filename
-        gguf_file.write_text("fake gguf")
-        return gguf_file
-
-    def test_translates_host_to_container_path(self, tmp_path):
-        self._create_cached_gguf(
-            tmp_path, "Qwen/Qwen3-1.7B-GGUF", "qwen3-1.7b-q4_k_m.gguf",
+    def test_translates_host_to_container_path(self, gguf_cache_factory):
+        cache_dir, _ = gguf_cache_factory(
+            "Qwen/Qwen3-1.7B-GGUF", "qwen3-1.7b-q4_k_m.gguf",
         )
         result = resolve_gguf_container_path(
-            "Qwen/Qwen3-1.7B-GGUF:Q4_K_M", str(tmp_path),
+            "Qwen/Qwen3-1.7B-GGUF:Q4_K_M", str(cache_dir),
         )
         assert result is not None
         assert result.startswith(CONTAINER_HF_CACHE)
@@ -150,6 +201,23 @@ class TestResolveGgufContainerPath:
         )
         assert result is None
 
+    def test_pre_resolved_host_path_skips_scan(self, tmp_path):
+        """An explicit host_path is mapped directly without re-resolving."""
+        with mock.patch("sparkrun.models.download.resolve_gguf_path") as mock_resolve:
+            result = resolve_gguf_container_path(
+                "Qwen/Qwen3-1.7B-GGUF:Q4_K_M", str(tmp_path),
+                host_path=f"{tmp_path}/hub/models--x/snapshots/a/m.gguf",
+            )
+        mock_resolve.assert_not_called()
+        assert result == f"{CONTAINER_HF_CACHE}/hub/models--x/snapshots/a/m.gguf"
+
+    def test_host_path_outside_cache_returns_none(self, tmp_path):
+        result = resolve_gguf_container_path(
+            "Qwen/Qwen3-1.7B-GGUF:Q4_K_M", str(tmp_path),
+            host_path="/elsewhere/m.gguf",
+        )
+        assert result is None
+
 
 # ---------------------------------------------------------------------------
 # is_model_cached (GGUF-aware)
@@ -157,23 +225,17 @@ class TestResolveGgufContainerPath:
 
 class TestIsModelCachedGguf:
 
-    def _create_cached_gguf(self, cache_dir: Path, repo: str, filename: str):
-        safe_name = repo.replace("/", "--")
-        snapshot = cache_dir / "hub" / f"models--{safe_name}" / "snapshots" / "abc123"
-        snapshot.mkdir(parents=True, exist_ok=True)
-        (snapshot / filename).write_text("fake gguf")
-
-    def test_cached_gguf_returns_true(self, tmp_path):
-        self._create_cached_gguf(
-            tmp_path, "Qwen/Qwen3-1.7B-GGUF", "qwen3-1.7b-q4_k_m.gguf",
+    def test_cached_gguf_returns_true(self, gguf_cache_factory):
+        cache_dir, _ = gguf_cache_factory(
+            "Qwen/Qwen3-1.7B-GGUF", "qwen3-1.7b-q4_k_m.gguf",
         )
-        assert is_model_cached("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", str(tmp_path)) is True
+        assert is_model_cached("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", str(cache_dir)) is True
 
-    def test_wrong_quant_returns_false(self, tmp_path):
-        self._create_cached_gguf(
-            tmp_path, "Qwen/Qwen3-1.7B-GGUF", "qwen3-1.7b-q8_0.gguf",
+    def test_wrong_quant_returns_false(self, gguf_cache_factory):
+        cache_dir, _ = gguf_cache_factory(
+            "Qwen/Qwen3-1.7B-GGUF", "qwen3-1.7b-q8_0.gguf",
         )
-        assert is_model_cached("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", str(tmp_path)) is False
+        assert is_model_cached("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", str(cache_dir)) is False
 
     def test_not_cached_returns_false(self, tmp_path):
         assert is_model_cached("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", str(tmp_path)) is False
@@ -201,37 +263,112 @@ class TestModelCachePathGguf:
 
 class TestDownloadModelGguf:
 
-    @mock.patch("sparkrun.models.download.resolve_gguf_path", return_value="/cached/q4.gguf")
-    def test_gguf_already_cached_still_verifies(self, mock_resolve):
-        """GGUF model already cached still calls snapshot_download to verify completeness."""
-        mock_hf = mock.MagicMock()
-        with mock.patch.dict("sys.modules", {"huggingface_hub": mock_hf, "huggingface_hub.utils": mock_hf.utils}):
-            rc = download_model("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", cache_dir="/fake")
+    @pytest.fixture(autouse=True, scope="class")
+    @staticmethod
+    def _hf_stub():
+        """Stub huggingface_hub in sys.modules once for the whole class.
+
+        Keeps the download path from ever attempting the real import and
+        builds the MagicMock module tree a single time.
+        """
+        hf = mock.MagicMock()
+        with mock.patch.dict("sys.modules", {"huggingface_hub": hf, "huggingface_hub.utils": hf.utils}):
+            yield hf
+
+    @pytest.fixture(autouse=True)
+    @staticmethod
+    def _reset_hf(_hf_stub):
+        """Clear call history and configured returns between tests."""
+        _hf_stub.reset_mock(return_value=True, side_effect=True)
+
+    @pytest.fixture(autouse=True)
+    def mock_resolve(self):
+        """resolve_gguf_path patched to a cache miss, started once per test.
+
+        One patcher per test instead of a decorator per method; tests
+        that need a cache hit just set ``mock_resolve.return_value``.
+        """
+        with mock.patch("sparkrun.models.download.resolve_gguf_path", return_value=None) as m:
+            yield m
+
+    def test_gguf_already_cached_still_verifies(self, mock_resolve, _hf_stub):
+        """GGUF model already cached still re-fetches to verify completeness."""
+        mock_resolve.return_value = "/cached/q4.gguf"
+        _hf_stub.HfApi.return_value.list_repo_files.return_value = ["model-Q4_K_M.gguf"]
+        rc = download_model("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", cache_dir="/fake",
+                            verify_cache=True)
+        assert rc == 0
+        mock_resolve.assert_called_once()
+        # The download should have run even though the cache existed
+        _hf_stub.hf_hub_download.assert_called_once()
+
+    def test_gguf_downloads_with_allow_patterns(self):
+        """GGUF specs are dispatched to _download_gguf."""
+        import sparkrun.models.download as dl_mod
+
+        def patched_download(model_id, cache_dir=None, token=None, revision=None,
+                             dry_run=False, verify_cache=False):
+            # Just verify it's called with the right model
+            assert model_id == "Qwen/Qwen3-1.7B-GGUF:Q4_K_M"
+            return 0
+
+        with mock.patch.object(dl_mod, "_download_gguf", side_effect=patched_download):
+            rc = dl_mod.download_model("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", cache_dir="/fake")
             assert rc == 0
-            mock_resolve.assert_called_once()
-            # snapshot_download should have been called even though cache existed
-            mock_hf.snapshot_download.assert_called_once()
-
-    @mock.patch("sparkrun.models.download.resolve_gguf_path", return_value=None)
-    @mock.patch("sparkrun.models.download.snapshot_download", create=True)
-    def test_gguf_downloads_with_allow_patterns(self, mock_snap, mock_resolve):
-        """GGUF download uses allow_patterns for the quant variant."""
-        # Mock the import inside _download_gguf
-        with mock.patch.dict("sys.modules", {"huggingface_hub": mock.MagicMock()}) as _:
-            from huggingface_hub import snapshot_download as sd
-            with mock.patch("sparkrun.models.download.resolve_gguf_path", return_value=None):
-                # Use the actual function but patch the inner import
-                import sparkrun.models.download as dl_mod
-                orig = dl_mod._download_gguf
-
-                def patched_download(model_id, cache_dir=None, token=None, revision=None, dry_run=False):
-                    # Just verify it's called with the right model
-                    assert model_id == "Qwen/Qwen3-1.7B-GGUF:Q4_K_M"
-                    return 0
-
-                with mock.patch.object(dl_mod, "_download_gguf", side_effect=patched_download):
-                    rc = dl_mod.download_model("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", cache_dir="/fake")
-                    assert rc == 0
+
+    def test_quant_uses_targeted_file_fetch(self, _hf_stub):
+        """With a quant variant, only matching repo files are downloaded."""
+        _hf_stub.HfApi.return_value.list_repo_files.return_value = [
+            "README.md",
+            "model-Q4_K_M-00001-of-00002.gguf",
+            "model-Q4_K_M-00002-of-00002.gguf",
+            "model-Q8_0.gguf",
+        ]
+        rc = download_model("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", cache_dir="/fake")
+        assert rc == 0
+        downloaded = {
+            c.kwargs["filename"] for c in _hf_stub.hf_hub_download.call_args_list
+        }
+        assert downloaded == {
+            "model-Q4_K_M-00001-of-00002.gguf",
+            "model-Q4_K_M-00002-of-00002.gguf",
+        }
+        # The snapshot path should not have been taken
+        _hf_stub.snapshot_download.assert_not_called()
+
+    def test_companion_files_fetched_with_quant(self, _hf_stub):
+        """Tokenizer/mmproj companions ride along with the quant shards."""
+        _hf_stub.HfApi.return_value.list_repo_files.return_value = [
+            "README.md",
+            "model-Q4_K_M.gguf",
+            "mmproj-model-f16.gguf",
+            "tokenizer.json",
+            "model-Q8_0.gguf",
+        ]
+        rc = download_model("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", cache_dir="/fake")
+        assert rc == 0
+        downloaded = {
+            c.kwargs["filename"] for c in _hf_stub.hf_hub_download.call_args_list
+        }
+        assert downloaded == {
+            "model-Q4_K_M.gguf",
+            "mmproj-model-f16.gguf",
+            "tokenizer.json",
+        }
+
+    def test_listing_failure_falls_back_to_snapshot(self, _hf_stub):
+        """If the repo listing fails, snapshot_download is used instead."""
+        import sparkrun.models.download as dl_mod
+        _hf_stub.HfApi.return_value.list_repo_files.side_effect = RuntimeError("offline")
+        with mock.patch.object(dl_mod, "_snapshot_download_fn", None):
+            rc = download_model("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", cache_dir="/fake")
+        assert rc == 0
+        _hf_stub.snapshot_download.assert_called_once()
+
+    def test_no_matching_quant_files_fails(self, _hf_stub):
+        _hf_stub.HfApi.return_value.list_repo_files.return_value = ["model-Q8_0.gguf"]
+        rc = download_model("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", cache_dir="/fake")
+        assert rc == 1
 
     def test_gguf_dry_run(self):
         """Dry-run GGUF download returns 0 without doing anything."""
@@ -247,6 +384,89 @@ class TestDownloadModelGguf:
             mock_gguf.assert_not_called()
 
 
+class TestDownloadModels:
+
+    @mock.patch("sparkrun.models.download.download_model")
+    def test_all_succeed(self, mock_dl):
+        from sparkrun.models.download import download_models
+        mock_dl.return_value = 0
+        failed = download_models(["org/a", "org/b", "org/c"])
+        assert failed == []
+        assert mock_dl.call_count == 3
+
+    @mock.patch("sparkrun.models.download.download_model")
+    def test_reports_failed_ids(self, mock_dl):
+        from sparkrun.models.download import download_models
+        mock_dl.side_effect = lambda model_id, **kw: 1 if model_id == "org/b" else 0
+        failed = download_models(["org/a", "org/b"])
+        assert failed == ["org/b"]
+
+    def test_empty_list(self):
+        from sparkrun.models.download import download_models
+        assert download_models([]) == []
+
+
+class TestIsModelCachedMemoized:
+
+    def test_memoized_while_cache_unchanged(self, tmp_path):
+        """Answers are served from cache until the cache dir changes."""
+        safe_name = "org--model"
+        model_cache = tmp_path / "hub" / f"models--{safe_name}"
+        snapshot = model_cache / "snapshots" / "abc123"
+        snapshot.mkdir(parents=True)
+        (snapshot / "model.safetensors").write_bytes(_FAKE_WEIGHTS)
+        (model_cache / "refs").mkdir()
+        (model_cache / "refs" / "main").write_bytes(b"abc123")
+        assert is_model_cached("org/model", str(tmp_path)) is True
+        with mock.patch("sparkrun.models.download._is_model_cached_scan") as mock_scan:
+            assert is_model_cached("org/model", str(tmp_path)) is True
+            mock_scan.assert_not_called()
+
+    def test_invalidates_when_download_completes(self, tmp_path):
+        """A finished download is visible without explicit cache_clear."""
+        safe_name = "org--model"
+        model_cache = tmp_path / "hub" / f"models--{safe_name}"
+        snapshot = model_cache / "snapshots" / "abc123"
+        assert is_model_cached("org/model", str(tmp_path)) is False
+        snapshot.mkdir(parents=True)
+        (snapshot / "model.safetensors").write_bytes(_FAKE_WEIGHTS)
+        (model_cache / "refs").mkdir()
+        (model_cache / "refs" / "main").write_bytes(b"abc123")
+        # The change token differs — fresh scan, no cache_clear needed
+        assert is_model_cached("org/model", str(tmp_path)) is True
+
+
+# ---------------------------------------------------------------------------
+# Download concurrency tuning
+# ---------------------------------------------------------------------------
+
+class TestDownloadWorkers:
+
+    def test_clamped_to_range(self):
+        from sparkrun.models.download import _download_workers
+        assert 4 <= _download_workers() <= 16
+
+    @mock.patch("sparkrun.models.download.os.cpu_count", return_value=1)
+    def test_floor(self, mock_cpus):
+        from sparkrun.models.download import _download_workers
+        assert _download_workers() == 4
+
+    @mock.patch("sparkrun.models.download.os.cpu_count", return_value=64)
+    def test_ceiling(self, mock_cpus):
+        from sparkrun.models.download import _download_workers
+        assert _download_workers() == 16
+
+    @mock.patch.dict(os.environ, {"SPARKRUN_HF_PARALLEL_WORKERS": "32"})
+    def test_env_override(self):
+        from sparkrun.models.download import _download_workers
+        assert _download_workers() == 32
+
+    @mock.patch.dict(os.environ, {"SPARKRUN_HF_PARALLEL_WORKERS": "lots"})
+    def test_invalid_env_override_ignored(self):
+        from sparkrun.models.download import _download_workers
+        assert 4 <= _download_workers() <= 16
+
+
 # ---------------------------------------------------------------------------
 # Revision-aware cache checking
 # ---------------------------------------------------------------------------
@@ -254,66 +474,34 @@ class TestDownloadModelGguf:
 class TestIsModelCachedRevision:
     """Test revision-aware is_model_cached behaviour."""
 
-    def _create_snapshot(self, cache_dir: Path, model_id: str, commit_hash: str,
-                         files: list[str], ref: str | None = None):
-        """Create a fake HF cache snapshot with optional ref."""
-        safe_name = model_id.replace("/", "--")
-        model_cache = cache_dir / "hub" / f"models--{safe_name}"
-        snapshot = model_cache / "snapshots" / commit_hash
-        snapshot.mkdir(parents=True, exist_ok=True)
-        for f in files:
-            (snapshot / f).write_text("fake")
-        if ref:
-            refs_dir = model_cache / "refs"
-            refs_dir.mkdir(parents=True, exist_ok=True)
-            (refs_dir / ref).write_text(commit_hash)
-
     def test_no_revision_defaults_to_main_ref(self, tmp_path):
         """Without revision, checks refs/main first."""
-        self._create_snapshot(
-            tmp_path, "org/model", "abc123",
-            ["model.safetensors"], ref="main",
-        )
+        _make_snapshot(tmp_path, "org/model", files=("model.safetensors",), ref="main")
         assert is_model_cached("org/model", str(tmp_path)) is True
 
     def test_no_revision_config_only_returns_false(self, tmp_path):
         """refs/main snapshot with only config.json is not cached."""
-        self._create_snapshot(
-            tmp_path, "org/model", "abc123",
-            ["config.json"], ref="main",
-        )
+        _make_snapshot(tmp_path, "org/model", files=("config.json",), ref="main")
         assert is_model_cached("org/model", str(tmp_path)) is False
 
     def test_specific_revision_by_ref(self, tmp_path):
         """Checks only the snapshot for the requested ref."""
         # v1 has only config, v2 has weights
-        self._create_snapshot(
-            tmp_path, "org/model", "aaa111",
-            ["config.json"], ref="v1",
-        )
-        self._create_snapshot(
-            tmp_path, "org/model", "bbb222",
-            ["model.safetensors"], ref="v2",
-        )
+        _make_snapshot(tmp_path, "org/model", "aaa111", ("config.json",), ref="v1")
+        _make_snapshot(tmp_path, "org/model", "bbb222", ("model.safetensors",), ref="v2")
         assert is_model_cached("org/model", str(tmp_path), revision="v1") is False
         assert is_model_cached("org/model", str(tmp_path), revision="v2") is True
 
     def test_revision_by_commit_hash(self, tmp_path):
         """Revision can be a direct commit hash (no ref file needed)."""
-        self._create_snapshot(
-            tmp_path, "org/model", "deadbeef",
-            ["model-00001.safetensors"],
-        )
+        _make_snapshot(tmp_path, "org/model", "deadbeef", ("model-00001.safetensors",))
         assert is_model_cached("org/model", str(tmp_path), revision="deadbeef") is True
         assert is_model_cached("org/model", str(tmp_path), revision="other") is False
 
     def test_fallback_to_all_snapshots(self, tmp_path):
         """Falls back to any snapshot when refs/main does not exist."""
-        self._create_snapshot(
-            tmp_path, "org/model", "abc123",
-            ["model.bin"],
-            # No ref — simulates manually placed cache
-        )
+        # No ref — simulates manually placed cache
+        _make_snapshot(tmp_path, "org/model", files=("model.bin",))
         assert is_model_cached("org/model", str(tmp_path)) is True
 
     def test_revision_dry_run_accepted(self):
@@ -325,3 +513,113 @@ class TestIsModelCachedRevision:
         """GGUF download_model accepts revision parameter in dry-run mode."""
         rc = download_model("Qwen/Qwen3-1.7B-GGUF:Q4_K_M", cache_dir="/fake", revision="v1.0", dry_run=True)
         assert rc == 0
+
+
+class TestPinnedRevisionSkip:
+    """Complete commit-hash snapshots skip the hub round trip entirely."""
+
+    COMMIT = "a" * 40
+
+    def test_complete_pinned_snapshot_skips_download(self, tmp_path):
+        """Full-hash revision with a complete snapshot never hits the hub."""
+        _make_snapshot(tmp_path, "org/model", self.COMMIT, ("config.json", "model.safetensors"))
+        with mock.patch("sparkrun.models.download._snapshot_download") as mock_dl:
+            rc = download_model("org/model", cache_dir=str(tmp_path), revision=self.COMMIT)
+        assert rc == 0
+        mock_dl.assert_not_called()
+
+    def test_branch_revision_still_downloads(self, tmp_path):
+        """Branch/tag revisions may move upstream — always re-check."""
+        _make_snapshot(tmp_path, "org/model", files=("model.safetensors",), ref="main")
+        with mock.patch("sparkrun.models.download._snapshot_download", return_value=0) as mock_dl:
+            rc = download_model("org/model", cache_dir=str(tmp_path), revision="main")
+        assert rc == 0
+        mock_dl.assert_called_once()
+
+    def test_incomplete_index_still_downloads(self, tmp_path):
+        """A shard listed in the index but missing on disk forces a download."""
+        snapshot = _make_snapshot(tmp_path, "org/model", self.COMMIT, ("model-00001-of-00002.safetensors",))
+        index = {"weight_map": {
+            "w1": "model-00001-of-00002.safetensors",
+            "w2": "model-00002-of-00002.safetensors",
+        }}
+        import json as _json
+        (snapshot / "model.safetensors.index.json").write_text(_json.dumps(index))
+        with mock.patch("sparkrun.models.download._snapshot_download", return_value=0) as mock_dl:
+            rc = download_model("org/model", cache_dir=str(tmp_path), revision=self.COMMIT)
+        assert rc == 0
+        mock_dl.assert_called_once()
+
+    def test_dangling_symlink_not_complete(self, tmp_path):
+        """Interrupted downloads leave dangling blob symlinks — not complete."""
+        from sparkrun.models.download import _is_snapshot_complete
+
+        snapshot = _make_snapshot(tmp_path, "org/model", self.COMMIT, ("config.json",))
+        (snapshot / "model.safetensors").symlink_to("../../blobs/missing")
+        assert _is_snapshot_complete("org/model", str(tmp_path), self.COMMIT) is False
+
+
+# ---------------------------------------------------------------------------
+# Cross-cache adoption
+# ---------------------------------------------------------------------------
+
+class TestAdoptFromAlternateCache:
+    """Test the cross-cache hardlink fast-path in download_model."""
+
+    def _create_model_cache(self, cache_dir: Path, model_id: str) -> Path:
+        """Create a fake HF cache with blob + symlinked snapshot entry."""
+        safe_name = model_id.replace("/", "--")
+        model_cache = cache_dir / "hub" / f"models--{safe_name}"
+        blobs = model_cache / "blobs"
+        blobs.mkdir(parents=True)
+        (blobs / "deadbeef").write_bytes(b"weights")
+        snapshot = model_cache / "snapshots" / "abc123"
+        snapshot.mkdir(parents=True)
+        (snapshot / "model.safetensors").symlink_to("../../blobs/deadbeef")
+        refs = model_cache / "refs"
+        refs.mkdir()
+        (refs / "main").write_bytes(b"abc123")
+        return model_cache
+
+    def test_adopts_via_hardlinks(self, tmp_path):
+        """Model in an alternate cache is hardlinked, not downloaded."""
+        alt, dst = tmp_path / "alt", tmp_path / "dst"
+        src_cache = self._create_model_cache(alt, "org/model")
+        is_model_cached.cache_clear()
+        with mock.patch("sparkrun.models.download._ALTERNATE_CACHE_DIRS", (str(alt),)):
+            rc = download_model("org/model", cache_dir=str(dst))
+        assert rc == 0
+        dst_blob = dst / "hub" / "models--org--model" / "blobs" / "deadbeef"
+        # Hardlinked: same content, same inode, no bytes copied
+        assert dst_blob.stat().st_ino == (src_cache / "blobs" / "deadbeef").stat().st_ino
+        # Snapshot entry recreated as a relative symlink that still resolves
+        link = dst / "hub" / "models--org--model" / "snapshots" / "abc123" / "model.safetensors"
+        assert link.is_symlink()
+        assert link.read_text() == "weights"
+        # The adopted copy counts as cached
+        assert is_model_cached("org/model", str(dst)) is True
+
+    def test_falls_back_to_download_when_absent(self, tmp_path):
+        """No alternate cache holds the model — normal download runs."""
+        is_model_cached.cache_clear()
+        with mock.patch("sparkrun.models.download._ALTERNATE_CACHE_DIRS",
+                        (str(tmp_path / "missing"),)), \
+             mock.patch("sparkrun.models.download._snapshot_download",
+                        return_value=0) as mock_dl:
+            rc = download_model("org/model", cache_dir=str(tmp_path / "dst"))
+        assert rc == 0
+        mock_dl.assert_called_once()
+
+    def test_clone_failure_falls_back_to_download(self, tmp_path):
+        """Adoption errors are non-fatal — download still proceeds."""
+        alt = tmp_path / "alt"
+        self._create_model_cache(alt, "org/model")
+        is_model_cached.cache_clear()
+        with mock.patch("sparkrun.models.download._ALTERNATE_CACHE_DIRS", (str(alt),)), \
+             mock.patch("sparkrun.models.download._clone_model_cache",
+                        side_effect=OSError("read-only fs")), \
+             mock.patch("sparkrun.models.download._snapshot_download",
+                        return_value=0) as mock_dl:
+            rc = download_model("org/model", cache_dir=str(tmp_path / "dst"))
+        assert rc == 0
+        mock_dl.assert_called_once()
@@ -73,6 +73,14 @@ DETECTED_GID_INDEX=0
     assert len(result) == 2
 
 
+def test_parse_ib_detect_output_ignores_indented_comments():
+    """Comment lines are skipped even when indented or containing '='."""
+    output = "  # note=x\nIB_DETECTED=1\n\t# tab comment\n"
+    result = parse_ib_detect_output(output)
+
+    assert result == {"IB_DETECTED": "1"}
+
+
 def test_generate_nccl_env_with_ib():
     """Full IB info produces NCCL_NET, NCCL_IB_DISABLE=0, NCCL_IB_GID_INDEX, NCCL_IB_HCA, etc."""
     ib_info = {
@@ -10,6 +10,14 @@ from sparkrun.orchestration.scripts import (
 )
 
 
+def test_read_script_is_cached():
+    """Script bodies are immutable package data — repeat reads hit the cache."""
+    from sparkrun.scripts import read_script
+
+    first = read_script("model_distribute.sh")
+    assert read_script("model_distribute.sh") is first
+
+
 def test_generate_ip_detect_script():
     """Script detects IP via ip route."""
     script = generate_ip_detect_script()
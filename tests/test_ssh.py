@@ -4,13 +4,17 @@ import subprocess
 from unittest.mock import MagicMock, patch
 
 from sparkrun.orchestration.ssh import (
+    DEFAULT_MAX_CONCURRENCY,
     build_ssh_cmd,
+    close_control_master,
+    open_control_master,
     RemoteResult,
     run_remote_script,
     run_remote_command,
     run_remote_scripts_parallel,
     run_remote_sudo_script,
     detect_sudo_on_hosts,
+    ssh_pool,
 )
 
 
@@ -48,6 +52,85 @@ def test_build_ssh_cmd_with_options():
     assert "StrictHostKeyChecking=no" in cmd
 
 
+def test_build_ssh_cmd_control_master():
+    """SSH commands include connection-multiplexing options."""
+    cmd = build_ssh_cmd("192.168.1.100")
+
+    assert "ControlMaster=auto" in cmd
+    assert "ControlPersist=600" in cmd
+
+
+@patch("sparkrun.orchestration.ssh.subprocess.run")
+def test_open_control_master_command(mock_run):
+    """Master is opened with -M -N -f (auth once, background, no command)."""
+    mock_proc = MagicMock()
+    mock_proc.returncode = 0
+    mock_proc.stderr = ""
+    mock_run.return_value = mock_proc
+
+    assert open_control_master("192.168.1.100", ssh_user="admin") is True
+
+    cmd = mock_run.call_args[0][0]
+    assert cmd[0] == "ssh"
+    assert "-M" in cmd
+    assert "-N" in cmd
+    assert "-f" in cmd
+    assert "admin@192.168.1.100" in cmd
+
+
+@patch("sparkrun.orchestration.ssh.subprocess.run")
+def test_open_control_master_failure(mock_run):
+    """Failed master open returns False (callers degrade to plain SSH)."""
+    mock_proc = MagicMock()
+    mock_proc.returncode = 255
+    mock_proc.stderr = "Connection refused"
+    mock_run.return_value = mock_proc
+
+    assert open_control_master("192.168.1.100") is False
+
+
+def test_open_control_master_dry_run():
+    """Dry run returns True without connecting."""
+    assert open_control_master("192.168.1.100", dry_run=True) is True
+
+
+@patch("sparkrun.orchestration.ssh.subprocess.run")
+def test_close_control_master_command(mock_run):
+    """Master is closed via ssh -O exit."""
+    mock_proc = MagicMock()
+    mock_proc.returncode = 0
+    mock_run.return_value = mock_proc
+
+    close_control_master("192.168.1.100")
+
+    cmd = mock_run.call_args[0][0]
+    assert "-O" in cmd
+    assert "exit" in cmd
+
+
+@patch("sparkrun.orchestration.ssh.close_control_master")
+@patch("sparkrun.orchestration.ssh.open_control_master")
+def test_ssh_pool_opens_and_closes_masters(mock_open, mock_close):
+    """Pool opens one master per host on entry and closes each on exit."""
+    mock_open.return_value = True
+
+    with ssh_pool(["host1", "host2"]):
+        assert mock_open.call_count == 2
+        mock_close.assert_not_called()
+
+    assert mock_close.call_count == 2
+    closed = {call.args[0] for call in mock_close.call_args_list}
+    assert closed == {"host1", "host2"}
+
+
+@patch("sparkrun.orchestration.ssh.open_control_master")
+def test_ssh_pool_dry_run_skips_masters(mock_open):
+    """Dry run does not open any connections."""
+    with ssh_pool(["host1"], dry_run=True):
+        pass
+    mock_open.assert_not_called()
+
+
 def test_remote_result_success():
     """RemoteResult with returncode=0 is success."""
     result = RemoteResult(host="host1", returncode=0, stdout="OK", stderr="")
@@ -205,6 +288,25 @@ def test_run_remote_scripts_parallel_mocks_subprocess(mock_run):
     assert all(r.success for r in results)
 
 
+@patch("sparkrun.orchestration.ssh.subprocess.run")
+def test_run_remote_scripts_parallel_bounded_concurrency(mock_run):
+    """max_concurrency caps the worker pool but still covers every host."""
+    mock_proc = MagicMock()
+    mock_proc.returncode = 0
+    mock_proc.stdout = "output"
+    mock_proc.stderr = ""
+    mock_run.return_value = mock_proc
+
+    hosts = [f"host{i}" for i in range(12)]
+    results = run_remote_scripts_parallel(
+        hosts, "echo test", max_concurrency=DEFAULT_MAX_CONCURRENCY,
+    )
+
+    assert len(results) == 12
+    assert {r.host for r in results} == set(hosts)
+    assert mock_run.call_count == 12
+
+
 @patch("sparkrun.orchestration.ssh.subprocess.run")
 def test_run_remote_script_timeout(mock_run):
     """Test timeout handling."""